@@ -0,0 +1,117 @@
+from pybricks.parameters import Stop
+from pybricks.tools import StopWatch
+
+from telemetry import wait
+
+
+class Attachment:
+    """An attachment motor that moves to positions and knows when it got there.
+
+    Instead of running for a guessed time, a move ends as soon as the motor
+    reached its target, or is blocked: stalled, or loaded past `load` for
+    `hold` ms. The motor then holds where it is. Angles count from the
+    mechanical stop found by `home`.
+
+    Example:
+        left_arm = Attachment(left_motor, {"down": 0, "up": 600})
+        left_arm.home()
+        left_arm.move_to("up")
+
+    Args:
+        motor (Motor): Motor driving the attachment.
+        positions (dict): Angles of named positions, in degrees.
+        speed (int): Default speed of moves, in deg/s.
+        home_speed (int): Speed toward the stop used by `home`.
+        duty_limit (int): Torque limit in percent while homing.
+        load (int): Load in mNm that ends a move, or None to wait for the
+            motor to stall.
+        hold (int): Milliseconds a block must last to end a move, so the
+            load peak of starting up is not taken for one.
+    """
+
+    def __init__(self, motor, positions=None, speed=500, home_speed=-300, duty_limit=40, load=None, hold=100):
+        self.motor = motor
+        self.positions = dict(positions or {})
+        self.speed = speed
+        self.home_speed = home_speed
+        self.duty_limit = duty_limit
+        self.load = load
+        self.hold = hold
+        self.homed = False
+        self._timer = StopWatch()
+        self._timeout = 0
+        self._pushing = False
+        self._blocked = None
+        self._active = False
+
+    def home(self, angle=0):
+        """Drive into the mechanical stop and call that `angle`."""
+        self.motor.run_until_stalled(self.home_speed, then=Stop.HOLD, duty_limit=self.duty_limit)
+        self.motor.reset_angle(angle)
+        self.homed = True
+
+    def move_to(self, position, speed=None, timeout=3000, wait=True):
+        """Move to a named position or an angle.
+
+        Args:
+            position (str or int): Name from `positions`, or an angle.
+            speed (int): Speed in deg/s, default `speed`.
+            timeout (int): Give up after this many milliseconds.
+            wait (bool): Wait until the move ended; otherwise poll `done`.
+        """
+        angle = self.positions[position] if isinstance(position, str) else position
+        self.motor.run_target(speed or self.speed, angle, then=Stop.HOLD, wait=False)
+        self._begin(timeout, False, wait)
+
+    def push(self, speed, timeout=3000, wait=True):
+        """Run until the mechanism is blocked, e.g. against its end stop.
+
+        Args:
+            speed (int): Speed in deg/s, negative to push the other way.
+            timeout (int): Give up after this many milliseconds.
+            wait (bool): Wait until the push ended; otherwise poll `done`.
+        """
+        # timed on the motor, so the push ends even if nobody polls `done`
+        self.motor.run_time(speed, timeout, then=Stop.HOLD, wait=False)
+        self._begin(timeout, True, wait)
+
+    def _begin(self, timeout, pushing, wait_for_it):
+        self._timer.reset()
+        self._timeout = timeout
+        self._pushing = pushing
+        self._blocked = None
+        self._active = True
+        if wait_for_it:
+            self.wait()
+
+    def blocked(self):
+        """Whether the motor is stalled or loaded past `load` right now."""
+        motor = self.motor
+        return motor.stalled() or self.load is not None and abs(motor.load()) >= self.load
+
+    def done(self):
+        """Whether the last move ended; holds the motor once it has."""
+        if not self._active:
+            return True
+        now = self._timer.time()
+        if not self.blocked():
+            self._blocked = None
+        elif self._blocked is None:
+            self._blocked = now
+        # a push only ends on a block, a move_to also on reaching its target
+        ended = not self._pushing and self.motor.done()
+        ended = ended or self._blocked is not None and now - self._blocked >= self.hold
+        if ended or now >= self._timeout:
+            self.motor.hold()
+            self._active = False
+        return not self._active
+
+    def stop(self):
+        """End the last move and let the motor coast."""
+        self.motor.stop()
+        self._active = False
+
+    def wait(self, period=10):
+        """Wait until the last move ended."""
+        while not self.done():
+            wait(period)
@@ -0,0 +1,69 @@
+# calibration: (battery mV, speed, acceleration, ke) factors against the
+# charge the runs were tuned at, sorted by voltage. Add a row per charge
+# level you measured: the speed and acceleration factors that make a run
+# end in the same place, and the ke factor from the deadzone that
+# python -m tools.tune_turn fits to turns logged at that charge.
+# Placeholder: nothing is measured yet, so every factor stays 1.0 until the
+# rows from the table are added.
+PROFILE = (
+    (8000, 1.0, 1.0, 1.0),
+)
+
+
+def voltage(battery, samples=5):
+    """Estimate the battery voltage in mV from a few back-to-back readings.
+
+    The hub already filters what it reports, so a handful of readings
+    without waiting in between is enough to average out the last digit.
+
+    Args:
+        battery: `hub.battery`.
+        samples (int): Readings to average.
+    """
+    total = 0
+    for _ in range(samples):
+        total += battery.voltage()
+    return total / samples
+
+
+class Compensation:
+    """Scales drive settings and the gyro turn bias to the battery charge.
+
+    The same speeds and gains behave differently on a fresh and on a
+    sagging battery. Call `update` with the voltage at the start of a run;
+    until then every factor is 1.
+
+    Args:
+        profile (tuple): Rows of (mV, speed, acceleration, ke) factors,
+            sorted by voltage. Voltages in between are interpolated, those
+            outside use the nearest row.
+    """
+
+    def __init__(self, profile=PROFILE):
+        self.profile = profile
+        self.millivolts = None
+        self.speed = self.acceleration = self.ke = 1.0
+
+    def update(self, millivolts):
+        """Look up the factors for a battery voltage."""
+        self.millivolts = millivolts
+        profile = self.profile
+        if millivolts <= profile[0][0]:
+            row = profile[0]
+        elif millivolts >= profile[-1][0]:
+            row = profile[-1]
+        else:
+            index = 1
+            while profile[index][0] < millivolts:
+                index += 1
+            low, high = profile[index - 1], profile[index]
+            share = (millivolts - low[0]) / (high[0] - low[0])
+            row = [a + (b - a) * share for a, b in zip(low, high)]
+        self.speed, self.acceleration, self.ke = row[1], row[2], row[3]
+        return self
+
+    def scale(self, settings):
+        """Scale (straight_speed, straight_acceleration, turn_rate,
+        turn_acceleration); entries that are None stay None."""
+        factors = (self.speed, self.acceleration, self.speed, self.acceleration)
+        return tuple(None if value is None else value * factor for value, factor in zip(settings, factors))
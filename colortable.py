@@ -0,0 +1,47 @@
+from pybricks.tools import wait
+
+
+class ColorTable:
+    """Classifies `hsv()` readings with one lookup in a precomputed table.
+
+    The table is built on the laptop by `python -m tools.colorlut` from
+    readings recorded with `record`, so there is no nearest-color search on
+    the hub. Readings far from every recorded color, or between two of
+    them, come out as None.
+
+    Args:
+        module: Generated module with `CLASSES`, `BINS` and `TABLE`, e.g.
+            `floor_colors`.
+    """
+
+    def __init__(self, module):
+        self.classes = module.CLASSES
+        self.table = module.TABLE
+        self.hue_bins, self.saturation_bins, self.value_bins = module.BINS
+
+    def classify(self, hsv):
+        """Return the class name of a Color reading, or None if unknown."""
+        cell = (hsv.h * self.hue_bins // 360) * self.saturation_bins + hsv.s * self.saturation_bins // 101
+        return self.classes[self.table[cell * self.value_bins + hsv.v * self.value_bins // 101]]
+
+    def reader(self, sensor):
+        """Return a function that reads and classifies `sensor`."""
+        return lambda: self.classify(sensor.hsv())
+
+
+def record(sensor, label, count=100, period=20):
+    """Print `count` readings of `sensor` for `python -m tools.colorlut`.
+
+    Hold the sensor over the color, or slowly move the robot across it, so
+    the samples cover the spread the table has to accept.
+
+    Args:
+        sensor (ColorSensor): Sensor to read.
+        label (str): Class name, without spaces.
+        count (int): Number of readings.
+        period (int): Milliseconds between readings.
+    """
+    for _ in range(count):
+        h, s, v = sensor.hsv()
+        print("HSV", label, h, s, v)
+        wait(period)
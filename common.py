@@ -0,0 +1,479 @@
+from pybricks.hubs import PrimeHub
+from pybricks.pupdevices import Motor, ColorSensor
+from pybricks.parameters import Button, Direction, Port, Stop
+from pybricks.robotics import DriveBase
+from pybricks.tools import StopWatch
+
+from attachment import Attachment
+from battery import Compensation, voltage
+import attachment_colors
+from colortable import ColorTable
+from filters import Debounce, Median, MovingAverage
+from fixedpoint import p_turn, pd_turn
+import floor_colors
+from heading import HeadingHold
+import looptime
+from odometry import Odometry
+from settle import settle_drive
+from telemetry import recording, wait, wait_done
+from triggers import Triggers
+
+# devices and drive helpers of the robot, shared by the hub programs that
+# import everything from here; the helpers missions.py calls live here too
+
+hub = PrimeHub()
+
+# CUTIE WHEELS
+left_wheel = Motor(Port.A, Direction.COUNTERCLOCKWISE)  # purple
+right_wheel = Motor(Port.E, Direction.CLOCKWISE)  # red
+
+left_motor = Motor(Port.F, gears=[20, 28])  # yellow
+right_motor = Motor(Port.D, gears=[20, 28])  # blue
+
+# moves that end at the target or a mechanical stop; named positions are
+# angles from the stop `home` drives into, measured on the robot
+left_arm = Attachment(left_motor)
+right_arm = Attachment(right_motor)
+
+sensor = ColorSensor(Port.C)  # green
+sensor2 = ColorSensor(Port.B)  # cyan
+
+
+
+class CompensatedDriveBase(DriveBase):
+    """DriveBase whose speeds and accelerations follow the battery charge.
+
+    `settings` reads back the values that were asked for, while the hub gets
+    them scaled by `compensation`, and `drive` speeds are scaled the same
+    way. So the helpers and restored defaults get compensated, not only the
+    run table rows.
+
+    Args:
+        compensation (Compensation): Factors for the current battery.
+    """
+
+    def __init__(self, compensation, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.compensation = compensation
+        self._requested = tuple(super().settings())
+
+    def settings(self, straight_speed=None, straight_acceleration=None, turn_rate=None, turn_acceleration=None):
+        """Set (unscaled) or, without arguments, return the drive settings."""
+        changes = (straight_speed, straight_acceleration, turn_rate, turn_acceleration)
+        if changes == (None, None, None, None):
+            return self._requested
+        self._requested = tuple(old if new is None else new for old, new in zip(self._requested, changes))
+        super().settings(*self.compensation.scale(self._requested))
+
+    def drive(self, speed, turn_rate):
+        factor = self.compensation.speed
+        super().drive(speed * factor, turn_rate * factor)
+
+
+# speed and turn bias factors for the battery charge, looked up at run start
+compensation = Compensation()
+
+cutie = CompensatedDriveBase(compensation, left_wheel, right_wheel, wheel_diameter=62.4, axle_track=80)
+
+# color classes by table lookup, built with python -m tools.colorlut
+floor_color = ColorTable(floor_colors).reader(sensor2)
+attachment_color = ColorTable(attachment_colors).reader(sensor)
+
+cutie.use_gyro(True)
+
+# steers onto gyro headings during timed moves
+heading_hold = HeadingHold(cutie, hub.imu)
+
+# field pose, zeroed where the run starts
+odometry = Odometry(cutie, hub.imu)
+
+
+def get_battery(samples=5):
+    """Return the battery charge in percent, from a few quick readings."""
+    return (voltage(hub.battery, samples) - 7000) / 12
+
+
+def wait_for_right_arrow():
+    """Wait until the right arrow button is pressed on the hub."""
+    while Button.RIGHT not in hub.buttons.pressed():
+        wait(100)
+
+
+def button_motor_control(speed=300):
+    """Move the right or left motor while the corresponding button is held.
+
+    RIGHT arrow runs the right motor while pressed.
+    LEFT arrow runs the left motor while pressed.
+    CENTER exits the control loop.
+    """
+    while True:
+        pressed = hub.buttons.pressed()
+
+        if Button.RIGHT in pressed:
+            right_motor.run(speed)
+        else:
+            right_motor.stop()
+
+        if Button.LEFT in pressed:
+            left_motor.run(speed)
+        else:
+            left_motor.stop()
+
+        if Button.CENTER in pressed:
+            right_motor.stop()
+            left_motor.stop()
+            break
+
+        wait(10)
+
+
+def straight_time(speed, time, heading=None):
+    """Move straight for a specified duration.
+    
+    Args:
+        speed (int): Speed at which to move (positive or negative).
+        time (int): Duration to move in milliseconds.
+        heading (float): Gyro heading to hold on the way, or None to drive
+            open-loop, e.g. to square up against a wall.
+    """
+    if heading is not None:
+        heading_hold.drive(speed, heading, time=time)
+        return
+    cutie.drive(speed, 0)
+    wait(time)
+    cutie.stop()
+
+
+def turn_time(turn_rate, time, heading=None):
+    """Turns the robot in place for a specified duration.
+
+    Args:
+        turn_rate (int): Turn rate to apply. Positive values turn right, negative values turn left.
+        time (int): Duration of the turn in milliseconds.
+        heading (float): Gyro heading to start from and track at
+            `turn_rate`, or None to turn open-loop.
+    """
+    if heading is not None:
+        heading_hold.drive(0, heading, turn_rate, time=time)
+        return
+    cutie.drive(0, turn_rate)
+    wait(time)
+    cutie.stop()
+
+
+def curve_time(time, turn_rate, heading=None):
+    """Drive in a curve for a specified duration.
+    
+    Args:
+        time (int): Duration to drive in milliseconds.
+        angle (float): Turn rate for the curve.
+        heading (float): Gyro heading to start from and track at
+            `turn_rate`, or None to drive open-loop.
+    """
+    speed = cutie.settings()[0]
+    if heading is not None:
+        heading_hold.drive(speed, heading, turn_rate, time=time)
+        return
+    cutie.drive(speed, turn_rate)
+    wait(time)
+    cutie.stop()
+
+
+def drive_heading(speed, heading, distance=None, time=None):
+    """Drive holding a gyro heading for a distance or a time.
+
+    Args:
+        speed (int): Speed in mm/s, negative to drive backward.
+        heading (float): Gyro heading to hold.
+        distance (int): Millimeters to drive.
+        time (int): Milliseconds to drive.
+    Returns:
+        float: Estimated drift to the right of the line in mm.
+    """
+    return heading_hold.drive(speed, heading, distance=distance, time=time)
+
+
+def till_black(speed, turn_rate, samples=3, expect=None, slow=100):
+    """Drive until a black line is detected on the color sensor.
+    
+    Args:
+        speed (int): Speed at which to drive.
+        turn_rate (float): Turn rate while driving.
+        samples (int): Readings the median is taken over, so a single
+            dark reading does not stop the robot (default 3).
+        expect (int): Rough distance to the line in mm. If given, approach
+            straight lines at full `speed` with `land_on_black`.
+        slow (int): Speed `land_on_black` finds the line at.
+    """
+    if expect and not turn_rate:
+        land_on_black(speed, expect, slow, samples=samples)
+        return
+    reflection = Median(samples)
+    triggers = Triggers(name="till_black")
+    triggers.sensor("reflection", sensor2.reflection)
+    # stop once the reflection is 7 or less
+    triggers.when("reflection", lambda value: reflection.update(value) <= 7, cutie.stop)
+
+    cutie.drive(speed=speed, turn_rate=turn_rate)  # start driving
+    triggers.run()
+
+
+def go_to(x, y, heading=None):
+    """Drive to a point on the field, measured from where the run started.
+
+    Args:
+        x (float): Millimeters forward of the start position.
+        y (float): Millimeters to the right of the start position.
+        heading (float): Heading to end with, or None to not turn after.
+    """
+    odometry.go_to(x, y, heading)
+
+
+def land_on_black(speed, expect, slow=100, margin=30, samples=3):
+    """Approach a black line fast and stop on it like a slow `till_black`.
+
+    Drives at `speed` and brakes early enough to be down to `slow` `margin`
+    mm before where the line is expected, so the line is found at the slow
+    speed and the robot stops as close to it. A line that comes early
+    still stops the robot.
+
+    Args:
+        speed (int): Approach speed, negative to back onto the line.
+        expect (int): Rough distance to the line in mm.
+        slow (int): Speed when reaching the line.
+        margin (int): Millimeters before the expected line to be slow by.
+        samples (int): Readings the median is taken over, see `till_black`.
+    """
+    slow = slow if speed > 0 else -slow
+    acceleration = cutie.settings()[1]
+    brake_at = abs(expect) - margin - (speed * speed - slow * slow) / (2 * acceleration)
+    start = cutie.distance()
+    reflection = Median(samples)
+
+    triggers = Triggers(name="land_on_black")
+    triggers.sensor("reflection", sensor2.reflection)
+    triggers.sensor("distance", lambda: abs(cutie.distance() - start))
+    triggers.when("reflection", lambda value: reflection.update(value) <= 7, cutie.stop)
+    triggers.when("distance", lambda value: value >= brake_at, lambda: cutie.drive(slow, 0), stop=False)
+
+    cutie.drive(speed if brake_at > 0 else slow, 0)
+    triggers.run()
+
+
+def till_blue(speed, turn_rate, samples=2):
+    """Drive until the blue block on the ramp is detected on the color sensor.
+    
+    Args:
+        speed (int): Speed at which to drive.
+        turn_rate (float): Turn rate while driving.
+        samples (int): Blue readings in a row needed to stop (default 2).
+    """
+    blue = Debounce(samples)
+    triggers = Triggers(name="till_blue")
+    triggers.sensor("color", floor_color)
+    triggers.when("color", lambda value: blue.update(value == "blue"), cutie.stop)
+
+    cutie.drive(speed=speed, turn_rate=turn_rate)  # start driving
+    triggers.run()
+
+def wait_for_stable_roll(window_size=10, poll_ms=10, tolerance=1):
+    """Poll the robot till continuously and average the last
+    `window_size` readings. When the average of the
+    window is within the tolerance, return the averaged value.
+
+    Args:
+        window_size (int): number of readings to keep (default 10).
+        poll_ms (int): milliseconds to wait between polls (default 10).
+        tol (float): tolerance threshold for average (default 1).
+    Returns:
+        float: the average of the last `window_size` readings when stopped.
+    """
+    roll = MovingAverage(window_size)
+    probe = looptime.probe("wait_for_stable_roll")
+    while True:
+        if probe:
+            probe.tick()
+            probe.read()
+        tilt = hub.imu.tilt()
+        if probe:
+            probe.done()
+        avg = roll.update(tilt[1])
+
+        if roll.full():
+            # print("tilt_avg:", avg)
+            if -tolerance <= avg <= tolerance:
+                return avg
+
+        wait(poll_ms)
+
+def going_down(speed, turn_rate):
+    """Drive to the yellow line and wait for the robot to stabilize.
+    
+    Drives until the yellow line is detected, then continues driving while
+    waiting for the roll (tilt) to stabilize before continuing.
+    
+    Args:
+        speed (int): Speed at which to drive.
+        turn_rate (float): Turn rate while driving.
+    """
+    till_blue(speed, turn_rate)
+
+    cutie.drive(speed, turn_rate)
+    wait_for_stable_roll()
+    cutie.stop()
+
+
+def gyro_turn(
+    target,
+    max_rate=150,
+    kp=2.1,
+    kd=0.6,
+    ke=16,
+    angle_tol=0.3,
+    speed_tol=30,
+    max_time=2670,
+    fixed=False,
+    period=10,
+):
+    """Turn the robot to a target heading using gyro-based PD control.
+    
+    Uses the IMU gyroscope and PD (proportional-derivative) control with a static
+    bias to overcome motor friction and achieve precise heading control.
+    
+    Args:
+        target (float): Target heading in degrees.
+        max_rate (int): Maximum turn rate in degrees/second (default 150).
+        kp (float): Proportional gain constant.
+        kd (float): Derivative gain constant.
+        ke (int): Static bias constant to overcome motor friction.
+        angle_tol (float): Angle tolerance threshold in degrees (default 0.3).
+        speed_tol (int): Turn rate tolerance threshold (default 30).
+        max_time (int): Maximum time to attempt turn in milliseconds (default 2670).
+        fixed (bool): Run the loop in integer math, see `fixedpoint.pd_turn`.
+        period (int): Milliseconds between loop iterations (default 10).
+    Returns:
+        tuple: (loop iterations, ms the loop ran), to work out its period.
+    """
+
+    ke *= compensation.ke
+    if fixed:
+        result = pd_turn(cutie, hub.imu, target, max_rate, kp, kd, ke, angle_tol, speed_tol, max_time, period)
+        settle_drive(cutie, 200, hub.imu)
+        return result
+    loops = 0
+    last_error = 0
+    timer = StopWatch()
+    timer.reset()
+
+    last_time = timer.time()
+
+    probe = looptime.probe("gyro_turn")
+    while timer.time() < max_time:
+        loops += 1
+        if probe:
+            probe.tick()
+            probe.read()
+        current = hub.imu.heading()
+        if probe:
+            probe.done()
+
+        # Shortest angle wraparound
+        error = ((target - current + 180) % 360) - 180
+
+        # Real dt
+        now = timer.time()
+        dt = (now - last_time) / 1000.0  # convert ms to seconds
+        last_time = now
+
+        if dt == 0:
+            dt = 0.001  # avoid division by zero
+
+        # PD control
+        d_error = (error - last_error) / dt
+        turn_rate = kp * error + kd * d_error
+        # Add static bias to overcome motor deadzone
+        turn_rate += ke if turn_rate > 0 else -ke
+
+        # Clamp turn rate
+        turn_rate = max(-max_rate, min(max_rate, turn_rate))
+        cutie.drive(0, turn_rate)
+
+        # Exit condition: close enough and slow enough
+        if abs(error) < angle_tol and abs(turn_rate) < speed_tol:
+            break
+
+        last_error = error
+        wait(period)  # smaller wait for faster updates
+    loop_time = timer.time()
+    cutie.stop()
+    settle_drive(cutie, 200, hub.imu)
+    return loops, loop_time
+
+
+def turn_to(angle, then=Stop.HOLD):
+    """Turn the robot to a specific absolute angle.
+    
+    Uses PyBricks' built-in turn function to rotate to the target angle.
+    
+    Args:
+        angle (float): Target absolute angle in degrees.
+        then (Stop): Stop behavior after turning (default Stop.HOLD).
+    """
+    start_angle = (hub.imu.heading() + 360) % 360  # cal
+    deg_to_turn = (angle - start_angle) % 360  # calculate how much need to turn
+    if deg_to_turn >= 180:
+        deg_to_turn -= 360
+    # a blocking turn would leave a gap in the recording
+    cutie.turn(deg_to_turn, wait=not recording())
+    wait_done(cutie)
+
+
+def gyro_abs(target_angle, kp=1.5, ke=20, fixed=False, period=10):
+    """Turn to an absolute angle using gyro-based proportional control.
+    
+    Args:
+        target_angle (float): Target absolute angle in degrees.
+        kp (float): Proportional gain constant (default 1.5).
+        ke (int): Static bias to overcome motor friction (default 20).
+        fixed (bool): Run the loop in integer math, see `fixedpoint.p_turn`.
+        period (int): Milliseconds between loop iterations (default 10).
+    Returns:
+        tuple: (loop iterations, ms the loop ran).
+    """
+    ke *= compensation.ke
+    if fixed:
+        result = p_turn(cutie, hub.imu, target_angle, kp, ke, period)
+        settle_drive(cutie, 200, hub.imu)
+        return result
+
+    timer = StopWatch()
+    loops = 0
+    probe = looptime.probe("gyro_abs")
+    while True:
+        loops += 1
+        if probe:
+            probe.tick()
+            probe.read()
+        current = hub.imu.heading()
+        if probe:
+            probe.done()
+        error = (
+            (target_angle - current + 180) % 360
+        ) - 180  # calculate error
+
+        turn_rate = error * kp  # calculate turning speed
+
+        if turn_rate > 0:
+            turn_rate += ke  # apply ks(kavua stati)
+        else:
+            turn_rate -= ke  # apply ks(kavua stati)
+
+        if abs(error) < 0.3:  # when reached reasonable error, exit loop
+            break
+
+        cutie.drive(0, turn_rate=turn_rate)  # apply speed
+        wait(period)
+    loop_time = timer.time()
+    cutie.stop()  # stop
+    settle_drive(cutie, 200, hub.imu)  # wait till it stopped moving
+    return loops, loop_time
@@ -0,0 +1,135 @@
+from array import array
+
+
+def _zeros(size):
+    return array("f", (0 for _ in range(size)))
+
+
+class MovingAverage:
+    """Mean of the last `size` values, updated in constant time.
+
+    Keeps a running sum over a preallocated circular buffer, so an update
+    neither allocates storage nor walks the window.
+
+    Args:
+        size (int): Number of values averaged.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.values = _zeros(size)
+        self.reset()
+
+    def reset(self):
+        self.index = 0
+        self.count = 0
+        self.total = 0.0
+
+    def update(self, value):
+        """Add a value and return the mean of the window so far."""
+        values = self.values
+        self.total += value - values[self.index]
+        values[self.index] = value
+        self.index += 1
+        if self.index == self.size:
+            self.index = 0
+            # start each lap from an exact sum so rounding cannot creep in
+            self.total = sum(values)
+        if self.count < self.size:
+            self.count += 1
+        return self.total / self.count
+
+    def full(self):
+        return self.count == self.size
+
+
+class EMA:
+    """Exponential moving average.
+
+    Args:
+        alpha (float): Weight of each new value, between 0 and 1.
+    """
+
+    def __init__(self, alpha):
+        self.alpha = alpha
+        self.value = None
+
+    def reset(self):
+        self.value = None
+
+    def update(self, value):
+        """Add a value and return the new average."""
+        if self.value is None:
+            self.value = value
+        else:
+            self.value += self.alpha * (value - self.value)
+        return self.value
+
+
+class Median:
+    """Median of the last `size` values, to drop single bad readings.
+
+    The window and a sorted copy of it are preallocated; an update moves
+    at most `size` entries, which is cheap for the small odd sizes used
+    to debounce sensors.
+
+    Args:
+        size (int): Number of values, odd so the median is one of them.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.window = _zeros(size)
+        self.ordered = _zeros(size)
+        self.reset()
+
+    def reset(self):
+        self.index = 0
+        self.count = 0
+
+    def update(self, value):
+        """Add a value and return the median of the window so far."""
+        ordered = self.ordered
+        n = self.count
+        if n == self.size:
+            # take the oldest value out of the sorted copy
+            old = self.window[self.index]
+            i = 0
+            while ordered[i] != old:
+                i += 1
+            while i < n - 1:
+                ordered[i] = ordered[i + 1]
+                i += 1
+            n -= 1
+        i = n
+        while i > 0 and ordered[i - 1] > value:
+            ordered[i] = ordered[i - 1]
+            i -= 1
+        ordered[i] = value
+        self.count = n + 1
+
+        self.window[self.index] = value
+        self.index += 1
+        if self.index == self.size:
+            self.index = 0
+        return ordered[self.count // 2]
+
+
+class Debounce:
+    """Report a condition only once it held for `count` samples in a row.
+
+    Args:
+        count (int): Consecutive true samples needed.
+    """
+
+    def __init__(self, count):
+        self.count = count
+        self.run = 0
+
+    def reset(self):
+        self.run = 0
+
+    def update(self, state):
+        """Add a sample and return whether the condition is settled."""
+        self.run = self.run + 1 if state else 0
+        return self.run >= self.count
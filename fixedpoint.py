@@ -0,0 +1,107 @@
+from pybricks.tools import StopWatch
+
+import looptime
+from telemetry import wait
+
+# fractional bits of the fixed-point values: 256 units per degree
+SHIFT = 8
+ONE = 1 << SHIFT
+HALF_TURN = 180 * ONE
+FULL_TURN = 360 * ONE
+# bound on the derivative, deg/s in fixed point, so products stay small ints
+D_LIMIT = 4000 * ONE
+
+
+def _fixed(value):
+    return int(value * ONE)
+
+
+def _rate(raw, bias):
+    """Turn rate in deg/s from a raw rate in 1/65536 deg/s, pushed away
+    from zero by `bias` like the float loops add `ke`."""
+    if raw > 0:
+        return (raw + bias) >> (2 * SHIFT)
+    return -((bias - raw) >> (2 * SHIFT))
+
+
+def pd_turn(drive_base, imu, target, max_rate, kp, kd, ke, angle_tol, speed_tol, max_time, period):
+    """The PD loop of `gyro_turn` in integer arithmetic.
+
+    Angles are kept in 1/256 degree. Apart from reading the gyro, an
+    iteration only does small-int math, which MicroPython does without
+    allocating, so no garbage collection interrupts the turn and `period`
+    can be as short as 2 ms. Arguments are those of `gyro_turn`.
+
+    Returns:
+        tuple: (iterations, ms the loop ran).
+    """
+    target = _fixed(target)
+    kp, kd, ke = _fixed(kp), _fixed(kd), _fixed(ke) << SHIFT
+    angle_tol = _fixed(angle_tol)
+    timer = StopWatch()
+    last_error = 0
+    last_time = 0
+    d_error = 0
+    loops = 0
+    probe = looptime.probe("gyro_turn.fixed")
+
+    while True:
+        now = timer.time()
+        if now >= max_time:
+            break
+        loops += 1
+        if probe:
+            probe.tick()
+            probe.read()
+        heading = imu.heading()
+        if probe:
+            probe.done()
+        error = (target - int(heading * ONE) + HALF_TURN) % FULL_TURN - HALF_TURN
+
+        # keep the last slope when the clock did not move
+        if now > last_time:
+            d_error = max(-D_LIMIT, min(D_LIMIT, (error - last_error) * 1000 // (now - last_time)))
+        last_time = now
+
+        turn_rate = _rate(kp * error + kd * d_error, ke)
+        turn_rate = max(-max_rate, min(max_rate, turn_rate))
+        drive_base.drive(0, turn_rate)
+
+        if -angle_tol < error < angle_tol and -speed_tol < turn_rate < speed_tol:
+            break
+
+        last_error = error
+        wait(period)
+    drive_base.stop()
+    return loops, timer.time()
+
+
+def p_turn(drive_base, imu, target, kp, ke, period):
+    """The P loop of `gyro_abs` in integer arithmetic, see `pd_turn`.
+
+    Returns:
+        tuple: (iterations, ms the loop ran).
+    """
+    target = _fixed(target)
+    kp, ke = _fixed(kp), _fixed(ke) << SHIFT
+    tolerance = _fixed(0.3)
+    timer = StopWatch()
+    loops = 0
+    probe = looptime.probe("gyro_abs.fixed")
+
+    while True:
+        loops += 1
+        if probe:
+            probe.tick()
+            probe.read()
+        heading = imu.heading()
+        if probe:
+            probe.done()
+        error = (target - int(heading * ONE) + HALF_TURN) % FULL_TURN - HALF_TURN
+        if -tolerance < error < tolerance:
+            break
+        turn_rate = _rate(kp * error, ke)
+        drive_base.drive(0, turn_rate)
+        wait(period)
+    drive_base.stop()
+    return loops, timer.time()
@@ -0,0 +1,93 @@
+from umath import radians, sin
+
+from pybricks.tools import StopWatch
+
+from telemetry import wait
+
+
+def _wrap(angle):
+    """Shortest equivalent of `angle`, between -180 and 180 degrees."""
+    return (angle + 180) % 360 - 180
+
+
+class HeadingHold:
+    """Drives while steering onto a gyro heading, for moves without a
+    distance target like driving for a time or until a sensor sees a line.
+
+    A PD loop on `imu.heading()` adds a correction to the commanded turn
+    rate every `period` ms. The heading to hold can move at `turn_rate`, so
+    the same loop holds a curve. While driving, the sideways drift from
+    the intended path is estimated from the heading error and the distance
+    driven; `lateral` keeps it after the move.
+
+    Args:
+        drive_base (DriveBase): Drive base to steer.
+        imu (IMU): Gyro of the hub.
+        kp (float): Turn rate in deg/s per degree of heading error.
+        kd (float): Turn rate per deg/s the error changes at.
+        max_rate (int): Largest correction in deg/s.
+        period (int): Milliseconds between corrections.
+    """
+
+    def __init__(self, drive_base, imu, kp=4, kd=0.05, max_rate=150, period=5):
+        self.drive_base = drive_base
+        self.imu = imu
+        self.kp = kp
+        self.kd = kd
+        self.max_rate = max_rate
+        self.period = period
+        self.lateral = 0.0
+
+    def drive(self, speed, heading=None, turn_rate=0, time=None, distance=None, until=None):
+        """Drive holding a heading until the first condition given is met.
+
+        Args:
+            speed (int): Speed in mm/s, negative to drive backward.
+            heading (float): Heading to hold, or to start the curve from;
+                defaults to the current one.
+            turn_rate (float): Rate in deg/s the heading to hold turns at.
+            time (int): Stop after this many milliseconds.
+            distance (int): Stop after driving this many mm either way.
+            until (callable): Stop once it returns True.
+        Returns:
+            float: Estimated drift to the right of the path in mm, negative
+            for the left.
+        """
+        if time is None and distance is None and until is None:
+            raise ValueError("drive needs a time, distance or until condition")
+        drive_base = self.drive_base
+        imu = self.imu
+        start = imu.heading() if heading is None else heading
+        timer = StopWatch()
+        driven = drive_base.distance()
+        origin = driven
+        last_error = None
+        last_time = 0
+        self.lateral = 0.0
+
+        while True:
+            now = timer.time()
+            error = _wrap(start + turn_rate * now / 1000 - imu.heading())
+            travel = drive_base.distance()
+            # moving at an angle to the path shifts the robot sideways
+            self.lateral += (travel - driven) * sin(radians(-error))
+            driven = travel
+
+            if time is not None and now >= time:
+                break
+            if distance is not None and abs(travel - origin) >= abs(distance):
+                break
+            if until is not None and until():
+                break
+
+            correction = self.kp * error
+            if last_error is not None and now > last_time:
+                correction += self.kd * (error - last_error) * 1000 / (now - last_time)
+            last_error = error
+            last_time = now
+            correction = max(-self.max_rate, min(self.max_rate, correction))
+            drive_base.drive(speed, turn_rate + correction)
+            wait(self.period)
+
+        drive_base.stop()
+        return self.lateral
@@ -0,0 +1,69 @@
+from pybricks.tools import hub_menu
+
+from filters import Debounce
+from triggers import Triggers
+
+
+class Launcher:
+    """Opens the run menu on the run whose attachment is on the robot.
+
+    The attachment color is read until the same run color showed up
+    `samples` times in a row, for at most `timeout` ms, so a dim table
+    cannot hold up the start. Without a match the menu opens on the run
+    after the one started last. The menu for every run is built up front,
+    and the center button starts the run as soon as it is pressed.
+
+    Args:
+        read (callable): Reads the color of the attachment, e.g. a
+            `ColorTable.reader` of the sensor facing it.
+        runs (tuple): (color, menu entry) pairs in the order of the match,
+            colors as `read` returns them.
+        extra (tuple): Entries after the runs, e.g. for tools.
+        samples (int): Matching readings in a row needed.
+        timeout (int): Milliseconds to look for a run color.
+        period (int): Milliseconds between readings.
+    """
+
+    def __init__(self, read, runs, extra=(), samples=3, timeout=500, period=10):
+        self.timeout = timeout
+        self.colors = {color: entry for color, entry in runs}
+        entries = tuple(entry for _, entry in runs)
+        self.entries = entries
+        self.menus = {}
+        for index, entry in enumerate(entries):
+            self.menus[entry] = entries[index:] + entries[:index] + tuple(extra)
+        self.last = None
+
+        self._candidate = None
+        self._stable = Debounce(samples)
+        self._triggers = Triggers(period)
+        self._triggers.sensor("color", read)
+        self._triggers.when("color", self._settled)
+
+    def _settled(self, color):
+        if color != self._candidate:
+            self._candidate = color
+            self._stable.reset()
+        return self._stable.update(color in self.colors)
+
+    def attachment(self):
+        """Return the menu entry of the attachment in front of the sensor,
+        or None if no run color settled in time."""
+        self._candidate = None
+        self._stable.reset()
+        color = self._triggers.run(self.timeout)
+        return None if color is None else self.colors[color]
+
+    def expected(self):
+        """The run to offer first: the attachment's, else the next one."""
+        entry = self.attachment()
+        if entry is not None:
+            return entry
+        if self.last in self.entries:
+            return self.entries[(self.entries.index(self.last) + 1) % len(self.entries)]
+        return self.entries[0]
+
+    def select(self):
+        """Show the menu starting at the expected run and return the choice."""
+        self.last = hub_menu(*self.menus[self.expected()])
+        return self.last
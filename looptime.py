@@ -0,0 +1,135 @@
+from array import array
+
+from pybricks.tools import StopWatch
+
+try:
+    from gc import mem_free
+except ImportError:  # the simulator runs on CPython, which has no heap counter
+    mem_free = None
+
+# upper edges of the histogram bins in ms; the last bin holds the rest
+EDGES = (1, 2, 3, 4, 5, 6, 8, 10, 12, 15, 20, 30, 50)
+
+# {loop name: Probe} while timing is on, see `start`
+_probes = None
+_clock = StopWatch()
+
+
+def _bin(ms):
+    for index, edge in enumerate(EDGES):
+        if ms < edge:
+            return index
+    return len(EDGES)
+
+
+def _histogram():
+    return array("H", (0 for _ in range(len(EDGES) + 1)))
+
+
+class Probe:
+    """Iteration period, sensor read time and heap use of one control loop.
+
+    Everything goes into fixed histograms and counters, so a probe does not
+    grow the heap however long the loop runs. Get one from `probe`.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.periods = _histogram()
+        self.reads = _histogram()
+        self.iterations = 0
+        self.total = 0
+        self.squares = 0
+        self.worst = 0
+        self.collections = 0
+        self.allocated = 0
+        self.last = None
+        self.free = None
+        self.read_at = 0
+
+    def begin(self):
+        """Start a new run of the loop; the gap before it is not a period."""
+        self.last = None
+        self.free = mem_free() if mem_free else None
+
+    def tick(self):
+        """Call at the top of every iteration."""
+        now = _clock.time()
+        if self.last is not None:
+            period = now - self.last
+            self.periods[_bin(period)] += 1
+            self.total += period
+            self.squares += period * period
+            if period > self.worst:
+                self.worst = period
+        self.last = now
+        self.iterations += 1
+        if mem_free:
+            free = mem_free()
+            # more free memory than before means a collection ran
+            if free > self.free:
+                self.collections += 1
+            else:
+                self.allocated += self.free - free
+            self.free = free
+
+    def read(self):
+        """Call right before the loop reads its sensor."""
+        self.read_at = _clock.time()
+
+    def done(self):
+        """Call right after the sensor read returned."""
+        self.reads[_bin(_clock.time() - self.read_at)] += 1
+
+    def report(self):
+        periods = sum(self.periods)
+        mean = self.total / periods if periods else 0
+        jitter = max(0, self.squares / periods - mean * mean) ** 0.5 if periods else 0
+        print(
+            "LOOP {} iterations={} mean={:.1f} jitter={:.1f} worst={} gc={} alloc={}".format(
+                self.name,
+                self.iterations,
+                mean,
+                jitter,
+                self.worst,
+                self.collections if mem_free else "-",
+                self.allocated // max(1, self.iterations) if mem_free else "-",
+            )
+        )
+        print("LOOP {} period {}".format(self.name, " ".join(str(count) for count in self.periods)))
+        print("LOOP {} read {}".format(self.name, " ".join(str(count) for count in self.reads)))
+
+
+def start():
+    """Time the instrumented loops from now on, until `report`."""
+    global _probes  # pylint: disable=global-statement
+    _probes = {}
+    _clock.reset()
+
+
+def probe(name):
+    """Return the probe of loop `name`, ready for a new run of the loop,
+    or None while timing is off, so loops only pay for an `if`."""
+    if _probes is None:
+        return None
+    loop = _probes.get(name)
+    if loop is None:
+        loop = _probes[name] = Probe(name)
+    loop.begin()
+    return loop
+
+
+def report(label="run"):
+    """Stop timing and print a summary and histograms of every loop.
+
+    Periods and read times are in ms; the histogram counts are per bin of
+    EDGES, "alloc" is heap bytes per iteration.
+    """
+    global _probes  # pylint: disable=global-statement
+    if _probes is None:
+        return
+    print("LOOP BEGIN {} edges={}".format(label, ",".join(str(edge) for edge in EDGES)))
+    for loop in _probes.values():
+        loop.report()
+    print("LOOP END {}".format(label))
+    _probes = None
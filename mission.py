@@ -0,0 +1,127 @@
+from pybricks.parameters import Stop
+from pybricks.tools import StopWatch
+
+from telemetry import wait
+
+
+class Task:
+    """A named part of a run that starts once the tasks it comes after are done.
+
+    Args:
+        name (str): Name other tasks use in their `after`.
+        action (generator): Steps to run, e.g. `straight(cutie, 300)` or
+            `sequence(...)` of several of them.
+        after (str or tuple): Names of the tasks that must finish first.
+        join (bool): If False, `run_tasks` does not wait for this task to
+            finish; a motor it started keeps running after the tasks return.
+    """
+
+    def __init__(self, name, action, after=(), join=True):
+        self.name = name
+        self.action = action
+        self.after = (after,) if isinstance(after, str) else tuple(after)
+        self.join = join
+
+
+def run_tasks(tasks, period=5, tick=None):
+    """Run tasks side by side, each as soon as everything it comes after is done.
+
+    Tasks are cooperative: each one runs until its next `yield`, so motions
+    should be started without waiting (see `straight`, `run_time`, ...).
+    A blocking helper wrapped in `call` holds up the others until it
+    returns, but motors they already started keep moving on their own.
+
+    Args:
+        tasks (list): Task objects, in any order.
+        period (int): Milliseconds between polls of the running tasks.
+        tick (callable): Called after every poll, e.g. to track the pose.
+    """
+    names = [task.name for task in tasks]
+    for task in tasks:
+        for name in task.after:
+            if name not in names:
+                raise ValueError("task {} comes after unknown task {}".format(task.name, name))
+
+    pending = list(tasks)
+    running = []
+    finished = set()
+    while any(task.join for task in pending) or any(task.join for task, _ in running):
+        for task in pending[:]:
+            if all(name in finished for name in task.after):
+                pending.remove(task)
+                running.append((task, task.action))
+
+        if not running:
+            raise ValueError("tasks wait on each other: {}".format([task.name for task in pending]))
+
+        progress = False
+        for item in running[:]:
+            task, action = item
+            try:
+                next(action)
+            except StopIteration:
+                running.remove(item)
+                finished.add(task.name)
+                progress = True
+        if tick:
+            tick()
+
+        # start whatever was waiting on a finished task right away
+        if not progress:
+            wait(period)
+
+
+def sequence(*actions):
+    """Run actions one after another inside a single task."""
+    for action in actions:
+        yield from action
+
+
+def sleep(time):
+    """Pause the task for `time` milliseconds without blocking the others."""
+    timer = StopWatch()
+    while timer.time() < time:
+        yield
+
+
+def until_done(device):
+    """Yield until a drive base or motor finishes its current maneuver."""
+    while not device.done():
+        yield
+
+
+def call(function, *args, **kwargs):
+    """Run a blocking helper such as `gyro_turn` as a task step."""
+    # let tasks started in the same poll get going before this blocks them
+    yield
+    function(*args, **kwargs)
+
+
+def straight(drivebase, distance, then=Stop.HOLD):
+    drivebase.straight(distance, then, wait=False)
+    yield from until_done(drivebase)
+
+
+def turn(drivebase, angle, then=Stop.HOLD):
+    drivebase.turn(angle, then, wait=False)
+    yield from until_done(drivebase)
+
+
+def curve(drivebase, radius, angle, then=Stop.HOLD):
+    drivebase.curve(radius, angle, then, wait=False)
+    yield from until_done(drivebase)
+
+
+def run_time(motor, speed, time, then=Stop.HOLD):
+    motor.run_time(speed, time, then, wait=False)
+    yield from until_done(motor)
+
+
+def run_angle(motor, speed, rotation_angle, then=Stop.HOLD):
+    motor.run_angle(speed, rotation_angle, then, wait=False)
+    yield from until_done(motor)
+
+
+def run_target(motor, speed, target_angle, then=Stop.HOLD):
+    motor.run_target(speed, target_angle, then, wait=False)
+    yield from until_done(motor)
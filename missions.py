@@ -0,0 +1,158 @@
+# Runs as data. Each step is (op, args, settings, then):
+#   op        a drive base call ("straight", "turn", "curve"), a motor call
+#             ("run_time", "run_angle", "run_until_stalled") whose first
+#             argument names the motor, a helper from common.py such as
+#             "gyro_turn", or "wait", "join", "reset_heading", "use_gyro".
+#             "home", "move_to" and "push" drive an attachment, see
+#             attachment.py: ("push", ("left_arm", speed, timeout)) runs until
+#             the mechanism is blocked instead of for a fixed time.
+#             ("settle", (device, timeout)) waits until "cutie" or a motor
+#             has stopped moving, but at most timeout ms.
+#             "settings" only changes cutie.settings for the steps after it.
+#   args      positional arguments; a dict at the end holds keyword ones.
+#   settings  cutie.settings keywords applied before the step, or None.
+#   then      Stop mode name ("HOLD", "BRAKE", "COAST", "NONE"), or "BG" to
+#             start the step and carry on with the next one right away.
+#             "join" waits for every "BG" step since the last join.
+#             A straight or curve without a then-mode rolls on ("NONE") into
+#             a next move that drives the same way at least as fast; give
+#             "HOLD" to make it stop there anyway.
+# Trailing settings and then can be left out.
+#
+# The hub does not read this file. After editing it, regenerate the table
+# the hub runs with:  python -m tools.stepc
+
+RUN1 = [
+    # MERKAVA!!!!!
+    ("straight", (1300,), {"straight_speed": 1000}, "NONE"),  # go straight
+    ("straight_time", (1000, 4000)),
+    ("use_gyro", (True,), {"straight_speed": 150, "turn_rate": 40}),
+
+    # GOING DOWN
+    ("going_down", (-100, 0), {"straight_speed": 600}),
+    ("gyro_turn", (0,)),
+    ("straight", (-50,), {"straight_speed": 200}, "NONE"),
+    ("curve", (-450, -30), {"straight_speed": 300}),
+    ("gyro_turn", (-4,)),
+    ("run_time", ("left_motor", -300, 6000), None, "BG"),
+    ("straight", (-500,), {"straight_speed": 400, "straight_acceleration": 400}),
+    ("use_gyro", (False,), {"turn_acceleration": 200}),
+    ("turn_to", (90,), {"straight_speed": 200, "turn_rate": 400}),
+    ("straight_time", (-250, 2000), {"straight_acceleration": 750}),  # hit wall
+    ("run_time", ("right_motor", -300, 3000), None, "BG"),
+    ("reset_heading", (90,)),
+
+    ("straight", (35,), {"turn_rate": 70, "straight_speed": 80}),
+    ("gyro_turn", (0,)),
+    ("use_gyro", (True,)),
+    ("till_black", (100, 0)),
+    ("straight", (-10,)),
+    ("run_time", ("right_motor", 300, 2000)),
+    ("run_time", ("right_motor", -300, 2000)),
+    ("run_angle", ("left_motor", 1500, 600)),  # lift item
+    ("gyro_turn", (-3,)),
+
+    ("straight", (-150,), {"turn_rate": 70, "straight_speed": 150}),
+    ("gyro_turn", (90,), {"straight_speed": 400, "turn_rate": 200}),
+    ("straight", (210,)),
+    ("gyro_turn", (45,)),
+    ("straight", (20,)),
+    ("run_time", ("right_motor", 300, 2000), None, "BG"),
+    ("push", ("left_arm", 1500, 5000)),  # until the lift is at its stop
+    ("reset_heading", (45,)),
+    ("straight", (-170,), {"straight_speed": 150}),
+    ("straight", (70,)),
+    ("turn", (10,)),
+    ("straight", (130,), {"straight_speed": 100}),
+    ("settings", (), {"turn_rate": 375}),
+    ("settings", (), {"turn_rate": 1000, "turn_acceleration": 1000}),
+    ("straight", (-50,)),
+    ("turn_time", (-1000, 1500)),
+    ("turn", (95,)),
+    ("gyro_turn", (100,)),
+    ("curve", (700, 60), {"straight_speed": 1000, "turn_rate": 1000}, "NONE"),
+    ("straight", (600,)),
+    # yiftach was here, dont tell anyone
+]
+
+RUN2 = [
+    ("curve_time", (1400, 20), {"straight_speed": 460}),  # go into wall and into boat
+    ("run_time", ("right_motor", -1000, 1000)),  # drop flag
+    ("curve", (-6000, 5), {"straight_speed": 400}),
+    ("use_gyro", (True,)),
+    ("curve", (500, -25), None, "NONE"),
+    ("straight", (400,)),
+    ("gyro_turn", (0,)),
+    ("straight", (250,)),
+    ("till_black", (-400, 0, {"expect": 165, "slow": 150})),  # go to black line
+    ("gyro_turn", (0,)),
+    ("straight", (45,)),
+    ("run_time", ("right_motor", 1200, 6000), None, "BG"),
+    ("wait", (1500,)),
+    ("straight_time", (20, 1500)),
+    ("wait", (2000,)),
+    ("till_black", (-100, 0)),
+    ("straight", (20,)),
+    ("run_time", ("right_motor", -1000, 7000), None, "BG"),
+    ("turn", (20,)),
+    ("wait", (1000,)),
+    ("gyro_turn", (-4,)),
+    ("straight", (140,), {"straight_speed": 100}),  # latch onto tray
+    ("straight", (-130,)),  # latch onto tray
+    ("turn", (45,), {"turn_rate": 50}),  # remove tray
+    ("turn_to", (30,)),
+    ("straight", (60,), {"turn_rate": 100}, "NONE"),
+    ("curve", (60, -45), None, "NONE"),
+    ("gyro_turn", (0, {"ke": 15})),
+    ("gyro_turn", (0,)),
+
+    ("straight", (560,), {"straight_speed": 700, "straight_acceleration": 500}),
+    ("gyro_turn", (52,)),
+    # lower the arm while reversing instead of after
+    ("run_time", ("right_motor", 1000, 3000), None, "BG"),
+    ("push", ("left_arm", -500, 6000), None, "BG"),  # lower arm to lift stall
+    ("straight_time", (-180, 2500), {"straight_acceleration": 750}),  # reverse into market stall
+    ("wait", (500,)),  # rest of the 3 s the arm takes to come down
+    ("turn", (-25,), {"straight_speed": 200}),
+    ("gyro_turn", (45,)),
+    ("wait", (500,)),
+    ("straight", (300,)),  # lift market stall
+    ("push", ("left_arm", 500, 5500), None, "BG"),
+    ("straight", (-130,)),
+    ("settle", ("left_motor", 3000)),  # arm lifted
+    # retract arm
+    ("run_time", ("right_motor", -1000, 3000), None, "BG"),
+    ("straight", (1000,), {"straight_speed": 1000}),  # return home
+]
+
+RUN3 = [
+    ("use_gyro", (True,)),
+    ("straight", (300,), {"straight_speed": 1000}, "NONE"),  # go straight
+    ("straight", (440,), {"straight_speed": 300, "straight_acceleration": 900}, "NONE"),
+    ("till_black", (100, 0)),  # until black
+    ("gyro_abs", (45, {"ke": 5, "kp": 2})),  # turn to degree 45
+    ("straight", (250,), {"straight_speed": 200, "straight_acceleration": 750, "turn_rate": 250}),  # go into statue
+    ("straight", (-25,)),  # back up
+    ("run_angle", ("right_motor", -400, 125), None, "BG"),  # statue
+    ("settle", ("right_motor", 1000)),
+    ("turn", (-20,)),
+    ("turn", (40,)),
+    ("gyro_abs", (45,)),
+    ("push", ("left_arm", 90, 1500)),  # forum, mechanical stop
+    ("turn", (-25,)),
+    ("straight", (-300,)),  # gets out
+]
+
+RUN4 = [
+    ("run_until_stalled", ("left_motor", -1100), {"straight_speed": 800, "straight_acceleration": 450}),
+    ("straight", (700,)),
+    ("straight", (-340,)),
+    ("straight", (150,)),
+    ("push", ("left_arm", 200, 5000), None, "BG"),
+    ("settle", ("left_motor", 1500)),
+    ("straight", (-400,), None, "NONE"),
+    ("curve", (-200, -60), None, "NONE"),
+    ("straight", (-4000,)),
+]
+
+RUNS = {"RUN1": RUN1, "RUN2": RUN2, "RUN3": RUN3, "RUN4": RUN4}
@@ -0,0 +1,100 @@
+from umath import atan2, cos, degrees, radians, sin, sqrt
+
+from pybricks.parameters import Stop
+
+
+def _wrap(angle):
+    """Shortest equivalent of `angle`, between -180 and 180 degrees."""
+    return (angle + 180) % 360 - 180
+
+
+class Odometry:
+    """Keeps track of where the robot is on the field.
+
+    Wheel travel from the drive base is laid along a heading that blends
+    the drive base's own angle with the gyro, trusting the gyro by
+    `gyro_weight`. Field coordinates are in mm with headings in degrees
+    clockwise, like `hub.imu.heading()`; (0, 0, 0) is wherever `reset` put
+    the robot. Call `update` at least at the end of every move, and often
+    during moves that curve.
+
+    Args:
+        drive_base (DriveBase): Drive base whose distance and angle to use.
+        imu (IMU): Gyro of the hub.
+        gyro_weight (float): Share of the heading taken from the gyro.
+    """
+
+    def __init__(self, drive_base, imu, gyro_weight=0.9):
+        self.drive_base = drive_base
+        self.imu = imu
+        self.gyro_weight = gyro_weight
+        self.reset()
+
+    def reset(self, x=0, y=0, heading=None):
+        """Set the pose; the heading defaults to what the gyro reads."""
+        self.x = x
+        self.y = y
+        self.heading = self.imu.heading() if heading is None else heading
+        self._distance = self.drive_base.distance()
+        self._angle = self.drive_base.angle()
+        # turns gyro readings into field headings
+        self._gyro_offset = self.heading - self.imu.heading()
+
+    def update(self):
+        """Add the motion since the last update and return (x, y, heading)."""
+        distance = self.drive_base.distance()
+        angle = self.drive_base.angle()
+        travel = distance - self._distance
+        predicted = self.heading + angle - self._angle
+        measured = self.imu.heading() + self._gyro_offset
+        self._distance = distance
+        self._angle = angle
+
+        start = self.heading
+        self.heading = predicted + self.gyro_weight * _wrap(measured - predicted)
+        # the chord of an arc points along the mean heading and is shorter
+        # than the arc by sin(half turn) / half turn
+        half = radians(self.heading - start) / 2
+        if abs(half) > 1e-6:
+            travel *= sin(half) / half
+        middle = radians((start + self.heading) / 2)
+        self.x += travel * cos(middle)
+        self.y += travel * sin(middle)
+        return self.x, self.y, self.heading
+
+    def poll(self):
+        """`update` if the drive base is running a move, for polling loops."""
+        if not self.drive_base.done():
+            self.update()
+
+    def go_to(self, x, y, heading=None, then=Stop.HOLD):
+        """Drive to a field position with the fewest degrees of turning.
+
+        Turns toward the target and drives straight there, backing up when
+        the target is behind the robot, then turns to `heading` if given.
+
+        Args:
+            x (float): Target position forward of the start, in mm.
+            y (float): Target position right of the start, in mm.
+            heading (float): Final heading in degrees, or None to keep the
+                one the robot arrives with.
+            then (Stop): How to end the straight part.
+        """
+        self.update()
+        dx, dy = x - self.x, y - self.y
+        if sqrt(dx * dx + dy * dy) >= 1:
+            turn = _wrap(degrees(atan2(dy, dx)) - self.heading)
+            if abs(turn) > 90:
+                turn = _wrap(turn + 180)
+            if abs(turn) >= 0.5:
+                self.drive_base.turn(turn)
+                self.update()
+            # drive what is left along the heading actually reached
+            h = radians(self.heading)
+            self.drive_base.straight(
+                (x - self.x) * cos(h) + (y - self.y) * sin(h), then=Stop.HOLD if heading is not None else then
+            )
+            self.update()
+        if heading is not None:
+            self.drive_base.turn(_wrap(heading - self.heading), then=then)
+            self.update()
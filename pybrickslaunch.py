@@ -1,13 +1,210 @@
 HUB_NAME = "Petroboy"
 
+import asyncio
+import hashlib
+import json
 import os
+import socket
 import subprocess
+import sys
+import time
+from modulefinder import ModuleFinder
 
-target = os.getenv("TARGET")
-command = f"pybricksdev run ble --name {HUB_NAME} {target}"
+# localhost port of the background process that keeps the hub connected
+PORT = 50841
+# compiled .mpy files, named by the hash of their source
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".pybricks_cache")
 
-try:
-    subprocess.run(command, shell=True, check=True)
-except subprocess.CalledProcessError:
-    print("Error uploading code to hub")
-    print("Make sure to set HUB_NAME and turn the hub on")
+
+def local_modules(path):
+    """Return (module name, file) for a script and the local modules it imports.
+
+    Uses the same search as `pybricksdev`, so the hub gets the same files.
+    """
+    finder = ModuleFinder([os.path.dirname(os.path.abspath(path))])
+    finder.run_script(path)
+    return [(name, module.__file__) for name, module in finder.modules.items() if module.__file__]
+
+
+def source_key(file, abi):
+    """Hash of everything that changes the compiled output of one file."""
+    import pybricksdev
+
+    digest = hashlib.sha256()
+    digest.update(f"{pybricksdev.__version__} abi {abi} {os.path.basename(file)}\n".encode())
+    with open(file, "rb") as source:
+        digest.update(source.read())
+    return digest.hexdigest()
+
+
+async def compile_cached(path, abi):
+    """Build the multi-file program for `path`, compiling only changed files.
+
+    Returns:
+        tuple: (program bytes in the pybricksdev multi-file format, number
+        of files that had to be compiled).
+    """
+    from pybricksdev.compile import compile_file
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    folder = os.path.dirname(os.path.abspath(path))
+    parts = []
+    compiled = 0
+    for name, file in local_modules(path):
+        cached = os.path.join(CACHE_DIR, source_key(file, abi) + ".mpy")
+        if os.path.exists(cached):
+            with open(cached, "rb") as mpy_file:
+                mpy = mpy_file.read()
+        else:
+            mpy = await compile_file(folder, os.path.relpath(file, folder), abi)
+            with open(cached, "wb") as mpy_file:
+                mpy_file.write(mpy)
+            compiled += 1
+        parts += [len(mpy).to_bytes(4, "little"), name.encode() + b"\x00", mpy]
+    return b"".join(parts), compiled
+
+
+class HubServer:
+    """Keeps one BLE connection to the hub open across launches.
+
+    Each launch sends a line of JSON with the file to run. The program is
+    only downloaded again if it differs from what the hub already holds,
+    and the hub output is streamed back until the program stops. A request
+    with "lines" instead writes them to the stdin of the running program.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.hub = None
+        self.loaded = None
+
+    async def connect(self):
+        from pybricksdev.ble import find_device
+        from pybricksdev.connections import ConnectionState
+        from pybricksdev.connections.pybricks import PybricksHubBLE
+
+        if self.hub and self.hub.connection_state_observable.value == ConnectionState.CONNECTED:
+            return
+        self.hub = PybricksHubBLE(await find_device(self.name))
+        await self.hub.connect()
+        # a new connection may mean a rebooted hub with an empty program slot
+        self.loaded = None
+
+    def abi(self):
+        from pybricksdev.ble.pybricks import HubCapabilityFlag
+
+        formats = HubCapabilityFlag.USER_PROG_MULTI_FILE_MPY6 | HubCapabilityFlag.USER_PROG_MULTI_FILE_MPY6_1_NATIVE
+        if self.hub._capability_flags & formats:
+            return 6
+        raise RuntimeError("hub firmware is too old for multi-file programs, update Pybricks")
+
+    async def handle(self, reader, writer):
+        def send(data):
+            writer.write(data)
+
+        try:
+            request = json.loads(await reader.readline())
+            started = time.perf_counter()
+            await self.connect()
+            if "lines" in request:
+                for line in request["lines"]:
+                    await self.hub.write_line(line)
+                send(f"[push] {len(request['lines'])} line(s) sent\n".encode())
+                return
+            program, compiled = await compile_cached(request["target"], self.abi())
+            digest = hashlib.sha256(program).hexdigest()
+            if digest != self.loaded:
+                await self.hub.download_user_program(program)
+                self.loaded = digest
+                note = f"{compiled} file(s) compiled, {len(program)} bytes sent"
+            else:
+                note = "unchanged, starting the program already on the hub"
+            send(f"[launch] {note} in {time.perf_counter() - started:.1f} s\n".encode())
+
+            with self.hub.stdout_observable.subscribe(send):
+                await self.hub.run(None, wait=True, print_output=False, line_handler=False)
+        except Exception as error:  # pylint: disable=broad-except
+            send(f"Error: {error}\n".encode())
+            self.loaded = None
+        finally:
+            await writer.drain()
+            writer.close()
+
+    async def serve(self):
+        await self.connect()
+        server = await asyncio.start_server(self.handle, "127.0.0.1", PORT)
+        async with server:
+            await server.serve_forever()
+
+
+def start_server():
+    """Start the connection-keeping process in the background."""
+    command = [sys.executable, os.path.abspath(__file__), "--serve"]
+    if os.name == "nt":
+        flags = subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.DETACHED_PROCESS
+        subprocess.Popen(command, creationflags=flags, close_fds=True)
+    else:
+        subprocess.Popen(command, start_new_session=True, close_fds=True)
+
+
+def open_server(timeout=30):
+    """Connect to the background process, starting it if needed."""
+    try:
+        return socket.create_connection(("127.0.0.1", PORT))
+    except OSError:
+        start_server()
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        time.sleep(0.5)
+        try:
+            return socket.create_connection(("127.0.0.1", PORT))
+        except OSError:
+            pass
+    raise ConnectionError("hub connection process did not start")
+
+
+def launch(target):
+    """Run `target` on the hub through the background connection."""
+    with open_server() as connection:
+        connection.sendall(json.dumps({"target": os.path.abspath(target)}).encode() + b"\n")
+        while True:
+            data = connection.recv(1024)
+            if not data:
+                break
+            sys.stdout.write(data.decode(errors="replace"))
+            sys.stdout.flush()
+
+
+def push(lines):
+    """Write lines to the stdin of the program running on the hub."""
+    with open_server() as connection:
+        connection.sendall(json.dumps({"lines": list(lines)}).encode() + b"\n")
+        reply = b""
+        while True:
+            data = connection.recv(1024)
+            if not data:
+                break
+            reply += data
+    return reply.decode(errors="replace")
+
+
+def launch_once(target):
+    """Upload and run without the background process, like before."""
+    command = f"pybricksdev run ble --name {HUB_NAME} {target}"
+    try:
+        subprocess.run(command, shell=True, check=True)
+    except subprocess.CalledProcessError:
+        print("Error uploading code to hub")
+        print("Make sure to set HUB_NAME and turn the hub on")
+
+
+if __name__ == "__main__":
+    if "--serve" in sys.argv:
+        asyncio.run(HubServer(HUB_NAME).serve())
+    else:
+        target = os.getenv("TARGET")
+        try:
+            launch(target)
+        except (ConnectionError, OSError) as error:
+            print(f"Background connection unavailable ({error}), uploading directly")
+            launch_once(target)
@@ -1,307 +1,30 @@
-from pybricks.hubs import PrimeHub
-from pybricks.pupdevices import Motor, ColorSensor
-from pybricks.parameters import Button, Color, Direction, Port, Stop, Axis
-from pybricks.robotics import DriveBase
-from pybricks.tools import StopWatch, hub_menu, wait
+from pybricks.tools import StopWatch
 
-hub = PrimeHub()
+# started before anything else, so BOOT shows how long importing took
+boot = StopWatch()
 
-# CUTIE WHEELS
-left_wheel = Motor(Port.A, Direction.COUNTERCLOCKWISE)  # purple
-right_wheel = Motor(Port.E, Direction.CLOCKWISE)  # red
+# pylint: disable=wrong-import-position,wildcard-import,unused-wildcard-import
+from common import *  # noqa: E402,F403  devices and drive helpers
+from launcher import Launcher  # noqa: E402
+import looptime  # noqa: E402
+import run_table  # noqa: E402
+from steps import run_steps  # noqa: E402
+from telemetry import Recorder  # noqa: E402
+from tuning import Tuner  # noqa: E402
 
-left_motor = Motor(Port.F, gears=[20, 28])  # yellow
-right_motor = Motor(Port.D, gears=[20, 28])  # blue
+# record the sensors during a run and print them when it ends,
+# decode the output with python -m tools.telemetry
+TELEMETRY = False
 
-sensor = ColorSensor(Port.C)  # green
-sensor2 = ColorSensor(Port.B)  # cyan
+# time the control loops during a run and print LOOP histograms when it
+# ends, along with BOOT, the ms from program start to the menu
+TIMING = False
 
+# run table values pushed from the laptop with python -m tools.push
+tuner = Tuner(run_table)
 
-cutie = DriveBase(left_wheel, right_wheel, wheel_diameter=62.4, axle_track=80)
-
-CUSTOM_RED = Color(343, 82, 36)
-CUSTOM_BLUE = Color(216, 88, 27)
-CUSTOM_GREEN = Color(156, 72, 19)
-CUSTOM_YELLOW = Color(51, 75, 71)
-
-color_list = [CUSTOM_RED, CUSTOM_YELLOW, CUSTOM_BLUE, CUSTOM_GREEN]
-
-run_colors = (Color.RED, Color.YELLOW, Color.BLUE, Color.GREEN)
-sensor2.detectable_colors(color_list)
-
-cutie.use_gyro(True)
-
-def get_battery(amount):
-    """Return average of 'amount' battery precentege pollings"""
-    avg = 0
-    print(f"this will take {amount/50} seconds")
-    for i in range(amount):
-        avg += (hub.battery.voltage()-7000)/12
-        wait(20)
-    return avg/amount
-
-
-def wait_for_right_arrow():
-    """Wait until the right arrow button is pressed on the hub."""
-    while Button.RIGHT not in hub.buttons.pressed():
-        wait(100)
-
-
-def button_motor_control(speed=300):
-    """Move the right or left motor while the corresponding button is held.
-
-    RIGHT arrow runs the right motor while pressed.
-    LEFT arrow runs the left motor while pressed.
-    CENTER exits the control loop.
-    """
-    while True:
-        pressed = hub.buttons.pressed()
-
-        if Button.RIGHT in pressed:
-            right_motor.run(speed)
-        else:
-            right_motor.stop()
-
-        if Button.LEFT in pressed:
-            left_motor.run(speed)
-        else:
-            left_motor.stop()
-
-        if Button.CENTER in pressed:
-            right_motor.stop()
-            left_motor.stop()
-            break
-
-        wait(10)
-
-
-def straight_time(speed, time):
-    """Move straight for a specified duration.
-    
-    Args:
-        speed (int): Speed at which to move (positive or negative).
-        time (int): Duration to move in milliseconds.
-    """
-    cutie.drive(speed, 0)
-    wait(time)
-    cutie.stop()
-
-
-def turn_time(turn_rate, time):
-    """Turns the robot in place for a specified duration.
-
-    Args:
-        turn_rate (int): Turn rate to apply. Positive values turn right, negative values turn left.
-        time (int): Duration of the turn in milliseconds.
-    """
-    cutie.drive(0, turn_rate)
-    wait(time)
-    cutie.stop()
-
-
-def curve_time(time, turn_rate):
-    """Drive in a curve for a specified duration.
-    
-    Args:
-        time (int): Duration to drive in milliseconds.
-        angle (float): Turn rate for the curve.
-    """
-    speed = cutie.settings()[0]
-    cutie.drive(speed, turn_rate)
-    wait(time)
-    cutie.stop()
-
-
-def till_black(speed, turn_rate):
-    """Drive until a black line is detected on the color sensor.
-    
-    Args:
-        speed (int): Speed at which to drive.
-        turn_rate (float): Turn rate while driving.
-    """
-    cutie.drive(speed=speed, turn_rate=turn_rate)  # start driving
-
-    while sensor2.reflection() > 7:  # while refelction over 7, continue driving
-        wait(10)
-
-    cutie.stop()  # Stop
-
-
-def till_blue(speed, turn_rate):
-    """Drive until the blue block on the ramp is detected on the color sensor.
-    
-    Args:
-        speed (int): Speed at which to drive.
-        turn_rate (float): Turn rate while driving.
-    """
-    cutie.drive(speed=speed, turn_rate=turn_rate)  # start driving
-
-    while sensor2.color() != CUSTOM_BLUE:
-        wait(10)
-
-    cutie.stop()  # Stop
-
-def wait_for_stable_roll(window_size=10, poll_ms=10, tolerance=1):
-    """Poll the robot till continuously and keep the last
-    `window_size` readings in a FIFO list. When the average of the
-    window is within the tolerance, return the averaged value.
-
-    Args:
-        window_size (int): number of readings to keep (default 10).
-        poll_ms (int): milliseconds to wait between polls (default 10).
-        tol (float): tolerance threshold for average (default 1).
-    Returns:
-        float: the average of the last `window_size` readings when stopped.
-    """
-    readings = []
-    while True:
-        r = hub.imu.tilt()[1]
-        readings.append(r)
-        if len(readings) > window_size:
-            readings.pop(0)
-
-        if len(readings) == window_size:
-            avg = sum(readings) / float(window_size)
-            # print("tilt_avg:", avg)
-            if -tolerance <= avg <= tolerance:
-                return avg
-
-        wait(poll_ms)
-
-def going_down(speed, turn_rate):
-    """Drive to the yellow line and wait for the robot to stabilize.
-    
-    Drives until the yellow line is detected, then continues driving while
-    waiting for the roll (tilt) to stabilize before continuing.
-    
-    Args:
-        speed (int): Speed at which to drive.
-        turn_rate (float): Turn rate while driving.
-    """
-    till_blue(speed, turn_rate)
-
-    cutie.drive(speed, turn_rate)
-    wait_for_stable_roll()
-    cutie.stop()
-
-
-def gyro_turn(
-    target,
-    max_rate=150,
-    kp=2.1,
-    kd=0.6,
-    ke=16,
-    angle_tol=0.3,
-    speed_tol=30,
-    max_time=2670,
-):
-    """Turn the robot to a target heading using gyro-based PD control.
-    
-    Uses the IMU gyroscope and PD (proportional-derivative) control with a static
-    bias to overcome motor friction and achieve precise heading control.
-    
-    Args:
-        target (float): Target heading in degrees.
-        max_rate (int): Maximum turn rate in degrees/second (default 150).
-        kp (float): Proportional gain constant.
-        kd (float): Derivative gain constant.
-        ke (int): Static bias constant to overcome motor friction.
-        angle_tol (float): Angle tolerance threshold in degrees (default 0.3).
-        speed_tol (int): Turn rate tolerance threshold (default 30).
-        max_time (int): Maximum time to attempt turn in milliseconds (default 2670).
-    """
-
-    last_error = 0
-    timer = StopWatch()
-    timer.reset()
-
-    last_time = timer.time()
-
-    while timer.time() < max_time:
-        current = hub.imu.heading()
-
-        # Shortest angle wraparound
-        error = ((target - current + 180) % 360) - 180
-
-        # Real dt
-        now = timer.time()
-        dt = (now - last_time) / 1000.0  # convert ms to seconds
-        last_time = now
-
-        if dt == 0:
-            dt = 0.001  # avoid division by zero
-
-        # PD control
-        d_error = (error - last_error) / dt
-        turn_rate = kp * error + kd * d_error
-        # Add static bias to overcome motor deadzone
-        turn_rate += ke if turn_rate > 0 else -ke
-
-        # Clamp turn rate
-        turn_rate = max(-max_rate, min(max_rate, turn_rate))
-        cutie.drive(0, turn_rate)
-
-        # Exit condition: close enough and slow enough
-        if abs(error) < angle_tol and abs(turn_rate) < speed_tol:
-            break
-
-        last_error = error
-        wait(10)  # smaller wait for faster updates
-    cutie.stop()
-    wait(200)
-
-
-def turn_to(angle, then=Stop.HOLD):
-    """Turn the robot to a specific absolute angle.
-    
-    Uses PyBricks' built-in turn function to rotate to the target angle.
-    
-    Args:
-        angle (float): Target absolute angle in degrees.
-        then (Stop): Stop behavior after turning (default Stop.HOLD).
-    """
-    start_angle = (hub.imu.heading() + 360) % 360  # cal
-    deg_to_turn = (angle - start_angle) % 360  # calculate how much need to turn
-    if then == Stop.NONE:
-        if deg_to_turn >= 180:
-            cutie.turn(angle=deg_to_turn - 360)
-        else:
-            cutie.turn(angle=deg_to_turn)
-        return
-    if deg_to_turn >= 180:
-        cutie.turn(deg_to_turn - 360)
-    else:
-        cutie.turn(deg_to_turn)
-
-
-def gyro_abs(target_angle, kp=1.5, ke=20):
-    """Turn to an absolute angle using gyro-based proportional control.
-    
-    Args:
-        target_angle (float): Target absolute angle in degrees.
-        kp (float): Proportional gain constant (default 1.5).
-        ke (int): Static bias to overcome motor friction (default 20).
-    """
-
-    while True:
-        error = (
-            (target_angle - hub.imu.heading() + 180) % 360
-        ) - 180  # calculate error
-
-        turn_rate = error * kp  # calculate turning speed
-
-        if turn_rate > 0:
-            turn_rate += ke  # apply ks(kavua stati)
-        else:
-            turn_rate -= ke  # apply ks(kavua stati)
-
-        if abs(error) < 0.3:  # when reached reasonable error, exit loop
-            break
-
-        cutie.drive(0, turn_rate=turn_rate)  # apply speed
-        wait(10)
-    cutie.stop()  # stop
-    wait(200)
+if TELEMETRY:
+    recorder = Recorder(hub, (left_wheel, right_wheel), (left_motor, right_motor), (sensor, sensor2))
 
 
 # right_motor.run_time(-1000, 5000)
@@ -319,175 +42,26 @@ def gyro_abs(target_angle, kp=1.5, ke=20):
 def run1():
     """Execute the first robot run sequence.
     """
-    # MERKAVA!!!!!
-    cutie.settings(straight_speed = 1000) #set speed to 1000
-    cutie.straight(distance=1300, then=Stop.NONE) #Go straight
-    straight_time(speed = 1000, time = 4000) #straight time
+    run_steps(run_table.RUN1, globals())
 
-    cutie.settings(150, turn_rate=40)  # apply settings
-    cutie.use_gyro(True)
-
-    # GOING DOWN
-    cutie.settings(600)
-    going_down(-100, 0)
-    gyro_turn(0)
-    cutie.settings(200)
-    cutie.straight(-50,then=Stop.NONE)
-    cutie.settings(300)
-    cutie.curve(-450, -30)
-    gyro_turn(-4)
-    cutie.settings(400, 400)
-    left_motor.run_time(speed=-300, time=6000, wait=False)
-    cutie.straight(-500)
-    cutie.settings(turn_acceleration=200)
-    cutie.use_gyro(False)
-    cutie.settings(200, turn_rate=400)
-    turn_to(90)
-    cutie.settings(straight_acceleration=750)
-    straight_time(-250, 2000) #hit wall
-    right_motor.run_time(speed=-300, time=3000, wait=False)
-    hub.imu.reset_heading(90)
-
-    cutie.settings(turn_rate=70, straight_speed=80)
-    cutie.straight(35)
-    gyro_turn(0)
-    cutie.use_gyro(True)
-    till_black(100, 0)
-    cutie.straight(-10)
-    right_motor.run_time(300, 2000)
-    right_motor.run_time(-300, 2000)
-    left_motor.run_angle(1500, 600) #lift item
-    gyro_turn(-3)
-
-    cutie.settings(turn_rate=70, straight_speed=150)
-    cutie.straight(-150)
-    
-    cutie.settings(straight_speed=400, turn_rate=200)
-    gyro_turn(90)
-    cutie.straight(210)
-    gyro_turn(45)
-    cutie.straight(20)
-    right_motor.run_time(300, 2000, wait=False)
-    left_motor.run_time(1500, 5000)
-    hub.imu.reset_heading(45)
-    cutie.settings(150)
-    cutie.straight(-170)
-    cutie.straight(70)
-    cutie.turn(10)
-    cutie.settings(100)
-    cutie.straight(130)
-    cutie.settings(turn_rate=375)
-    cutie.settings(turn_rate=1000, turn_acceleration=1000)
-    cutie.straight(-50)
-    turn_time(-1000, 1500)
-    cutie.turn(95)
-    gyro_turn(100)
-    cutie.settings(1000, turn_rate=1000)
-    cutie.curve(700, 60, then=Stop.NONE)
-    cutie.straight(600)
-    # yiftach was here, dont tell anyone
-    
 
 def run2():
     """Execute the second robot run sequence.
     """
-    cutie.settings(460)
-    curve_time(1400, 20)  # go into wall and into boat
-    right_motor.run_time(-1000, 1000)  # Drop flag
-    cutie.settings(400) 
-    cutie.curve(-6000, 5)
-    cutie.use_gyro(True)
-    cutie.curve(500, -25, then=Stop.NONE)
-    cutie.straight(400)
-    gyro_turn(0)
-    cutie.straight(250)
-    till_black(-150, 0)  # go to black line
-    gyro_turn(0)
-    cutie.straight(45)
-    right_motor.run_time(1200, 6000, wait=False)
-    wait(1500)
-    straight_time(20, 1500)
-    wait(2000)
-    till_black(-100, 0)
-    cutie.straight(20)
-    right_motor.run_time(-1000, 7000, wait=False)
-    cutie.turn(20)
-    wait(1000)
-    gyro_turn(-4)
-    cutie.settings(100)
-    cutie.straight(140) # latch onto tray
-    cutie.straight(-130) # latch onto tray
-    cutie.settings(turn_rate=50)
-    cutie.turn(45) # remove tray
-    turn_to(30)
-    cutie.settings(turn_rate=100)
-    cutie.straight(60, then=Stop.NONE)
-    cutie.curve(60, -45, then=Stop.NONE)
-    gyro_turn(0, ke= 15)
-    gyro_turn(0)
-    
-    cutie.settings(700, 500)
-    cutie.straight(560)
-    gyro_turn(52)
-    cutie.settings(straight_acceleration=750)
-    straight_time(-180, 2500) # reverse into market stall
-    right_motor.run_time(1000, 3000, wait=False)
-    left_motor.run_time(-500, 6000, wait=False)  # lower arm to lift stall
-    wait(3000)
-    cutie.settings(200)
-    cutie.turn(-25)
-    gyro_turn(45)
-    wait(500)
-    cutie.straight(300) # lift market stall
-    left_motor.run_time(500, 5500, wait=False)
-    cutie.straight(-130)
-    wait(3000)
-    # retract arm
-    cutie.settings(1000)
-    right_motor.run_time(-1000, 3000, wait=False)
-    cutie.straight(1000) # return home
-    
-
+    run_steps(run_table.RUN2, globals())
 
 
 def run3():
     """Execute the third robot run sequence.
     """
-    cutie.use_gyro(True)
-    cutie.settings(straight_speed=1000)  #
-    cutie.straight(distance=300, then=Stop.NONE)  # go straight
-    cutie.settings(straight_speed=300)
-    cutie.straight(440, then=Stop.NONE)
-    till_black(speed=100, turn_rate=0)  # until black
-    gyro_abs(45, ke=5, kp=2)  # turn to degree 45
-    cutie.settings(straight_speed=200, straight_acceleration=750, turn_rate=250)
-    cutie.straight(250)  # go into statue
-    cutie.straight(-25)  # back up
-    right_motor.run_angle(speed=-400, rotation_angle=125, wait=False)  # statue
-    wait(1000)
-    cutie.turn(-20)
-    cutie.turn(40)
-    gyro_abs(45)
-    left_motor.run_time(speed=90, time=1500)  # forum, mechanical stop
-    cutie.turn(-25)
-    cutie.straight(-300)  # gets out
-
+    run_steps(run_table.RUN3, globals())
     # victory_dance()
 
 
 def run4():
     """Execute the fourth robot run sequence.
     """
-    cutie.settings(straight_speed=800, straight_acceleration=450)
-    left_motor.run_until_stalled(-1100)
-    cutie.straight(700)
-    cutie.straight(-340)
-    cutie.straight(150)
-    left_motor.run_time(200, 5000, wait=False)
-    wait(1500)
-    cutie.straight(-400, then=Stop.NONE)
-    cutie.curve(-200, -60, then=Stop.NONE)
-    cutie.straight(-4000)
+    run_steps(run_table.RUN4, globals())
 
 
 def victory_dance():
@@ -502,73 +76,46 @@ def victory_dance():
         wait(100)
 
 
-def cycle(iterable):
-    """Continuously cycle through an iterable, restarting when exhausted.
-    
-    Args:
-        iterable: An iterable to cycle through.
-        
-    Yields:
-        Elements from the iterable, repeating infinitely.
-    """
-    iterator = iter(iterable)
-    while True:
-        try:
-            yield next(iterator)
-        except StopIteration:
-            iterator = iter(iterable)
-
 # if (hub.system.info()[3]):
 #     print("yes")
 # else:
 #     print("no")
 #     cutie.turn(1000)
 # print("Polling battery percentage...")
-# battery = get_battery(100)
+# battery = get_battery()
 # print(f"{battery}%")
 
-sensor.detectable_colors(run_colors)
-color_cycle = cycle(run_colors)
-color_map = {Color.RED: "1", Color.BLUE: "2", Color.GREEN: "3", Color.YELLOW: "4"}
-
-while sensor.color() != next(color_cycle):
-    pass
-
-menu = [color_map[sensor.color()]]
-for i in range(len(run_colors) - 1):
-    menu.append(color_map[next(color_cycle)])
-
-
-selected = hub_menu(*menu)  # pylint: disable=assignment-from-no-return
-
-hub.speaker.beep(659, 0.5)   # E5
-if selected == "1":
-    hub.imu.reset_heading(0)
-    run1()
-elif selected == "2":
-    hub.imu.reset_heading(0)
-    run2()
-elif selected == "3":
-    hub.imu.reset_heading(0)
-    run3()
-elif selected == "4":
+# the attachment color picks the run, in the order we run them in the match
+launcher = Launcher(attachment_color, (("red", "1"), ("yellow", "4"), ("blue", "2"), ("green", "3")))
+runs = {"1": run1, "2": run2, "3": run3, "4": run4}
+# run tables assume the firmware defaults, which an earlier run may have changed
+defaults = cutie.settings()
+if TIMING:
+    print("BOOT", boot.time(), "ms")
+
+# back in base after a run, the menu is up again for the next one
+while True:
+    selected = launcher.select()
+    tuner.poll()
+
+    hub.speaker.beep(659, 0.5)   # E5
+    # look up the charge first, restoring the defaults scales them by it
+    compensation.update(voltage(hub.battery))
+    cutie.settings(*defaults)
+    cutie.use_gyro(True)
+    left_motor.stop()
+    right_motor.stop()
+    if TELEMETRY:
+        recorder.start()
+    if TIMING:
+        looptime.start()
     hub.imu.reset_heading(0)
-    run4()
-# sensor.detectable_colors(run_colors)
-# run_map = {str(i+1): func for i, func in enumerate([run1, run2, run3, run4])}
-# color_map = {color: str(i + 1) for i, color in enumerate(run_colors)}
-
-# color_cycle = cycle(run_colors)
-
-# while sensor.color() != next(color_cycle):
-#     pass
-
-# current_color = sensor.color()
-
-# menu = [color_map[current_color]] + [color_map[next(color_cycle)] for _ in range(len(run_colors) - 1)]
-# selected = hub_menu(*menu)  # pylint: disable=assignment-from-no-return
-
-# hub.speaker.beep(659, 0.5)   # E5
-# hub.imu.reset_heading(0)
-
-# run_map[selected]()
\ No newline at end of file
+    odometry.reset()
+    runs[selected]()
+    # background attachment moves are not waited for at the end of a run
+    left_arm.stop()
+    right_arm.stop()
+    if TELEMETRY:
+        recorder.dump("run" + selected)
+    if TIMING:
+        looptime.report("run" + selected)
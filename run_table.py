@@ -0,0 +1,55 @@
+# Generated by tools/stepc.py from missions.py, do not edit.
+# Rows are (op, args, settings, then, after), see steps.py.
+
+RUN1 = ((0, (1300,), (1000, None, None, None), 4, ()), (16, (1000, 4000), None, 0, (0,)),
+ (9, (True,), None, 0, (1,)), (15, (-100, 0), (600, None, 40, None), 0, (2,)),
+ (10, (0,), None, 0, (3,)), (0, (-50,), (200, None, None, None), 4, (4,)),
+ (2, (-450, -30), (300, None, None, None), 0, (5,)), (10, (-4,), None, 0, (6,)),
+ (3, (0, -300, 6000), None, 5, (7,)), (0, (-500,), (400, 400, None, None), 0, (7,)),
+ (9, (False,), None, 0, (9,)), (12, (90,), (200, None, 400, 200), 0, (10,)),
+ (16, (-250, 2000), (None, 750, None, None), 0, (11,)), (3, (1, -300, 3000), None, 5, (12,)),
+ (8, (90,), None, 0, (12,)), (0, (35,), (80, None, 70, None), 0, (14,)), (10, (0,), None, 0, (15,)),
+ (9, (True,), None, 0, (16,)), (13, (100, 0), None, 0, (17,)), (0, (-10,), None, 0, (18,)),
+ (3, (1, 300, 2000), None, 0, (19,)), (3, (1, -300, 2000), None, 0, (20,)),
+ (4, (0, 1500, 600), None, 0, (21,)), (10, (-3,), None, 0, (22,)),
+ (0, (-150,), (150, None, None, None), 0, (23,)), (10, (90,), (400, None, 200, None), 0, (24,)),
+ (0, (210,), None, 0, (25,)), (10, (45,), None, 0, (26,)), (0, (20,), None, 0, (27,)),
+ (3, (1, 300, 2000), None, 5, (28,)), (23, (0, 1500, 5000), None, 0, (28,)),
+ (8, (45,), None, 0, (30,)), (0, (-170,), (150, None, None, None), 0, (31,)),
+ (0, (70,), None, 0, (32,)), (1, (10,), None, 0, (33,)),
+ (0, (130,), (100, None, None, None), 0, (34,)), (0, (-50,), (None, None, 1000, 1000), 0, (35,)),
+ (18, (-1000, 1500), None, 0, (36,)), (1, (95,), None, 0, (37,)), (10, (100,), None, 0, (38,)),
+ (2, (700, 60), (1000, None, None, None), 4, (39,)), (0, (600,), None, 0, (40,)))
+
+RUN2 = ((17, (1400, 20), (460, None, None, None), 0, ()), (3, (1, -1000, 1000), None, 0, (0,)),
+ (2, (-6000, 5), (400, None, None, None), 0, (1,)), (9, (True,), None, 0, (2,)),
+ (2, (500, -25), None, 4, (3,)), (0, (400,), None, 0, (4,)), (10, (0,), None, 0, (5,)),
+ (0, (250,), None, 0, (6,)), (13, (-400, 0, {'expect': 165, 'slow': 150}), None, 0, (7,)),
+ (10, (0,), None, 0, (8,)), (0, (45,), None, 0, (9,)), (3, (1, 1200, 6000), None, 5, (10,)),
+ (6, (1500,), None, 0, (10,)), (16, (20, 1500), None, 0, (12,)), (6, (2000,), None, 0, (13,)),
+ (13, (-100, 0), None, 0, (14,)), (0, (20,), None, 0, (15,)), (3, (1, -1000, 7000), None, 5, (16,)),
+ (1, (20,), None, 0, (16,)), (6, (1000,), None, 0, (18,)), (10, (-4,), None, 0, (19,)),
+ (0, (140,), (100, None, None, None), 0, (20,)), (0, (-130,), None, 0, (21,)),
+ (1, (45,), (None, None, 50, None), 0, (22,)), (12, (30,), None, 0, (23,)),
+ (0, (60,), (None, None, 100, None), 4, (24,)), (2, (60, -45), None, 4, (25,)),
+ (10, (0, {'ke': 15}), None, 0, (26,)), (10, (0,), None, 0, (27,)),
+ (0, (560,), (700, 500, None, None), 0, (28,)), (10, (52,), None, 0, (29,)),
+ (3, (1, 1000, 3000), None, 5, (30,)), (23, (0, -500, 6000), None, 5, (30,)),
+ (16, (-180, 2500), (None, 750, None, None), 0, (30,)), (6, (500,), None, 0, (33,)),
+ (1, (-25,), (200, None, None, None), 0, (34,)), (10, (45,), None, 0, (35,)),
+ (6, (500,), None, 0, (36,)), (0, (300,), None, 0, (37,)), (23, (0, 500, 5500), None, 5, (38,)),
+ (0, (-130,), None, 0, (38,)), (19, (1, 3000), None, 0, (40,)),
+ (3, (1, -1000, 3000), None, 5, (41,)), (0, (1000,), (1000, None, None, None), 0, (41,)))
+
+RUN3 = ((9, (True,), None, 0, ()), (0, (300,), (1000, None, None, None), 4, (0,)),
+ (0, (396,), (300, 900, None, None), 4, (1,)), (0, (44,), (100, None, None, None), 4, (2,)),
+ (13, (100, 0), (300, None, None, None), 0, (3,)), (11, (45, {'ke': 5, 'kp': 2}), None, 0, (4,)),
+ (0, (250,), (200, 750, 250, None), 0, (5,)), (0, (-25,), None, 0, (6,)),
+ (4, (1, -400, 125), None, 5, (7,)), (19, (2, 1000), None, 0, (7,)), (1, (-20,), None, 0, (9,)),
+ (1, (40,), None, 0, (10,)), (11, (45,), None, 0, (11,)), (23, (0, 90, 1500), None, 0, (12,)),
+ (1, (-25,), None, 0, (13,)), (0, (-300,), None, 0, (14,)))
+
+RUN4 = ((5, (0, -1100), None, 0, ()), (0, (700,), (800, 450, None, None), 0, (0,)),
+ (0, (-340,), None, 0, (1,)), (0, (150,), None, 0, (2,)), (23, (0, 200, 5000), None, 5, (3,)),
+ (19, (1, 1500), None, 0, (3,)), (0, (-400,), None, 4, (5,)), (2, (-200, -60), None, 4, (6,)),
+ (0, (-4000,), None, 0, (7,)))
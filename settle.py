@@ -0,0 +1,62 @@
+from pybricks.parameters import Axis
+from pybricks.tools import StopWatch
+
+from telemetry import wait
+
+
+def settle(moving, timeout, hold=30, period=10):
+    """Wait until something stops moving, instead of a fixed time.
+
+    Args:
+        moving (callable): Returns True while the signal has not converged.
+        timeout (int): Never wait longer than this, in milliseconds.
+        hold (int): Milliseconds `moving` must stay False in a row.
+        period (int): Milliseconds between checks.
+    Returns:
+        int: Milliseconds waited.
+    """
+    timer = StopWatch()
+    still = None
+    while True:
+        now = timer.time()
+        if moving():
+            still = None
+        elif still is None:
+            still = now
+        if still is not None and now - still >= hold or now >= timeout:
+            return now
+        wait(period)
+
+
+def settle_drive(drive_base, timeout, imu=None, speed=5, rate=3, hold=30):
+    """Wait until the drive base finished its move and stopped rolling.
+
+    Args:
+        drive_base (DriveBase): Drive base to watch.
+        timeout (int): Longest wait in milliseconds.
+        imu (IMU): If given, the turn rate is read from the gyro instead of
+            the wheels, which also catches the robot sliding round.
+        speed (int): Speed in mm/s that counts as stopped.
+        rate (int): Turn rate in deg/s that counts as stopped.
+        hold (int): Milliseconds it must stay stopped.
+    """
+
+    def moving():
+        state = drive_base.state()
+        turning = imu.angular_velocity(Axis.Z) if imu else state[3]
+        return not drive_base.done() or abs(state[1]) > speed or abs(turning) > rate
+
+    return settle(moving, timeout, hold)
+
+
+def settle_motor(motor, timeout, speed=20, hold=100):
+    """Wait until a motor finished its command or came to rest against a stop.
+
+    Args:
+        motor (Motor): Motor to watch.
+        timeout (int): Longest wait in milliseconds.
+        speed (int): Speed in deg/s that counts as at rest.
+        hold (int): Milliseconds it must stay at rest, long enough to not
+            mistake the start of a move for the end of one.
+    """
+    return settle(lambda: not motor.done() and abs(motor.speed()) > speed, timeout, hold)
@@ -0,0 +1,23 @@
+"""Host-side simulator for the hub programs in this repository.
+
+`sim/stubs` holds pure-Python stand-ins for the pybricks firmware modules.
+They run on a virtual clock (see `sim.world`), so a whole run finishes in
+milliseconds on a laptop and reports how long it would take on the table.
+"""
+
+import os
+import sys
+
+from .world import Field, SimTimeout, StopScript, World, activate, current
+
+STUBS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stubs")
+
+
+def install():
+    """Put the pybricks stand-ins in front of any installed pybricks package."""
+    if sys.path[:1] != [STUBS]:
+        if STUBS in sys.path:
+            sys.path.remove(STUBS)
+        sys.path.insert(0, STUBS)
+        for name in [name for name in sys.modules if name.split(".")[0] == "pybricks"]:
+            del sys.modules[name]
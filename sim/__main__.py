@@ -0,0 +1,33 @@
+import argparse
+import time
+
+from .runner import run_script
+from .world import World
+
+# time on the table for a whole match, in seconds
+MATCH_BUDGET = 150
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m sim",
+        description="Run hub programs on the simulator and report mission time.",
+    )
+    parser.add_argument("script", nargs="?", default="robot.py", help="hub program (default robot.py)")
+    parser.add_argument("runs", nargs="*", default=["1", "2", "3", "4"], help="menu entries to run")
+    parser.add_argument("--limit", type=float, default=600, help="simulated seconds before giving up")
+    args = parser.parse_args()
+
+    total = 0
+    for selection in args.runs:
+        started = time.perf_counter()
+        world = run_script(args.script, selection, World(limit_ms=args.limit * 1000))
+        wall = (time.perf_counter() - started) * 1000
+        seconds = world.elapsed / 1000
+        total += seconds
+        print(f"run {selection}: {seconds:7.2f} s simulated  {world.outcome:<7}  ({wall:.0f} ms wall)")
+    print(f"total:  {total:7.2f} s of the {MATCH_BUDGET} s match")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+import argparse
+import json
+import math
+import os
+import random
+import statistics
+import zlib
+
+from .runner import call, load_script, run_script
+from .world import World
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(ROOT, "sim", "bench_baseline.json")
+
+# name: ("run", menu entry) or ("call", helper, args[, keyword args])
+CASES = {
+    "run1": ("run", "1"),
+    "run2": ("run", "2"),
+    "run3": ("run", "3"),
+    "run4": ("run", "4"),
+    "gyro_turn(90)": ("call", "gyro_turn", (90,)),
+    "gyro_turn(90, fixed)": ("call", "gyro_turn", (90,), {"fixed": True, "period": 5}),
+    "gyro_abs(-90)": ("call", "gyro_abs", (-90,)),
+    "gyro_abs(-90, fixed)": ("call", "gyro_abs", (-90,), {"fixed": True, "period": 5}),
+    "turn_to(180)": ("call", "turn_to", (180,)),
+    "going_down(-100, 0)": ("call", "going_down", (-100, 0)),
+    # backing onto the line 200 mm behind the start
+    "till_black(-100, 0)": ("call", "till_black", (-100, 0)),
+    "till_black(-400, 0)": ("call", "till_black", (-400, 0)),
+    "land_on_black(-400, 200)": ("call", "land_on_black", (-400, 200)),
+}
+
+# how much worse than the baseline still passes: (share, absolute)
+TIME_SLACK = (0.02, 20)  # ms
+POSE_SLACK = (0.10, 2)  # mm
+
+
+def make_world(seed, noise=1.0):
+    """A world with randomized measurement noise and battery voltage.
+
+    `noise` scales every deviation; 0 gives the reference world, with only
+    the gyro noise floor every `World` has.
+    """
+    world = World(limit_ms=300000, seed=seed)
+    if noise:
+        rng = random.Random(seed)
+        world.battery_mv = rng.uniform(7400, 8300)
+        world.gyro_noise = max(world.gyro_noise, 0.1 * noise)
+        world.gyro_drift = rng.gauss(0, 0.02 * noise)
+        world.reflection_noise = 2 * noise
+        world.hsv_noise = 2 * noise
+    return world
+
+
+def run_case(path, case, world):
+    """Run one benchmark case in `world`.
+
+    Returns:
+        tuple: (simulated ms, final pose (x, y, heading), outcome).
+    """
+    if case[0] == "run":
+        world = run_script(path, case[1], world)
+        elapsed = world.elapsed
+    else:
+        namespace = load_script(path, world)
+        namespace["hub"].imu.reset_heading(0)
+        elapsed = call(world, namespace[case[1]], *case[2], **(case[3] if len(case) > 3 else {}))
+    return elapsed, (world.x, world.y, world.heading), world.outcome
+
+
+def table_digest(case):
+    """Checksum of the run table a "run" case drives, or None for helpers.
+
+    Saved with the baseline, so a run edited without re-saving it shows up.
+    """
+    if case[0] != "run":
+        return None
+    namespace = {}
+    with open(os.path.join(ROOT, "run_table.py"), encoding="utf-8") as file:
+        exec(file.read(), namespace)
+    return zlib.crc32(repr(namespace["RUN" + case[1]]).encode())
+
+
+def pose_error(pose, reference):
+    dx, dy = pose[0] - reference[0], pose[1] - reference[1]
+    return math.hypot(dx, dy), abs((pose[2] - reference[2] + 180) % 360 - 180)
+
+
+def percentile(values, share):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(share * len(ordered)))]
+
+
+def bench(path, names, repeats, noise=1.0):
+    """Run every case `repeats` times with seeds 0..repeats-1.
+
+    Pose error is measured against the same case without noise.
+
+    Returns:
+        dict: {case: {"p50", "p95", "pose_p95", "heading_p95", "failures"}}.
+    """
+    results = {}
+    for name in names:
+        case = CASES[name]
+        _, reference, _ = run_case(path, case, make_world(0, noise=0))
+        times, errors, headings, failures = [], [], [], 0
+        for seed in range(repeats):
+            elapsed, pose, outcome = run_case(path, case, make_world(seed, noise))
+            if outcome == "timeout":
+                failures += 1
+            times.append(elapsed)
+            error, heading = pose_error(pose, reference)
+            errors.append(error)
+            headings.append(heading)
+        results[name] = {
+            "p50": round(statistics.median(times), 1),
+            "p95": round(percentile(times, 0.95), 1),
+            "pose_p95": round(percentile(errors, 0.95), 1),
+            "heading_p95": round(percentile(headings, 0.95), 2),
+            "failures": failures,
+        }
+        digest = table_digest(case)
+        if digest is not None:
+            results[name]["table"] = digest
+    return results
+
+
+def regressions(results, baseline):
+    """Return a message for every result worse than its baseline."""
+
+    def worse(value, base, slack):
+        return value > base * (1 + slack[0]) + slack[1]
+
+    found = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        for key in ("p50", "p95"):
+            if worse(result[key], base[key], TIME_SLACK):
+                found.append(f"{name}: {key} {result[key]:.0f} ms, baseline {base[key]:.0f} ms")
+        if worse(result["pose_p95"], base["pose_p95"], POSE_SLACK):
+            found.append(f"{name}: pose error p95 {result['pose_p95']} mm, baseline {base['pose_p95']} mm")
+        if result["failures"] > base["failures"]:
+            found.append(f"{name}: {result['failures']} timeouts, baseline {base['failures']}")
+        if result.get("table") != base.get("table"):
+            found.append(f"{name}: run table changed since the baseline was saved, check and --save it")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m sim.bench",
+        description="Time every run and key helper on a noisy simulated hub and compare to the baseline.",
+    )
+    parser.add_argument("script", nargs="?", default="robot.py", help="hub program (default robot.py)")
+    parser.add_argument("--cases", nargs="*", default=list(CASES), choices=list(CASES), metavar="CASE")
+    parser.add_argument("--repeats", type=int, default=20, help="noisy repetitions per case")
+    parser.add_argument("--noise", type=float, default=1.0, help="scale of sensor noise")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--save", action="store_true", help="store these results as the new baseline")
+    args = parser.parse_args()
+
+    results = bench(args.script, args.cases, args.repeats, args.noise)
+    try:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+    except FileNotFoundError:
+        baseline = {}
+
+    print(f"{'case':<26}{'p50 s':>8}{'p95 s':>8}{'pose mm':>9}{'deg':>7}{'fail':>6}   vs baseline p50")
+    for name, result in results.items():
+        base = baseline.get(name)
+        change = f"{(result['p50'] - base['p50']) / 1000:+8.2f} s" if base else "     new"
+        print(
+            f"{name:<26}{result['p50'] / 1000:8.2f}{result['p95'] / 1000:8.2f}"
+            f"{result['pose_p95']:9.1f}{result['heading_p95']:7.2f}{result['failures']:6d}   {change}"
+        )
+
+    if args.save:
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(baseline, file, indent=2, sort_keys=True)
+            file.write("\n")
+        print(f"saved {args.baseline}")
+        return
+    found = regressions(results, baseline)
+    if found:
+        raise SystemExit("regressions:\n  " + "\n  ".join(found))
+
+
+if __name__ == "__main__":
+    main()
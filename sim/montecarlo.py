@@ -0,0 +1,122 @@
+import argparse
+import multiprocessing
+import os
+import random
+import statistics
+
+from .bench import percentile, pose_error
+from .runner import run_script
+from .world import World
+
+
+def perturb(world, rng, spread=1.0):
+    """Randomize what differs between two tries of the same run on the table.
+
+    `spread` scales every deviation; 0 leaves the world untouched.
+    """
+    if not spread:
+        return world
+    world.x = rng.gauss(0, 2 * spread)
+    world.y = rng.gauss(0, 2 * spread)
+    world.heading = rng.gauss(0, 0.5 * spread)
+    world.slip = abs(rng.gauss(0, 0.005 * spread))
+    world.gyro_drift = rng.gauss(0, 0.03 * spread)
+    world.gyro_noise = max(world.gyro_noise, 0.1 * spread)
+    world.reflection_noise = 2 * spread
+    world.hsv_noise = 2 * spread
+    # the mat under a different light than the CUSTOM_* colors were measured in
+    world.hsv_offset = (rng.gauss(0, 6 * spread), rng.gauss(0, 5 * spread), rng.gauss(0, 5 * spread))
+    world.battery_mv = rng.uniform(7400, 8300)
+    return world
+
+
+def simulate(job):
+    """Run one randomized try; the unit of work handed to the process pool.
+
+    Args:
+        job (tuple): (script, menu entry, speed scale, seed, spread).
+    Returns:
+        tuple: (speed scale, seed, simulated ms, final pose, outcome).
+    """
+    path, selection, scale, seed, spread = job
+    world = World(limit_ms=300000, seed=seed)
+    world.speed_scale = scale
+    perturb(world, random.Random(seed), spread)
+    world = run_script(path, selection, world)
+    return scale, seed, world.elapsed, (world.x, world.y, world.heading), world.outcome
+
+
+def pareto(rows):
+    """Mark rows no other row beats on both success rate and time."""
+
+    def beats(other, row):
+        at_least = other["success"] >= row["success"] and other["p50"] <= row["p50"]
+        return at_least and (other["success"] > row["success"] or other["p50"] < row["p50"])
+
+    return [not any(beats(other, row) for other in rows) for row in rows]
+
+
+def sweep(path, selection, scales, tries, spread=1.0, tolerance=(30, 5), processes=None):
+    """Run `tries` randomized simulations of one run per speed scale.
+
+    A try succeeds when it finishes within the time limit and ends within
+    `tolerance` (mm, degrees) of where the unperturbed run at normal speed
+    ends.
+
+    Returns:
+        list: {"scale", "success", "p50", "p95"} per scale, times in ms.
+    """
+    _, _, _, reference, _ = simulate((path, selection, 1.0, 0, 0))
+    jobs = [(path, selection, scale, seed, spread) for scale in scales for seed in range(tries)]
+    with multiprocessing.Pool(processes) as pool:
+        results = pool.map(simulate, jobs, chunksize=max(1, len(jobs) // (8 * (processes or os.cpu_count()))))
+
+    rows = []
+    for scale in scales:
+        times, passed = [], 0
+        for result_scale, _, elapsed, pose, outcome in results:
+            if result_scale != scale:
+                continue
+            times.append(elapsed)
+            distance, heading = pose_error(pose, reference)
+            if outcome == "done" and distance <= tolerance[0] and heading <= tolerance[1]:
+                passed += 1
+        rows.append(
+            {
+                "scale": scale,
+                "success": passed / len(times),
+                "p50": statistics.median(times),
+                "p95": percentile(times, 0.95),
+            }
+        )
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m sim.montecarlo",
+        description="Success rate against run time of randomized simulations, per drive speed scale.",
+    )
+    parser.add_argument("script", nargs="?", default="robot.py", help="hub program (default robot.py)")
+    parser.add_argument("runs", nargs="*", default=["1", "2", "3", "4"], help="menu entries to sweep")
+    parser.add_argument("--tries", type=int, default=200, help="simulations per run and scale")
+    parser.add_argument("--scales", type=float, nargs="*", default=[0.8, 1.0, 1.2, 1.4], help="speed multipliers")
+    parser.add_argument("--spread", type=float, default=1.0, help="scale of all perturbations")
+    parser.add_argument("--tolerance", type=float, nargs=2, default=(30, 5), metavar=("MM", "DEG"))
+    parser.add_argument("--processes", type=int, help="worker processes (default all cores)")
+    args = parser.parse_args()
+
+    for selection in args.runs:
+        rows = sweep(args.script, selection, args.scales, args.tries, args.spread, args.tolerance, args.processes)
+        print(f"run {selection}: {args.tries} tries per speed scale")
+        print(f"{'scale':>7}{'success':>9}{'p50 s':>8}{'p95 s':>8}")
+        for row, best in zip(rows, pareto(rows)):
+            print(
+                f"{row['scale']:7.2f}{100 * row['success']:8.1f}%{row['p50'] / 1000:8.2f}{row['p95'] / 1000:8.2f}"
+                f"{'  pareto' if best else ''}"
+            )
+        print()
+
+
+if __name__ == "__main__":
+    main()
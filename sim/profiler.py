@@ -0,0 +1,177 @@
+import argparse
+import os
+import sys
+
+from .runner import call, load_script
+from .world import World
+
+# drive helpers in the hub programs that get their own frame
+HELPERS = (
+    "gyro_turn",
+    "gyro_abs",
+    "turn_to",
+    "till_black",
+    "till_blue",
+    "going_down",
+    "straight_time",
+    "curve_time",
+    "turn_time",
+    "wait",
+)
+
+DRIVEBASE_METHODS = ("straight", "turn", "curve", "arc", "drive", "stop", "brake")
+MOTOR_METHODS = ("run", "run_time", "run_angle", "run_target", "run_until_stalled", "stop", "brake", "hold", "dc")
+
+
+class Profiler:
+    """Attribute simulated time to nested helper and device calls.
+
+    Every wrapped call becomes a frame labelled with its name and the line
+    it was called from, so two `gyro_turn` calls in the same run show up
+    separately. Time is read from the world's virtual clock.
+    """
+
+    def __init__(self, world):
+        self.world = world
+        self.stack = []
+        # "run1;gyro_turn (steps.py:115);wait (common.py:364)" -> self time, ms
+        self.folded = {}
+
+    def wrap(self, name, function, describe=None):
+        """Return `function` wrapped so each call gets its own frame.
+
+        Frames are labelled with the calling line, or with whatever
+        `describe(*args, **kwargs)` returns if given.
+        """
+
+        def profiled(*args, **kwargs):
+            if describe:
+                label = describe(*args, **kwargs)
+            else:
+                caller = sys._getframe(1)  # pylint: disable=protected-access
+                label = f"{name} ({os.path.basename(caller.f_code.co_filename)}:{caller.f_lineno})"
+            self.enter(label)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.leave()
+
+        profiled.__wrapped__ = function
+        return profiled
+
+    def instrument(self, namespace):
+        """Wrap the helpers, drive base and motors found in a script's globals.
+
+        Helpers the script imported, e.g. from common.py, are wrapped in
+        their module too, so calls between them get frames as well.
+        """
+        modules = {sys.modules.get(getattr(namespace.get(name), "__module__", None)) for name in HELPERS} - {None}
+        for name in HELPERS:
+            function = namespace.get(name)
+            if callable(function):
+                namespace[name] = self.wrap(name, function)
+                for module in modules:
+                    if getattr(module, name, None) is function:
+                        setattr(module, name, namespace[name])
+        # steps of a run table are labelled by their row instead of the interpreter line
+        steps = sys.modules.get("steps")
+        if steps and namespace.get("run_steps") is getattr(steps, "run_steps", None):
+            steps.do_step = self.wrap("step", steps.do_step, _describe_step)
+        for name, value in list(namespace.items()):
+            kind = type(value).__name__
+            methods = DRIVEBASE_METHODS if kind == "DriveBase" else MOTOR_METHODS if kind == "Motor" else ()
+            for method in methods:
+                setattr(value, method, self.wrap(f"{name}.{method}", getattr(value, method)))
+
+    def enter(self, label):
+        self.stack.append([label, self.world.now, 0.0])
+
+    def leave(self):
+        label, start, children = self.stack.pop()
+        spent = self.world.now - start
+        key = ";".join([frame[0] for frame in self.stack] + [label])
+        self.folded[key] = self.folded.get(key, 0.0) + spent - children
+        if self.stack:
+            self.stack[-1][2] += spent
+
+    def profile(self, function, label):
+        """Call `function` as the root frame `label`, return its total ms."""
+        self.enter(label)
+        try:
+            return call(self.world, function)
+        finally:
+            self.leave()
+
+
+def _describe_step(robot, index, row, background=False):
+    name = sys.modules["steps"].OPS[row[0]]
+    return f"step {index} {name}{' (bg)' if background else ''}"
+
+
+def profile_run(path, selection):
+    """Profile one menu entry of a hub script from a fresh world.
+
+    Returns:
+        Profiler: the profiler, with `folded` filled in and `world.outcome`
+        telling whether the run finished.
+    """
+    world = World()
+    namespace = load_script(path, world)
+    profiler = Profiler(world)
+    profiler.instrument(namespace)
+    # same as the menu does right before starting a run
+    namespace["hub"].imu.reset_heading(0)
+    profiler.profile(namespace[f"run{selection}"], f"run{selection}")
+    return profiler
+
+
+def tree(folded):
+    """Fold stacks back into {label: [total_ms, children]}."""
+    root = {}
+    for stack, spent in folded.items():
+        level = root
+        for label in stack.split(";"):
+            node = level.setdefault(label, [0.0, {}])
+            node[0] += spent
+            level = node[1]
+    return root
+
+
+def print_tree(nodes, total, minimum=0.5, indent=""):
+    """Print a frame tree, widest frames first, hiding tiny ones."""
+    for label, (spent, children) in sorted(nodes.items(), key=lambda item: -item[1][0]):
+        share = 100 * spent / total if total else 0
+        if share < minimum:
+            continue
+        print(f"{share:5.1f}% {spent / 1000:7.2f} s  {indent}{label}")
+        print_tree(children, total, minimum, indent + "  ")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m sim.profiler",
+        description="Break simulated run time down by helper and device call.",
+    )
+    parser.add_argument("script", nargs="?", default="robot.py", help="hub program (default robot.py)")
+    parser.add_argument("runs", nargs="*", default=["1", "2", "3", "4"], help="runs to profile")
+    parser.add_argument("--folded", help="also write folded stacks for flamegraph.pl / speedscope")
+    parser.add_argument("--min", type=float, default=0.5, help="hide frames under this share, percent")
+    args = parser.parse_args()
+
+    lines = []
+    for selection in args.runs:
+        profiler = profile_run(args.script, selection)
+        total = sum(profiler.folded.values())
+        print(f"run {selection}: {total / 1000:.2f} s simulated ({profiler.world.outcome})")
+        print_tree(tree(profiler.folded), total, args.min)
+        print()
+        # flame graph tools want integer sample counts, use microseconds
+        lines += [f"{stack} {round(spent * 1000)}" for stack, spent in profiler.folded.items() if spent >= 0.001]
+
+    if args.folded:
+        with open(args.folded, "w", encoding="utf-8") as out:
+            out.write("\n".join(lines) + "\n")
+
+
+if __name__ == "__main__":
+    main()
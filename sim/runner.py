@@ -0,0 +1,72 @@
+import os
+import sys
+
+from . import install
+from .world import SimTimeout, StopScript, World, activate
+
+
+def _forget_local_modules(folder):
+    """Drop modules imported from `folder` so each run starts fresh."""
+    folder = os.path.abspath(folder)
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None)
+        if path and os.path.dirname(os.path.abspath(path)) == folder:
+            del sys.modules[name]
+
+
+def run_script(path, selection=None, world=None):
+    """Execute a hub script on the simulator.
+
+    The script runs from the top like on the hub. `hub_menu` returns
+    `selection`, or stops the script right there when it is None, which
+    leaves every helper defined without starting a run.
+
+    Args:
+        path (str): Hub program to execute, e.g. "robot.py".
+        selection (str): Menu entry to pick, e.g. "2".
+        world (World): World to run in. A fresh one is made if omitted.
+    Returns:
+        World: the world after the script stopped. `world.outcome` is
+        "done", "menu" or "timeout" and `world.namespace` holds the
+        script's globals.
+    """
+    world = world or World()
+    world.selection = selection
+    install()
+    activate(world)
+
+    folder = os.path.dirname(os.path.abspath(path))
+    _forget_local_modules(folder)
+    if folder not in sys.path:
+        sys.path.insert(1, folder)
+
+    with open(path, encoding="utf-8") as source:
+        code = compile(source.read(), path, "exec")
+    namespace = {"__name__": "__main__", "__file__": path}
+    world.namespace = namespace
+    try:
+        exec(code, namespace)  # pylint: disable=exec-used
+        world.outcome = "done"
+    except StopScript:
+        # back at the menu after the run is as good as the end of the script
+        world.outcome = "menu" if world.started is None else "done"
+    except SimTimeout:
+        world.outcome = "timeout"
+    return world
+
+
+def load_script(path, world=None):
+    """Return the globals of a hub script, stopped at its run menu."""
+    return run_script(path, None, world).namespace
+
+
+def call(world, function, *args, **kwargs):
+    """Call a loaded helper or run and return the simulated ms it took."""
+    activate(world)
+    start = world.now
+    try:
+        function(*args, **kwargs)
+        world.outcome = "done"
+    except SimTimeout:
+        world.outcome = "timeout"
+    return world.now - start
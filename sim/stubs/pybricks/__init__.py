@@ -0,0 +1 @@
+# Host-side stand-in for the pybricks firmware modules, see sim/world.py.
@@ -0,0 +1,120 @@
+import math
+
+from sim import world as _world
+from .parameters import Side
+
+
+class _IMU:
+    def __init__(self, world):
+        self._world = world
+
+    def _heading(self):
+        world = self._world
+        return world.heading + world.gyro_drift * world.now / 1000
+
+    def heading(self):
+        self._world.tick()
+        return self._heading() + self._world.imu_offset + self._world.noise(self._world.gyro_noise)
+
+    def reset_heading(self, angle):
+        self._world.imu_offset = angle - self._heading()
+
+    def tilt(self, calibrated=True):
+        self._world.tick()
+        pitch, roll = self._world.tilt
+        return int(pitch), int(roll)
+
+    def angular_velocity(self, axis=None, calibrated=True):
+        world = self._world
+        world.tick()
+        rate = -world.turn_rate - world.gyro_drift + world.noise(world.gyro_noise)
+        if axis is None:
+            return (0.0, 0.0, rate)
+        return rate
+
+    def acceleration(self, axis=None, calibrated=True):
+        self._world.tick()
+        pitch, roll = self._world.tilt
+        g = 9806.65
+        vector = (
+            -g * math.sin(math.radians(pitch)),
+            g * math.sin(math.radians(roll)),
+            g * math.cos(math.radians(pitch)) * math.cos(math.radians(roll)),
+        )
+        return vector if axis is None else vector[2]
+
+    def ready(self):
+        return True
+
+    def stationary(self):
+        return abs(self._world.speed) < 1 and abs(self._world.turn_rate) < 1
+
+    def up(self, calibrated=True):
+        return Side.TOP
+
+    def settings(self, *args, **kwargs):
+        pass
+
+
+class _Battery:
+    def __init__(self, world):
+        self._world = world
+
+    def voltage(self):
+        self._world.tick()
+        return int(self._world.battery_mv)
+
+    def current(self):
+        return 150
+
+
+class _Buttons:
+    def __init__(self, world):
+        self._world = world
+
+    def pressed(self):
+        self._world.tick()
+        return set(self._world.buttons)
+
+
+class _Speaker:
+    def __init__(self, world):
+        self._world = world
+
+    def volume(self, *args):
+        return 100
+
+    def beep(self, frequency=500, duration=100):
+        self._world.advance(duration)
+
+    def play_notes(self, notes, tempo=120):
+        self._world.advance(len(notes) * 60000 / tempo / 4)
+
+
+class _Silent:
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class _System:
+    def set_stop_button(self, button):
+        pass
+
+    def info(self):
+        return {"name": "sim", "reset_reason": 0, "host_connected_ble": True}
+
+    def shutdown(self):
+        raise SystemExit()
+
+
+class PrimeHub:
+    def __init__(self, top_side=Side.TOP, front_side=Side.FRONT,
+                 broadcast_channel=None, observe_channels=()):
+        world = _world.current()
+        self.imu = _IMU(world)
+        self.battery = _Battery(world)
+        self.buttons = _Buttons(world)
+        self.speaker = _Speaker(world)
+        self.display = _Silent()
+        self.light = _Silent()
+        self.system = _System()
@@ -0,0 +1,90 @@
+class _Constant:
+    def __init__(self, kind, name):
+        self.kind = kind
+        self.name = name
+
+    def __repr__(self):
+        return "{}.{}".format(self.kind, self.name)
+
+
+def _constants(cls, names):
+    for name in names:
+        setattr(cls, name, _Constant(cls.__name__, name))
+    return cls
+
+
+class Port:
+    pass
+
+
+class Stop:
+    pass
+
+
+class Direction:
+    pass
+
+
+class Button:
+    pass
+
+
+class Side:
+    pass
+
+
+class Axis:
+    pass
+
+
+class Icon:
+    pass
+
+
+_constants(Port, ("A", "B", "C", "D", "E", "F"))
+_constants(Stop, ("COAST", "COAST_SMART", "BRAKE", "HOLD", "NONE"))
+_constants(Direction, ("CLOCKWISE", "COUNTERCLOCKWISE"))
+_constants(Button, ("LEFT", "RIGHT", "CENTER", "BLUETOOTH", "UP", "DOWN"))
+_constants(Side, ("TOP", "BOTTOM", "LEFT", "RIGHT", "FRONT", "BACK"))
+_constants(Axis, ("X", "Y", "Z"))
+_constants(Icon, (
+    "UP", "DOWN", "LEFT", "RIGHT", "HAPPY", "SAD", "HEART", "PAUSE", "EMPTY",
+    "FULL", "SQUARE", "CIRCLE", "CLOCKWISE", "COUNTERCLOCKWISE", "TRUE", "FALSE",
+    "ARROW_UP", "ARROW_DOWN", "ARROW_LEFT", "ARROW_RIGHT",
+))
+
+
+class Color:
+    """Hue (deg), saturation (%) and value (%), compared like on the hub."""
+
+    def __init__(self, h, s=100, v=100):
+        self.h = int(h) % 360
+        self.s = max(0, min(int(s), 100))
+        self.v = max(0, min(int(v), 100))
+
+    def __iter__(self):
+        return iter((self.h, self.s, self.v))
+
+    def __eq__(self, other):
+        return isinstance(other, Color) and tuple(self) == tuple(other)
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __repr__(self):
+        return "Color(h={}, s={}, v={})".format(self.h, self.s, self.v)
+
+
+Color.NONE = Color(0, 0, 0)
+Color.BLACK = Color(0, 0, 10)
+Color.GRAY = Color(0, 0, 50)
+Color.WHITE = Color(0, 0, 100)
+Color.RED = Color(0, 100, 100)
+Color.ORANGE = Color(30, 100, 100)
+Color.BROWN = Color(30, 100, 50)
+Color.YELLOW = Color(60, 100, 100)
+Color.GREEN = Color(120, 100, 100)
+Color.CYAN = Color(180, 100, 100)
+Color.BLUE = Color(240, 100, 100)
+Color.VIOLET = Color(270, 100, 100)
+Color.MAGENTA = Color(300, 100, 100)
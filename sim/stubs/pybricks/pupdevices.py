@@ -0,0 +1,234 @@
+import math
+
+from sim import world as _world
+from .parameters import Color, Direction, Stop
+
+# no-load speed of a SPIKE motor at the motor shaft, deg/s
+MAX_SPEED = 1050
+
+
+def _gear_ratio(gears):
+    if not gears:
+        return 1
+    trains = gears if isinstance(gears[0], (list, tuple)) else [gears]
+    ratio = 1
+    for train in trains:
+        ratio *= train[-1] / train[0]
+    return ratio
+
+
+class Motor:
+    """Motor with a rotation sensor, moving instantly at its commanded speed.
+
+    Angles and speeds are at the output of the gear train, like on the hub.
+    Mechanical stops come from `World.limits` for the motor's port.
+    """
+
+    def __init__(self, port, positive_direction=Direction.CLOCKWISE, gears=None,
+                 reset_angle=True, profile=None):
+        self._world = _world.current()
+        self.port = port
+        self.max_speed = MAX_SPEED / _gear_ratio(gears)
+        self._angle = 0.0
+        self._speed = 0.0
+        self._mode = None
+        self._command = 0.0
+        self._goal = None
+        self._end = None
+        self._stall_at = None
+        self._stalled = False
+        # set when a DriveBase takes over this motor
+        self.drivebase = None
+        self._world.add(self)
+
+    def step(self, dt):
+        if self.drivebase is not None or self._mode is None:
+            return
+        if self._mode == "time" and self._world.now + dt >= self._end:
+            self._finish()
+            return
+        if self._mode == "stall" and self._stall_at is not None and self._world.now >= self._stall_at:
+            self._stall()
+            return
+
+        move = self._command * dt / 1000
+        if self._mode == "target" and abs(self._goal - self._angle) <= abs(move):
+            self._angle = self._goal
+            self._finish()
+            return
+
+        low, high = self._world.limits.get(self.port.name, (-math.inf, math.inf))
+        angle = self._angle + move
+        if angle <= low or angle >= high:
+            self._angle = min(max(angle, low), high)
+            self._stall()
+            return
+        self._angle = angle
+        self._speed = self._command
+        self._stalled = False
+
+    def _start(self, mode, speed):
+        self._world.tick()
+        self._mode = mode
+        limit = self.max_speed * self._world.power()
+        self._command = max(-limit, min(limit, speed))
+        self._speed = self._command
+        self._stalled = False
+        self._stall_at = None
+
+    def _finish(self):
+        self._mode = None
+        self._speed = 0.0
+
+    def _stall(self):
+        self._speed = 0.0
+        self._stalled = True
+        if self._mode in ("target", "stall"):
+            self._mode = None
+
+    def _block(self, wait):
+        if wait:
+            self._world.wait_until(self.done)
+
+    def angle(self):
+        self._world.tick()
+        return int(round(self._angle))
+
+    def speed(self, window=100):
+        self._world.tick()
+        return int(self._speed)
+
+    def load(self):
+        self._world.tick()
+        if self._stalled:
+            return 200
+        return 20 if self._speed else 0
+
+    def stalled(self):
+        return self._stalled
+
+    def done(self):
+        return self._mode is None or self._mode == "run" and self._stalled
+
+    def reset_angle(self, angle=None):
+        self._angle = 0.0 if angle is None else float(angle)
+
+    def stop(self):
+        self._finish()
+
+    def brake(self):
+        self._finish()
+
+    def hold(self):
+        self._finish()
+
+    def dc(self, duty):
+        self._start("run", self.max_speed * duty / 100)
+
+    def run(self, speed):
+        self._start("run", speed)
+
+    def run_time(self, speed, time, then=Stop.HOLD, wait=True):
+        self._start("time", speed)
+        self._end = self._world.now + time
+        self._block(wait)
+
+    def run_angle(self, speed, rotation_angle, then=Stop.HOLD, wait=True):
+        self.run_target(speed, self._angle + math.copysign(rotation_angle, speed * rotation_angle), then, wait)
+
+    def run_target(self, speed, target_angle, then=Stop.HOLD, wait=True):
+        self._start("target", math.copysign(abs(speed), target_angle - self._angle))
+        self._goal = target_angle
+        self._block(wait)
+
+    def run_until_stalled(self, speed, then=Stop.COAST, duty_limit=None):
+        self._start("stall", speed)
+        if self.port.name not in self._world.limits:
+            self._stall_at = self._world.now + self._world.free_stall_ms
+        self._world.wait_until(self.done)
+        return self.angle()
+
+    def track_target(self, target_angle):
+        self._angle = float(target_angle)
+
+
+def _cone(hsv):
+    h, s, v = hsv
+    chroma = s * v / 100
+    return (
+        chroma * math.cos(math.radians(h)),
+        chroma * math.sin(math.radians(h)),
+        v,
+    )
+
+
+class ColorSensor:
+    """Color sensor that sees the field if its port is in `World.mounts`.
+
+    Any other sensor looks at the attachment and reports `World.attachment`.
+    """
+
+    # spread of the light spot used to blend reflection across edges, mm
+    SPOT = 3
+
+    def __init__(self, port):
+        self._world = _world.current()
+        self.port = port
+        self._colors = [Color.RED, Color.YELLOW, Color.GREEN, Color.BLUE, Color.WHITE, Color.NONE]
+
+    def _surface(self, dx=0, dy=0):
+        if self.port.name not in self._world.mounts:
+            h, s, v = self._world.attachment
+            return h, s, v, v
+        x, y = self._world.sensor_position(self.port.name)
+        return self._world.field.surface(x + dx, y + dy)
+
+    def hsv(self, surface=True):
+        world = self._world
+        world.tick()
+        h, s, v, _ = self._surface()
+        if self.port.name in world.mounts:
+            dh, ds, dv = world.hsv_offset
+            h, s, v = h + dh, s + ds, v + dv
+        if world.hsv_noise:
+            h, s, v = (value + world.noise(world.hsv_noise) for value in (h, s, v))
+        return Color(int(h) % 360, int(min(100, max(0, s))), int(min(100, max(0, v))))
+
+    def reflection(self):
+        self._world.tick()
+        spot = self.SPOT
+        points = ((0, 0), (spot, 0), (-spot, 0), (0, spot), (0, -spot))
+        value = sum(self._surface(dx, dy)[3] for dx, dy in points) / len(points)
+        value += self._world.noise(self._world.reflection_noise)
+        return int(min(100, max(0, value)))
+
+    def ambient(self):
+        self._world.tick()
+        return 5
+
+    def color(self, surface=True):
+        measured = _cone(tuple(self.hsv()))
+
+        def distance(color):
+            return sum((a - b) ** 2 for a, b in zip(measured, _cone(tuple(color))))
+
+        return min(self._colors, key=distance)
+
+    def detectable_colors(self, *args):
+        if not args:
+            return tuple(self._colors)
+        self._colors = list(args[0])
+        return None
+
+    @property
+    def lights(self):
+        return _Lights()
+
+
+class _Lights:
+    def on(self, *args):
+        pass
+
+    def off(self):
+        pass
+
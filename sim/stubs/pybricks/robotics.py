@@ -0,0 +1,290 @@
+import math
+
+from sim import world as _world
+from .parameters import Stop
+
+# deceleration when the wheels are released with stop(), mm/s²
+COAST_DECEL = 2000
+
+
+def _approach(value, target, step):
+    if value < target:
+        return min(target, value + step)
+    return max(target, value - step)
+
+
+def _pair(value):
+    return tuple(value) if isinstance(value, (tuple, list)) else (value, value)
+
+
+class DriveBase:
+    """Drive base with trapezoidal speed profiles on a virtual clock.
+
+    Maneuvers ramp up with the configured acceleration and brake just in
+    time to end on target, or keep rolling with `Stop.NONE`. The robot pose
+    lives in the world so the IMU and floor sensors follow it.
+    """
+
+    def __init__(self, left_motor, right_motor, wheel_diameter, axle_track):
+        self._world = _world.current()
+        self._wheels = (left_motor, right_motor)
+        for motor in self._wheels:
+            motor.drivebase = self
+        self.wheel_diameter = wheel_diameter
+        self.axle_track = axle_track
+
+        max_speed = left_motor.max_speed / 360 * math.pi * wheel_diameter
+        self.max_speed = max_speed
+        self.max_turn_rate = math.degrees(max_speed / (axle_track / 2))
+        # about 40% of the maximum, like the firmware defaults
+        self._settings = [
+            int(max_speed * 0.4),
+            _pair(int(max_speed * 1.6)),
+            int(self.max_turn_rate * 0.4),
+            _pair(int(self.max_turn_rate * 1.6)),
+        ]
+
+        self._mode = "hold"
+        self._command = (0.0, 0.0)
+        self._maneuver = None
+        self._distance = 0.0
+        self._angle = 0.0
+        self._gyro = False
+        self._world.add(self)
+
+    def settings(self, *args, **kwargs):
+        if not args and not kwargs:
+            speed, acceleration, turn_rate, turn_acceleration = self._settings
+            return (speed, acceleration[0], turn_rate, turn_acceleration[0])
+        names = ("straight_speed", "straight_acceleration", "turn_rate", "turn_acceleration")
+        values = dict(zip(names, args))
+        values.update(kwargs)
+        for index, name in enumerate(names):
+            value = values.get(name)
+            if value is None:
+                continue
+            if index % 2:
+                self._settings[index] = _pair(value)
+            else:
+                limit = self.max_speed if index == 0 else self.max_turn_rate
+                self._settings[index] = min(abs(value), limit)
+        return None
+
+    def _limits(self):
+        """The settings with speeds multiplied by the world's speed_scale."""
+        speed, acceleration, turn_rate, turn_acceleration = self._settings
+        scale = self._world.speed_scale
+        return (
+            min(speed * scale, self.max_speed),
+            acceleration,
+            min(turn_rate * scale, self.max_turn_rate),
+            turn_acceleration,
+        )
+
+    def use_gyro(self, use_gyro):
+        self._gyro = use_gyro
+
+    def drive(self, speed, turn_rate):
+        self._world.tick()
+        self._mode = "drive"
+        self._maneuver = None
+        scale = self._world.speed_scale
+        self._command = (speed * scale, turn_rate * scale)
+
+    def stop(self):
+        self._world.tick()
+        self._mode = "coast"
+        self._maneuver = None
+
+    def brake(self):
+        self._world.tick()
+        self._hold()
+
+    def straight(self, distance, then=Stop.HOLD, wait=True):
+        speed, acceleration, _, _ = self._limits()
+        self._start(distance, 1, speed, acceleration, then, wait)
+
+    def turn(self, angle, then=Stop.HOLD, wait=True):
+        _, _, turn_rate, turn_acceleration = self._limits()
+        self._start(angle, 0, turn_rate, turn_acceleration, then, wait)
+
+    def curve(self, radius, angle, then=Stop.HOLD, wait=True):
+        if radius == 0:
+            self.turn(angle, then, wait)
+            return
+        speed, acceleration, turn_rate, turn_acceleration = self._limits()
+        # the sign of angle picks forward or backward, the sign of radius
+        # right or left, so the heading changes by angle times that sign
+        # and the robot travels radius mm per degree of heading change
+        ratio = radius * math.pi / 180
+        limit = min(turn_rate, speed / abs(ratio))
+        rates = tuple(min(t, a / abs(ratio)) for t, a in zip(turn_acceleration, acceleration))
+        self._start(angle if radius > 0 else -angle, ratio, limit, rates, then, wait)
+
+    def arc(self, radius, angle=None, distance=None, then=Stop.HOLD, wait=True):
+        if (angle is None) == (distance is None) or radius == 0:
+            raise ValueError("give either angle or distance, and a nonzero radius")
+        if angle is None:
+            angle = math.degrees(distance / abs(radius))
+        self.curve(radius, angle, then, wait)
+
+    def done(self):
+        return self._maneuver is None
+
+    def stalled(self):
+        return False
+
+    def distance(self):
+        return int(self._distance)
+
+    def angle(self):
+        return int(self._angle)
+
+    def state(self):
+        return (int(self._distance), int(self._world.speed), int(self._angle), int(self._world.turn_rate))
+
+    def reset(self, distance=0, angle=0):
+        self._distance = distance
+        self._angle = angle
+
+    def _hold(self):
+        self._mode = "hold"
+        self._maneuver = None
+        self._world.speed = 0.0
+        self._world.turn_rate = 0.0
+
+    def _start(self, target, ratio, limit, acceleration, then, wait):
+        """Begin a profiled move of `target` degrees, or mm if `ratio` is 1.
+
+        `ratio` converts the profiled quantity into forward travel: 1 for
+        straight moves, 0 for turns in place and mm/deg for curves.
+        """
+        self._world.tick()
+        self._begin(target, ratio, limit, acceleration, then)
+        if wait:
+            self._world.wait_until(self.done)
+
+    def _begin(self, target, ratio, limit, acceleration, then):
+        direction = 1 if target >= 0 else -1
+        if ratio == 1:
+            current = self._world.speed
+        elif ratio == 0:
+            current = self._world.turn_rate
+        else:
+            # a curve picks up the forward speed of whatever came before
+            current = self._world.speed / ratio
+        # keep the speed we already have along the new path, for Stop.NONE chains
+        rate = current * direction
+        decelerate = _pair(acceleration)[1]
+        end_rate = limit if then == Stop.NONE else 0
+        self._mode = "maneuver"
+        self._maneuver = {
+            "left": abs(target),
+            "direction": direction,
+            "ratio": ratio,
+            "limit": limit,
+            "acceleration": _pair(acceleration),
+            "rate": max(0.0, rate),
+            "then": then,
+        }
+        if rate < 0 or rate ** 2 > end_rate ** 2 + 2 * decelerate * abs(target) + 1e-6:
+            # moving away or too fast to end on target: brake to a stop
+            # first, then go back over whatever was covered meanwhile
+            self._maneuver.update(brake=current, target=target, covered=0.0)
+
+    def step(self, dt):
+        seconds = dt / 1000
+        world = self._world
+        if self._mode == "maneuver":
+            self._step_maneuver(seconds)
+        elif self._mode == "drive":
+            _, acceleration, _, turn_acceleration = self._settings
+            speed, turn_rate = self._command
+            # a flat battery caps the wheel speed
+            limit = self.max_speed * world.power()
+            speed = max(-limit, min(limit, speed))
+            limit = self.max_turn_rate * world.power()
+            turn_rate = max(-limit, min(limit, turn_rate))
+            world.speed = _approach(world.speed, speed, acceleration[0] * seconds)
+            world.turn_rate = _approach(world.turn_rate, turn_rate, turn_acceleration[0] * seconds)
+        elif self._mode == "coast":
+            _, _, _, turn_acceleration = self._settings
+            world.speed = _approach(world.speed, 0, COAST_DECEL * seconds)
+            world.turn_rate = _approach(world.turn_rate, 0, turn_acceleration[1] * seconds)
+            if not world.speed and not world.turn_rate:
+                self._mode = "hold"
+        else:
+            world.speed = world.turn_rate = 0.0
+
+        distance = world.speed * seconds
+        angle = world.turn_rate * seconds
+        self._distance += distance
+        self._angle += angle
+        # with the gyro in use, turns are measured on the robot and not the wheels
+        world.move(distance * (1 - world.slip), angle if self._gyro else angle * (1 - world.slip))
+
+        # wheel angles follow the chassis
+        per_mm = 360 / (math.pi * self.wheel_diameter)
+        spin = math.radians(self._angle) * self.axle_track / 2
+        left, right = self._wheels
+        left._angle = (self._distance + spin) * per_mm
+        right._angle = (self._distance - spin) * per_mm
+        left._speed = (world.speed + math.radians(world.turn_rate) * self.axle_track / 2) * per_mm
+        right._speed = (world.speed - math.radians(world.turn_rate) * self.axle_track / 2) * per_mm
+
+    def _step_maneuver(self, seconds):
+        m = self._maneuver
+        accelerate, decelerate = m["acceleration"]
+        if "brake" in m:
+            m["brake"] = _approach(m["brake"], 0, decelerate * seconds)
+            m["covered"] += m["brake"] * seconds
+            self._apply(m["brake"], m["ratio"])
+            if not m["brake"]:
+                self._begin(m["target"] - m["covered"], m["ratio"], m["limit"], m["acceleration"], m["then"])
+            return
+        end_rate = m["limit"] if m["then"] == Stop.NONE else 0
+        # fastest rate from which we can still slow down to end_rate in time
+        allowed = math.sqrt(end_rate ** 2 + 2 * decelerate * m["left"])
+        ceiling = min(m["limit"], self._rate_cap(m["ratio"]))
+        if m["rate"] > ceiling:
+            # came in faster than this move allows: slow down to its limit
+            rate = max(ceiling, m["rate"] - decelerate * seconds)
+        else:
+            rate = min(ceiling, m["rate"] + accelerate * seconds)
+        rate = min(rate, allowed)
+        travel = rate * seconds
+        if travel >= m["left"]:
+            # finish exactly on target by shortening the last step
+            rate = m["left"] / seconds if seconds else 0
+            m["left"] = 0
+        else:
+            m["left"] -= travel
+        m["rate"] = rate
+        self._apply(rate * m["direction"], m["ratio"])
+
+        if m["left"] <= 0:
+            if m["then"] == Stop.NONE:
+                # keep rolling at the final rate until told otherwise
+                self._mode = "drive"
+                self._maneuver = None
+                self._command = (self._world.speed, self._world.turn_rate)
+            else:
+                self._maneuver = None
+                self._mode = "hold"
+
+    def _rate_cap(self, ratio):
+        """Fastest maneuver rate the battery allows along a path."""
+        power = self._world.power()
+        if ratio == 1:
+            return self.max_speed * power
+        if ratio == 0:
+            return self.max_turn_rate * power
+        return min(self.max_turn_rate, self.max_speed / abs(ratio)) * power
+
+    def _apply(self, rate, ratio):
+        if ratio == 1:
+            self._world.speed, self._world.turn_rate = rate, 0.0
+        elif ratio == 0:
+            self._world.speed, self._world.turn_rate = 0.0, rate
+        else:
+            self._world.speed, self._world.turn_rate = rate * ratio, rate
@@ -0,0 +1,57 @@
+from sim import world as _world
+from sim.world import StopScript
+
+
+def wait(time):
+    """Pause the program by advancing the virtual clock."""
+    _world.current().advance(time)
+
+
+class StopWatch:
+    def __init__(self):
+        self._world = _world.current()
+        self._start = self._world.now
+        self._paused = None
+
+    def time(self):
+        now = self._paused if self._paused is not None else self._world.now
+        return int(now - self._start)
+
+    def pause(self):
+        if self._paused is None:
+            self._paused = self._world.now
+
+    def resume(self):
+        if self._paused is not None:
+            self._start += self._world.now - self._paused
+            self._paused = None
+
+    def reset(self):
+        self._start = self._world.now
+        if self._paused is not None:
+            self._paused = self._world.now
+
+
+def hub_menu(*symbols):
+    """Return the world's preselected entry, or stop the script here.
+
+    A script that comes back to its menu after the run is stopped there too.
+    """
+    world = _world.current()
+    if world.selection is None or world.started is not None:
+        raise StopScript()
+    if world.selection not in symbols:
+        raise ValueError("{!r} is not in the menu {!r}".format(world.selection, symbols))
+    world.started = world.now
+    return world.selection
+
+
+def read_input_byte(last=False, chr=False):  # pylint: disable=redefined-builtin
+    """Take the next byte the laptop sent, see `World.stdin`, or None."""
+    stdin = _world.current().stdin
+    if not stdin:
+        return None
+    if last:
+        del stdin[:-1]
+    byte = stdin.pop(0)
+    return bytes([byte]).decode() if chr else byte
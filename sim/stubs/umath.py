@@ -0,0 +1,2 @@
+# MicroPython's math module on the hub.
+from math import *  # noqa: F401,F403  pylint: disable=wildcard-import,unused-wildcard-import
@@ -0,0 +1,210 @@
+import math
+import random
+
+
+class SimTimeout(Exception):
+    """Raised when the virtual clock runs past the world's time limit."""
+
+
+class StopScript(Exception):
+    """Raised to stop a script at its run menu without starting a run."""
+
+
+# Surfaces as (h, s, v, reflection)
+WHITE = (0, 0, 100, 95)
+BLACK = (0, 0, 5, 5)
+BLUE = (216, 88, 27, 22)
+
+# battery voltage at which the motors reach their full speed, mV
+FULL_POWER_MV = 8000
+
+
+class Field:
+    """Mat seen by the floor-facing color sensors.
+
+    The mat is a background surface with axis-aligned rectangles painted on
+    it. Rectangles added later are drawn on top of earlier ones.
+    """
+
+    def __init__(self, background=WHITE):
+        self.background = background
+        self.rects = []
+        self.grid = None
+
+    def add_rect(self, x0, y0, x1, y1, surface):
+        """Paint a rectangle (mm, field coordinates) with a surface."""
+        self.rects.append((min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1), surface))
+
+    def add_grid(self, spacing, width, surface, offset=0):
+        """Paint lines in both directions every `spacing` mm."""
+        self.grid = (spacing, width, surface, offset)
+
+    def surface(self, x, y):
+        """Return the (h, s, v, reflection) surface at a point."""
+        for x0, y0, x1, y1, surface in reversed(self.rects):
+            if x0 <= x <= x1 and y0 <= y <= y1:
+                return surface
+        if self.grid:
+            spacing, width, surface, offset = self.grid
+            if (x - offset) % spacing < width or (y - offset) % spacing < width:
+                return surface
+        return self.background
+
+    @classmethod
+    def default(cls):
+        """Generic mat where every heading crosses black and blue lines.
+
+        Without a measured field map this keeps line-following helpers such
+        as `till_black` and `till_blue` terminating wherever a run drives.
+        """
+        field = cls()
+        field.add_grid(300, 20, BLACK, offset=150)
+        for i in range(-10, 10):
+            # blue stripes halfway between the black lines, clear of the
+            # start at the origin so driving straight off it crosses lines
+            field.add_rect(i * 600 + 290, -6000, i * 600 + 310, 6000, BLUE)
+            field.add_rect(-6000, i * 600 + 290, 6000, i * 600 + 310, BLUE)
+        return field
+
+
+class World:
+    """Virtual clock and physical state of the simulated robot.
+
+    Devices created by the pybricks stand-ins register themselves here and
+    are stepped forward whenever the clock advances, so blocking calls like
+    `wait()` or `cutie.straight()` cost no real time.
+
+    Args:
+        limit_ms (int): Simulated time after which `SimTimeout` is raised.
+        step_ms (float): Integration step of the physics model.
+        seed (int): Seed for the measurement noise, see `noise`.
+    """
+
+    # Cost of one device call, so busy loops without wait() still age
+    call_cost_ms = 0.02
+
+    def __init__(self, limit_ms=600000, step_ms=2, seed=0):
+        self.now = 0.0
+        self.limit_ms = limit_ms
+        self.step_ms = step_ms
+
+        # pose of the robot on the field, heading in degrees clockwise
+        self.x = 0.0
+        self.y = 0.0
+        self.heading = 0.0
+        self.speed = 0.0
+        self.turn_rate = 0.0
+        self.tilt = (0, 0)
+
+        self.imu_offset = 0.0
+        self.battery_mv = 8000
+        self.buttons = set()
+
+        # measurement noise as standard deviations, drawn from the seeded
+        # `random` so runs stay repeatable. The gyro never reads perfectly
+        # still: without that floor gyro_turn's bias can circle the target
+        # until its max_time instead of settling like on the hub.
+        self.gyro_noise = 0.02  # degrees, per heading or rate reading
+        self.gyro_drift = 0.0  # degrees per second the heading creeps by
+        self.reflection_noise = 0.0  # percent, per reflection reading
+        self.hsv_noise = 0.0  # degrees of hue and percent of saturation and value
+        # mat colors off from what the sensors were calibrated on, (h, s, v)
+        self.hsv_offset = (0, 0, 0)
+        # share of wheel travel lost to slipping, so odometry overestimates
+        self.slip = 0.0
+        # multiplies drive base speeds and turn rates, from settings and
+        # drive(), to try faster runs
+        self.speed_scale = 1.0
+        self.random = random.Random(seed)
+
+        self.field = Field.default()
+        # floor sensors mounted at (forward, right) mm from the axle center
+        self.mounts = {"B": (70, 0)}
+        # color shown to every sensor that is not in `mounts`
+        self.attachment = (0, 100, 100)
+        # mechanical stops (low, high) in output degrees, per motor port
+        self.limits = {}
+        # run_until_stalled on a motor without limits stalls after this long
+        self.free_stall_ms = 1000
+
+        # bytes waiting on the hub's stdin, as sent by python -m tools.push
+        self.stdin = bytearray()
+
+        self.selection = None
+        self.started = None
+        self.bodies = []
+
+    def add(self, body):
+        """Register a device that has a `step(dt)` method."""
+        self.bodies.append(body)
+
+    def noise(self, deviation):
+        """Return a random measurement error with the given deviation."""
+        return self.random.gauss(0, deviation) if deviation else 0.0
+
+    def power(self):
+        """Share of the full motor speed the battery can deliver."""
+        return min(1.0, self.battery_mv / FULL_POWER_MV)
+
+    def tick(self):
+        """Charge the cost of one device call to the clock."""
+        self.now += self.call_cost_ms
+        self._check_limit()
+
+    def advance(self, ms):
+        """Move the clock forward by `ms`, stepping every device."""
+        end = self.now + max(0, ms)
+        while self.now < end:
+            dt = min(self.step_ms, end - self.now)
+            for body in self.bodies:
+                body.step(dt)
+            self.now += dt
+            self._check_limit()
+
+    def wait_until(self, done):
+        """Advance the clock until `done()` returns True."""
+        while not done():
+            self.advance(self.step_ms)
+
+    def move(self, distance, angle):
+        """Apply a displacement along the current heading and a rotation."""
+        # drive along the mean heading over the step
+        mid = math.radians(self.heading + angle / 2)
+        self.x += distance * math.cos(mid)
+        self.y += distance * math.sin(mid)
+        self.heading += angle
+
+    def sensor_position(self, port):
+        """Return the field position of a floor sensor."""
+        forward, right = self.mounts[port]
+        h = math.radians(self.heading)
+        return (
+            self.x + forward * math.cos(h) - right * math.sin(h),
+            self.y + forward * math.sin(h) + right * math.cos(h),
+        )
+
+    @property
+    def elapsed(self):
+        """Simulated milliseconds since the run was picked from the menu."""
+        return self.now - (self.started or 0)
+
+    def _check_limit(self):
+        if self.now > self.limit_ms:
+            raise SimTimeout(f"simulation passed {self.limit_ms} ms")
+
+
+_current = None
+
+
+def current():
+    """Return the world new devices attach to."""
+    if _current is None:
+        activate(World())
+    return _current
+
+
+def activate(world):
+    """Make `world` the one new devices attach to."""
+    global _current
+    _current = world
+    return world
@@ -0,0 +1,163 @@
+from pybricks.parameters import Stop
+from mission import Task, run_tasks, sleep, until_done
+from settle import settle_drive, settle_motor
+from telemetry import recording, tick, wait, wait_done
+
+# Op codes of the compiled run table, in table order. tools/stepc.py
+# compiles missions.py into run_table.py using these.
+OPS = (
+    "straight",
+    "turn",
+    "curve",
+    "run_time",
+    "run_angle",
+    "run_until_stalled",
+    "wait",
+    "join",
+    "reset_heading",
+    "use_gyro",
+    "gyro_turn",
+    "gyro_abs",
+    "turn_to",
+    "till_black",
+    "till_blue",
+    "going_down",
+    "straight_time",
+    "curve_time",
+    "turn_time",
+    "settle",
+    "go_to",
+    "home",
+    "move_to",
+    "push",
+)
+
+# then-modes; 0 leaves the op's default and BG runs the step in the background
+THEN = (None, "HOLD", "BRAKE", "COAST", "NONE", "BG")
+BG = 5
+STOPS = (None, Stop.HOLD, Stop.BRAKE, Stop.COAST, Stop.NONE)
+
+# first argument of the motor ops
+MOTORS = ("left_motor", "right_motor")
+MOTOR_OPS = ("run_time", "run_angle", "run_until_stalled")
+
+# first argument of the attachment ops, see attachment.py
+ATTACHMENTS = ("left_arm", "right_arm")
+ATTACHMENT_OPS = ("home", "move_to", "push")
+
+# first argument of settle, the device to wait for
+DEVICES = ("cutie",) + MOTORS
+
+# ops that accept a then-mode, and those that can also run in the background
+THEN_OPS = ("straight", "turn", "curve", "run_time", "run_angle", "turn_to")
+BG_OPS = ("straight", "turn", "curve", "run_time", "run_angle", "wait", "move_to", "push")
+
+
+def do_step(robot, index, row, background=False):
+    """Execute one row of a run table.
+
+    Args:
+        robot (dict): Globals of the hub program, with `hub`, `cutie`, the
+            motors, the attachments and the helpers the ops are named after.
+        index (int): Position of the row in its table.
+        row (tuple): (op, args, settings, then, after) as compiled.
+        background (bool): Start the motion without waiting for it.
+    Returns:
+        The drive base, motor or attachment that is moving, for background
+        rows.
+    """
+    op, args, settings, then = row[0], row[1], row[2], row[3]
+    name = OPS[op]
+    cutie = robot["cutie"]
+    if settings:
+        cutie.settings(*settings)
+
+    kwargs = {}
+    if args and isinstance(args[-1], dict):
+        kwargs = dict(args[-1])
+        args = args[:-1]
+    if then and then != BG:
+        kwargs["then"] = STOPS[then]
+
+    if name in MOTOR_OPS:
+        device = robot[MOTORS[args[0]]]
+        args = args[1:]
+    elif name in ATTACHMENT_OPS:
+        device = robot[ATTACHMENTS[args[0]]]
+        args = args[1:]
+    elif name in ("straight", "turn", "curve"):
+        device = cutie
+    elif name == "wait":
+        if not background:
+            wait(args[0])
+        return None
+    elif name == "join":
+        return None
+    elif name == "settle":
+        if args[0]:
+            settle_motor(robot[DEVICES[args[0]]], args[1])
+        else:
+            settle_drive(cutie, args[1])
+        return None
+    elif name == "reset_heading":
+        robot["hub"].imu.reset_heading(args[0])
+        if "odometry" in robot:
+            odometry = robot["odometry"]
+            odometry.reset(odometry.x, odometry.y, args[0])
+        return None
+    elif name == "use_gyro":
+        cutie.use_gyro(args[0])
+        return None
+    else:
+        robot[name](*args, **kwargs)
+        return None
+
+    if background:
+        kwargs["wait"] = False
+    elif recording() and name != "run_until_stalled":
+        # a blocking move would leave a gap in the recording
+        kwargs["wait"] = False
+        getattr(device, name)(*args, **kwargs)
+        wait_done(device)
+        return device
+    getattr(device, name)(*args, **kwargs)
+    return device
+
+
+def _foreground(robot, index, row):
+    do_step(robot, index, row)
+    if "odometry" in robot:
+        robot["odometry"].update()
+    return
+    yield  # pylint: disable=unreachable
+
+
+def _background(robot, index, row):
+    if OPS[row[0]] == "wait":
+        yield from sleep(row[1][0])
+        return
+    yield from until_done(do_step(robot, index, row, background=True))
+
+
+def run_steps(table, robot):
+    """Run a compiled run table, overlapping background steps.
+
+    Args:
+        table (tuple): Rows from run_table.py.
+        robot (dict): Globals of the hub program, see `do_step`.
+    """
+    tasks = []
+    for index, row in enumerate(table):
+        if row[3] == BG:
+            tasks.append(Task(index, _background(robot, index, row), row[4], join=False))
+        else:
+            tasks.append(Task(index, _foreground(robot, index, row), row[4]))
+    odometry = robot.get("odometry")
+
+    def poll():
+        # keep the pose up to date while background drives run
+        if odometry:
+            odometry.poll()
+        tick()
+
+    run_tasks(tasks, tick=poll)
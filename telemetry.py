@@ -0,0 +1,157 @@
+from array import array
+
+from pybricks.tools import StopWatch
+from pybricks.tools import wait as _wait
+
+# Columns of a record, as written in the dump header: "/10" means the value
+# is stored in tenths, "~" that it wraps around at 16 bits and the decoder
+# (tools/telemetry.py) has to unwrap it.
+FIELDS = (
+    "time~",
+    "heading/10",
+    "pitch/10",
+    "roll/10",
+    "left_wheel~",
+    "right_wheel~",
+    "left_load",
+    "right_load",
+    "reflection",
+    "reflection2",
+)
+WIDTH = len(FIELDS)
+LINE = "TLM " + "{:04x}" * WIDTH
+
+# recorder that `wait` and `tick` keep sampling, set by Recorder.start
+_active = None
+
+
+def _wrap(value):
+    return ((value + 32768) & 0xFFFF) - 32768
+
+
+def _clip(value):
+    return -32768 if value < -32768 else 32767 if value > 32767 else value
+
+
+class Recorder:
+    """Samples the robot into a fixed ring buffer while it runs.
+
+    All storage is allocated up front, so recording does not grow the heap
+    during a run. Once the buffer is full the oldest samples are overwritten.
+    Samples are taken from `wait` and `tick`, so every helper loop and the
+    run table scheduler record without changes. Run table moves poll instead
+    of blocking while a recorder is running, see `recording`.
+
+    Args:
+        hub (PrimeHub): Hub to read heading and tilt from.
+        wheels (tuple): Left and right drive motors, for their angles.
+        motors (tuple): Left and right attachment motors, for their loads.
+        sensors (tuple): The two color sensors, for their reflections.
+        capacity (int): Number of samples kept.
+        period (int): Milliseconds between samples.
+    """
+
+    def __init__(self, hub, wheels, motors, sensors, capacity=1500, period=40):
+        self.hub = hub
+        self.wheels = wheels
+        self.motors = motors
+        self.sensors = sensors
+        self.capacity = capacity
+        self.period = period
+        self.buffer = array("h", (0 for _ in range(capacity * WIDTH)))
+        self.timer = StopWatch()
+        self.count = 0
+        self.due = 0
+
+    def start(self):
+        """Clear the buffer and record from now on, until `stop`."""
+        global _active  # pylint: disable=global-statement
+        self.timer.reset()
+        self.count = 0
+        self.due = 0
+        _active = self
+
+    def stop(self):
+        global _active  # pylint: disable=global-statement
+        if _active is self:
+            _active = None
+
+    def sample(self):
+        """Store one record, overwriting the oldest when full."""
+        buffer = self.buffer
+        i = (self.count % self.capacity) * WIDTH
+        pitch, roll = self.hub.imu.tilt()
+        buffer[i] = _wrap(self.timer.time())
+        buffer[i + 1] = _clip(int(self.hub.imu.heading() * 10))
+        buffer[i + 2] = _clip(int(pitch * 10))
+        buffer[i + 3] = _clip(int(roll * 10))
+        buffer[i + 4] = _wrap(self.wheels[0].angle())
+        buffer[i + 5] = _wrap(self.wheels[1].angle())
+        buffer[i + 6] = _clip(self.motors[0].load())
+        buffer[i + 7] = _clip(self.motors[1].load())
+        buffer[i + 8] = self.sensors[0].reflection()
+        buffer[i + 9] = self.sensors[1].reflection()
+        self.count += 1
+
+    def poll(self):
+        """Take a sample if one is due and return the time in ms."""
+        now = self.timer.time()
+        if now >= self.due:
+            self.sample()
+            self.due += self.period
+            # after a long blocking move, carry on from now
+            if self.due <= now:
+                self.due = now + self.period
+        return now
+
+    def wait(self, time):
+        """Wait `time` milliseconds, sampling whenever a sample is due."""
+        end = self.timer.time() + time
+        while True:
+            now = self.poll()
+            if now >= end:
+                return
+            _wait(min(end, self.due) - now)
+
+    def dump(self, label="run"):
+        """Stop recording and print the samples, oldest first, as hex lines.
+
+        Decode the printed output with `python -m tools.telemetry`.
+        """
+        self.stop()
+        kept = min(self.count, self.capacity)
+        print(
+            "TLM BEGIN {} period={} lost={} fields={}".format(
+                label, self.period, self.count - kept, ",".join(FIELDS)
+            )
+        )
+        buffer = self.buffer
+        for n in range(self.count - kept, self.count):
+            i = (n % self.capacity) * WIDTH
+            print(LINE.format(*[value & 0xFFFF for value in buffer[i : i + WIDTH]]))
+        print("TLM END {}".format(label))
+
+
+def recording():
+    """Return True while a started Recorder is sampling."""
+    return _active is not None
+
+
+def tick():
+    """Sample if a started Recorder is due, for loops that poll without `wait`."""
+    if _active is not None:
+        _active.poll()
+
+
+def wait(time):
+    """Same as pybricks.tools.wait, but keeps a started Recorder sampling."""
+    if _active is None:
+        _wait(time)
+    else:
+        _active.wait(time)
+
+
+def wait_done(device, period=5):
+    """Wait until `device` finished the move it was given with wait=False."""
+    while not device.done():
+        wait(period)
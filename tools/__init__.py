@@ -0,0 +1 @@
+"""Host-side tools that build, check and tune what runs on the hub."""
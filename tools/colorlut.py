@@ -0,0 +1,113 @@
+import argparse
+import math
+import os
+
+# hue, saturation and value bins of the table
+BINS = (24, 8, 16)
+
+HEADER = """\
+# Generated by tools/colorlut.py from {source}{options}, do not edit.
+# See colortable.py.
+"""
+
+
+def cone(h, s, v):
+    """Point of an HSV reading in the color cone, where distances compare
+    like on the hub: hue matters less the darker and grayer a color is."""
+    chroma = s * v / 100
+    return (chroma * math.cos(math.radians(h)), chroma * math.sin(math.radians(h)), v)
+
+
+def parse(lines):
+    """Collect the "HSV label h s v" lines printed by `colortable.record`.
+
+    Returns:
+        dict: {label: [(h, s, v), ...]} in order of appearance.
+    """
+    samples = {}
+    for line in lines:
+        fields = line.split()
+        if len(fields) == 5 and fields[0] == "HSV":
+            samples.setdefault(fields[1], []).append(tuple(int(value) for value in fields[2:]))
+    return samples
+
+
+def centers(count, span):
+    """Middle of each of `count` bins the hub makes of 0..span-1."""
+    return [(index + 0.5) * span / count for index in range(count)]
+
+
+def build(samples, bins=BINS, reach=30, margin=4):
+    """Class of every table cell: that of the nearest sample.
+
+    Args:
+        samples (dict): {label: [(h, s, v), ...]}, see `parse`.
+        bins (tuple): Hue, saturation and value bins.
+        reach (float): Cells farther than this from every sample are
+            unknown, in cone units (percent of value).
+        margin (float): Cells that are about as close to a second class
+            as to the nearest one are unknown too.
+    Returns:
+        tuple: (classes, table) with class 0 the unknown one.
+    """
+    labels = sorted(samples)
+    points = [[cone(*sample) for sample in samples[label]] for label in labels]
+    table = bytearray()
+    for h in centers(bins[0], 360):
+        for s in centers(bins[1], 101):
+            for v in centers(bins[2], 101):
+                cell = cone(h, s, v)
+                distances = sorted((min(math.dist(cell, point) for point in group), index + 1)
+                                   for index, group in enumerate(points))
+                nearest, best = distances[0]
+                if nearest > reach or len(distances) > 1 and distances[1][0] - nearest < margin:
+                    best = 0
+                table.append(best)
+    return (None,) + tuple(labels), bytes(table)
+
+
+def to_module(classes, table, bins, source, options=""):
+    text = HEADER.format(source=source, options=options)
+    text += f"\nCLASSES = {classes!r}\nBINS = {tuple(bins)!r}\n"
+    text += "TABLE = (\n"
+    for start in range(0, len(table), 32):
+        text += f"    {table[start:start + 32]!r}\n"
+    return text + ")\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m tools.colorlut",
+        description="Build the color lookup table of colortable.py from readings recorded on the hub.",
+    )
+    parser.add_argument("samples", help="hub output with HSV lines from colortable.record")
+    parser.add_argument("--out", required=True, help="module to write, e.g. floor_colors.py")
+    parser.add_argument("--bins", type=int, nargs=3, default=BINS, metavar=("H", "S", "V"))
+    parser.add_argument(
+        "--reach", type=float, default=30, help="largest distance to a sample that still counts, inf for any"
+    )
+    parser.add_argument("--margin", type=float, default=4, help="closer calls than this are unknown, 0 for none")
+    args = parser.parse_args()
+
+    with open(args.samples, encoding="utf-8", errors="replace") as log:
+        samples = parse(log)
+    if not samples:
+        raise SystemExit(f"no HSV lines in {args.samples}, record some with colortable.record")
+    classes, table = build(samples, args.bins, args.reach, args.margin)
+    # options that differ from the defaults, to rebuild the same table
+    options = ""
+    if tuple(args.bins) != BINS:
+        options += " --bins " + " ".join(str(count) for count in args.bins)
+    for name, default in (("reach", 30), ("margin", 4)):
+        if getattr(args, name) != default:
+            options += f" --{name} {getattr(args, name):g}"
+    for index, label in enumerate(classes):
+        cells = table.count(index)
+        print(f"{label or 'unknown'}: {len(samples.get(label, ()))} samples, {cells} cells")
+    with open(args.out, "w", encoding="utf-8") as out:
+        out.write(to_module(classes, table, args.bins, os.path.basename(args.samples), options))
+    print(f"{args.out}: {len(table)} bytes of table")
+
+
+if __name__ == "__main__":
+    main()
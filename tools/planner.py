@@ -0,0 +1,426 @@
+import argparse
+import heapq
+import json
+import math
+
+# FLL table mat, mm
+FIELD = (2362, 1143)
+
+# defaults for "limits" in the map file
+LIMITS = {
+    "speed": 500,  # mm/s
+    "acceleration": 750,  # mm/s²
+    "turn_rate": 300,  # deg/s
+    "turn_acceleration": 900,  # deg/s²
+    "lateral": 1500,  # mm/s², sideways acceleration allowed in curves
+}
+
+# curve radii tried when rounding off a corner, mm
+RADII = (40, 60, 80, 120, 160, 220, 300, 400)
+
+
+def profile_time(length, v_in, v_out, v_max, acceleration):
+    """Time of a trapezoidal move from speed `v_in` to `v_out`."""
+    if length <= 0:
+        return 0.0
+    peak = math.sqrt((2 * acceleration * length + v_in**2 + v_out**2) / 2)
+    if peak <= v_max:
+        return (2 * peak - v_in - v_out) / acceleration
+    ramps = (2 * v_max**2 - v_in**2 - v_out**2) / (2 * acceleration)
+    return (2 * v_max - v_in - v_out) / acceleration + (length - ramps) / v_max
+
+
+def _wrap(angle):
+    return (angle + 180) % 360 - 180
+
+
+def _heading(a, b):
+    return math.degrees(math.atan2(b[1] - a[1], b[0] - a[0]))
+
+
+def _fold(angle):
+    """Turn needed to face along `angle` either forward or backward."""
+    angle = _wrap(angle)
+    return angle if abs(angle) <= 90 else _wrap(angle + 180)
+
+
+class Map:
+    """Field with rectangular obstacles, grown by the robot radius.
+
+    Coordinates are mm with y toward the bottom of the map, so headings are
+    clockwise like the gyro's.
+
+    Args:
+        size (tuple): Width and height of the field, in mm.
+        obstacles (list): Rectangles (x0, y0, x1, y1) the robot must not touch.
+        radius (float): Distance from the robot's center to its farthest edge.
+        clearance (float): How far routes pass outside obstacle corners,
+            which leaves room to round those corners off with a curve.
+    """
+
+    def __init__(self, size=FIELD, obstacles=(), radius=100, clearance=30):
+        self.size = size
+        self.radius = radius
+        self.clearance = clearance
+        self.blocked = [
+            (min(x0, x1) - radius, min(y0, y1) - radius, max(x0, x1) + radius, max(y0, y1) + radius)
+            for x0, y0, x1, y1 in obstacles
+        ]
+
+    def inside(self, point):
+        x, y = point
+        return self.radius <= x <= self.size[0] - self.radius and self.radius <= y <= self.size[1] - self.radius
+
+    def free(self, a, b):
+        """Whether the robot can drive straight from `a` to `b`."""
+        if not (self.inside(a) and self.inside(b)):
+            return False
+        return not any(_crosses(a, b, box) for box in self.blocked)
+
+    def free_arc(self, points):
+        return all(self.free(p, q) for p, q in zip(points, points[1:]))
+
+    def corners(self):
+        """Points `clearance` outside every grown obstacle corner."""
+        points = []
+        c = self.clearance + 1
+        for x0, y0, x1, y1 in self.blocked:
+            for x, y in ((x0 - c, y0 - c), (x1 + c, y0 - c), (x1 + c, y1 + c), (x0 - c, y1 + c)):
+                if self.inside((x, y)):
+                    points.append((x, y))
+        return points
+
+
+def _crosses(a, b, box):
+    """Liang-Barsky: does segment a-b pass through the inside of box?"""
+    x0, y0, x1, y1 = box
+    dx, dy = b[0] - a[0], b[1] - a[1]
+    low, high = 0.0, 1.0
+    for p, q in ((-dx, a[0] - x0), (dx, x1 - a[0]), (-dy, a[1] - y0), (dy, y1 - a[1])):
+        if p == 0:
+            if q <= 0:
+                return False
+        else:
+            t = q / p
+            if p < 0:
+                low = max(low, t)
+            else:
+                high = min(high, t)
+    return high - low > 1e-9
+
+
+class Planner:
+    """Plans the fastest drive through waypoints on a Map.
+
+    Args:
+        field (Map): Where the robot may drive.
+        limits (dict): Drive limits, see LIMITS.
+    """
+
+    def __init__(self, field, limits=None):
+        self.field = field
+        self.limits = dict(LIMITS, **(limits or {}))
+
+    def turn_time(self, angle):
+        limits = self.limits
+        return profile_time(abs(angle), 0, 0, limits["turn_rate"], limits["turn_acceleration"])
+
+    def route(self, start, heading, goal):
+        """Fewest-seconds polyline from start to goal around the obstacles.
+
+        Searches the visibility graph of obstacle corners, charging for
+        the turn in place at every corner and a stop-to-stop straight. Legs
+        may be driven backward, so no turn is charged more than 90 degrees.
+        """
+        nodes = [start, goal] + self.field.corners()
+        limits = self.limits
+        # state is (node, previous node); start has no previous, its heading is given
+        queue = [(0.0, 0, -1, (0,))]
+        best = {}
+        while queue:
+            cost, node, previous, path = heapq.heappop(queue)
+            if node == 1:
+                return [nodes[i] for i in path]
+            if best.get((node, previous), math.inf) <= cost:
+                continue
+            best[(node, previous)] = cost
+            here = nodes[node]
+            facing = heading if previous < 0 else _heading(nodes[previous], here)
+            for following, there in enumerate(nodes):
+                if following == node or following in path or not self.field.free(here, there):
+                    continue
+                length = math.dist(here, there)
+                step = self.turn_time(_fold(_heading(here, there) - facing)) + profile_time(
+                    length, 0, 0, limits["speed"], limits["acceleration"]
+                )
+                heapq.heappush(queue, (cost + step, following, node, path + (following,)))
+        raise ValueError(f"no way from {start} to {goal} on the map")
+
+    def segments(self, points, heading, end_heading=None):
+        """Turn a polyline into turn, straight and curve segments.
+
+        Every corner is either turned in place or rounded off with the
+        fastest curve radius that fits and keeps clear of obstacles. A leg
+        is driven backward when that takes less turning to line up with.
+
+        Returns:
+            tuple: (segments as dicts, total seconds).
+        """
+        legs = [(a, b) for a, b in zip(points, points[1:]) if math.dist(a, b) >= 1]
+        plan = []
+        facing = heading
+        for a, b in legs:
+            angle = _fold(_heading(a, b) - facing)
+            if abs(angle) >= 0.5:
+                plan.append({"kind": "turn", "angle": angle})
+            facing = _wrap(facing + angle)
+            backward = abs(_wrap(_heading(a, b) - facing)) > 90
+            plan.append({"kind": "straight", "length": math.dist(a, b), "start": a, "end": b, "backward": backward})
+        if end_heading is not None:
+            angle = _wrap(end_heading - facing)
+            if plan and plan[-1]["kind"] == "turn":
+                # heading for the next leg already; make it one turn
+                angle = _wrap(plan.pop()["angle"] + angle)
+            if abs(angle) >= 0.5:
+                plan.append({"kind": "turn", "angle": angle})
+
+        # round corners off one at a time while it saves time
+        improved = True
+        while improved:
+            improved = False
+            for index in range(1, len(plan) - 1):
+                if plan[index]["kind"] != "turn":
+                    continue
+                before, after = plan[index - 1], plan[index + 1]
+                if before["kind"] != "straight" or after["kind"] != "straight":
+                    continue
+                if before["backward"] != after["backward"]:
+                    continue
+                best, best_time = None, self.time(plan)
+                for radius in RADII:
+                    candidate = self._fillet(plan, index, radius)
+                    if candidate and self.time(candidate) < best_time:
+                        best, best_time = candidate, self.time(candidate)
+                if best:
+                    plan = best
+                    improved = True
+                    break
+        return plan, self.time(plan)
+
+    def _fillet(self, plan, index, radius):
+        before, turn, after = plan[index - 1], plan[index], plan[index + 1]
+        angle = turn["angle"]
+        if abs(angle) >= 179:
+            return None
+        cut = radius * math.tan(math.radians(abs(angle)) / 2)
+        if cut > before["length"] - 1 or cut > after["length"] - 1:
+            return None
+        corner = before["end"]
+        into = math.radians(_heading(before["start"], before["end"]))
+        out = math.radians(_heading(after["start"], after["end"]))
+        entry = (corner[0] - cut * math.cos(into), corner[1] - cut * math.sin(into))
+        leave = (corner[0] + cut * math.cos(out), corner[1] + cut * math.sin(out))
+        # sample the arc to check it keeps clear
+        side = 1 if angle > 0 else -1
+        center = (entry[0] - side * radius * math.sin(into), entry[1] + side * radius * math.cos(into))
+        start = math.atan2(entry[1] - center[1], entry[0] - center[0])
+        points = [
+            (
+                center[0] + radius * math.cos(start + side * math.radians(abs(angle)) * i / 8),
+                center[1] + radius * math.sin(start + side * math.radians(abs(angle)) * i / 8),
+            )
+            for i in range(9)
+        ]
+        if not self.field.free_arc(points):
+            return None
+        shortened_before = dict(before, length=before["length"] - cut, end=entry)
+        shortened_after = dict(after, length=after["length"] - cut, start=leave)
+        curve = {"kind": "curve", "radius": radius, "angle": angle, "backward": before["backward"]}
+        return plan[: index - 1] + [shortened_before, curve, shortened_after] + plan[index + 2 :]
+
+    def curve_speed(self, radius):
+        limits = self.limits
+        return min(
+            limits["speed"],
+            math.radians(limits["turn_rate"]) * radius,
+            math.sqrt(limits["lateral"] * radius),
+        )
+
+    def speeds(self, plan):
+        """Top speed of every segment and the speeds they hand over at."""
+        tops = []
+        for segment in plan:
+            if segment["kind"] == "straight":
+                tops.append(self.limits["speed"])
+            elif segment["kind"] == "curve":
+                tops.append(self.curve_speed(segment["radius"]))
+            else:
+                tops.append(0.0)
+        # straights and curves flow into each other; turns in place and
+        # changes of direction stop
+        joints = [0.0]
+        for i in range(len(plan) - 1):
+            flowing = tops[i] and tops[i + 1] and plan[i]["backward"] == plan[i + 1]["backward"]
+            joints.append(min(tops[i], tops[i + 1]) if flowing else 0.0)
+        joints.append(0.0)
+        acceleration = self.limits["acceleration"]
+        lengths = [_length(segment) for segment in plan]
+        for i in range(1, len(joints)):
+            joints[i] = min(joints[i], math.sqrt(joints[i - 1] ** 2 + 2 * acceleration * lengths[i - 1]))
+        for i in range(len(joints) - 2, -1, -1):
+            joints[i] = min(joints[i], math.sqrt(joints[i + 1] ** 2 + 2 * acceleration * lengths[i]))
+        return tops, joints
+
+    def time(self, plan):
+        tops, joints = self.speeds(plan)
+        total = 0.0
+        for i, segment in enumerate(plan):
+            if segment["kind"] == "turn":
+                total += self.turn_time(segment["angle"])
+            else:
+                total += profile_time(_length(segment), joints[i], joints[i + 1], tops[i], self.limits["acceleration"])
+        return total
+
+    def plan(self, start, waypoints):
+        """Plan through every waypoint from `start` = (x, y, heading).
+
+        Waypoints are (x, y) to drive by, where the corner may be rounded
+        off, or (x, y, heading) to stop right there facing a heading, say
+        for a mission model.
+
+        Returns:
+            tuple: (segments, total seconds).
+        """
+        position, heading = tuple(start[:2]), start[2]
+        facing = heading
+        points = [position]
+        segments = []
+        for waypoint in waypoints:
+            goal = tuple(waypoint[:2])
+            end_heading = waypoint[2] if len(waypoint) > 2 else None
+            leg = self.route(position, facing, goal)
+            points += leg[1:]
+            position = goal
+            if end_heading is None:
+                # drive on without stopping; the turns get planned together
+                if math.dist(points[-2], goal) >= 1:
+                    facing = _heading(points[-2], goal)
+                continue
+            plan, _ = self.segments(points, heading, end_heading)
+            segments += plan
+            heading = facing = end_heading
+            points = [goal]
+        if len(points) > 1:
+            plan, _ = self.segments(points, heading)
+            segments += plan
+        return segments, self.time(segments)
+
+
+def _length(segment):
+    if segment["kind"] == "straight":
+        return segment["length"]
+    if segment["kind"] == "curve":
+        return math.radians(abs(segment["angle"])) * segment["radius"]
+    return 0.0
+
+
+def _drive_step(segment, share, speed, acceleration):
+    """(op, args, wanted settings) driving `share` of a straight or curve."""
+    if segment["kind"] == "straight":
+        length = -segment["length"] if segment["backward"] else segment["length"]
+        wanted = {"straight_speed": round(speed), "straight_acceleration": acceleration}
+        return "straight", (round(length * share),), wanted
+    # curve takes the direction of travel from the sign of the angle
+    # and the side it turns to from the sign of the radius
+    direction = -1 if segment["backward"] else 1
+    side = 1 if segment["angle"] > 0 else -1
+    args = (round(direction * side * segment["radius"]), round(direction * abs(segment["angle"]) * share, 1))
+    wanted = {
+        "straight_speed": round(speed),
+        "straight_acceleration": acceleration,
+        "turn_rate": round(math.degrees(speed / segment["radius"])),
+    }
+    return "curve", args, wanted
+
+
+def to_steps(planner, plan):
+    """Step data for missions.py: (op, args, settings, then).
+
+    Settings stay in force on the hub, so a step only carries the ones
+    that change. A move that hands over to a slower one at speed gets its
+    slowing down split off and driven at the hand-over speed, like the
+    time model has it.
+    """
+    tops, joints = planner.speeds(plan)
+    limits = planner.limits
+    acceleration = limits["acceleration"]
+    current = {}
+    steps = []
+    for i, segment in enumerate(plan):
+        then = "NONE" if joints[i + 1] else None
+        if segment["kind"] == "turn":
+            wanted = {"turn_rate": limits["turn_rate"], "turn_acceleration": limits["turn_acceleration"]}
+            moves = [("turn", (round(segment["angle"], 1),), wanted)]
+        else:
+            moves = [_drive_step(segment, 1, tops[i], acceleration)]
+            if then and joints[i + 1] < tops[i]:
+                length = _length(segment)
+                peak = min(tops[i], math.sqrt((2 * acceleration * length + joints[i] ** 2 + joints[i + 1] ** 2) / 2))
+                tail = min(length, (peak**2 - joints[i + 1] ** 2) / (2 * acceleration))
+                if length - tail < 1:
+                    moves = [_drive_step(segment, 1, joints[i + 1], acceleration)]
+                elif tail >= 1:
+                    moves = [
+                        _drive_step(segment, 1 - tail / length, tops[i], acceleration),
+                        _drive_step(segment, tail / length, joints[i + 1], acceleration),
+                    ]
+        for op, args, wanted in moves:
+            settings = {key: value for key, value in wanted.items() if current.get(key) != value}
+            current.update(settings)
+            step = (op, args, settings or None, then)
+            while step[-1] is None:
+                step = step[:-1]
+            steps.append(step)
+    return steps
+
+
+def to_code(steps):
+    """The same steps as direct drive base calls."""
+    lines = []
+    for op, args, *rest in steps:
+        settings, then = (rest + [None, None])[:2]
+        if settings:
+            lines.append("cutie.settings({})".format(", ".join(f"{key}={value}" for key, value in settings.items())))
+        arguments = ", ".join(str(value) for value in args)
+        if then:
+            arguments += f", then=Stop.{then}"
+        lines.append(f"cutie.{op}({arguments})")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m tools.planner",
+        description="Plan the fastest drive through mission waypoints and print it as run steps.",
+    )
+    parser.add_argument("map", help="JSON with start, waypoints and optional obstacles, radius, size, limits")
+    parser.add_argument("--code", action="store_true", help="print cutie calls instead of missions.py steps")
+    args = parser.parse_args()
+
+    with open(args.map, encoding="utf-8") as file:
+        spec = json.load(file)
+    field = Map(spec.get("size", FIELD), spec.get("obstacles", ()), spec.get("radius", 100), spec.get("clearance", 30))
+    planner = Planner(field, spec.get("limits"))
+    plan, seconds = planner.plan(spec["start"], spec["waypoints"])
+
+    steps = to_steps(planner, plan)
+    if args.code:
+        print(to_code(steps))
+    else:
+        for step in steps:
+            print(f"    {step!r},")
+    print(f"# {len(steps)} steps, about {seconds:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
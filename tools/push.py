@@ -0,0 +1,99 @@
+import argparse
+import os
+import sys
+
+from tools.stepc import compile_file
+
+ARGS = 1
+SETTINGS = 2
+
+
+class PushError(ValueError):
+    pass
+
+
+def load_table(path):
+    """Return the RUN* tables of a generated run table module."""
+    namespace = {}
+    with open(path, encoding="utf-8") as file:
+        exec(compile(file.read(), path, "exec"), namespace)  # pylint: disable=exec-used
+    return {name: value for name, value in namespace.items() if name.startswith("RUN")}
+
+
+def _values(row, field):
+    values = row[field]
+    if field == SETTINGS:
+        return tuple(values or (None, None, None, None))
+    return values
+
+
+def _sendable(value):
+    return value is None or (isinstance(value, (int, float)) and not isinstance(value, bool))
+
+
+def changes(uploaded, edited):
+    """Lines that turn the uploaded tables into the edited ones.
+
+    Only numbers in the positional arguments and settings of a row can be
+    pushed; anything else needs a new upload.
+
+    Args:
+        uploaded (dict): {run: rows} the hub was started with.
+        edited (dict): {run: rows} compiled from the edited missions.py.
+    Returns:
+        list: Lines for `tuning.Tuner`, "RUN2 12 1 0 580".
+    """
+    lines = []
+    for name, rows in sorted(edited.items()):
+        old_rows = uploaded.get(name)
+        if old_rows is None or len(old_rows) != len(rows):
+            raise PushError(f"{name} has a different number of rows, upload the program again")
+        for index, (old, new) in enumerate(zip(old_rows, rows)):
+            if (old[0], old[3], old[4]) != (new[0], new[3], new[4]):
+                raise PushError(f"{name} row {index} changed more than values, upload the program again")
+            for field in (ARGS, SETTINGS):
+                before, after = _values(old, field), _values(new, field)
+                if len(before) != len(after):
+                    raise PushError(f"{name} row {index} has a different number of arguments")
+                for position, (a, b) in enumerate(zip(before, after)):
+                    if a == b and type(a) is type(b):
+                        continue
+                    if not (_sendable(a) and _sendable(b)):
+                        raise PushError(f"{name} row {index}: only numbers can be pushed, not {b!r}")
+                    lines.append(f"{name} {index} {field} {position} {b!r}")
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m tools.push",
+        description="Send changed values of missions.py to the program running on the hub, without uploading.",
+    )
+    parser.add_argument("--source", default="missions.py")
+    parser.add_argument("--program", default="robot.py", help="hub program whose helpers the steps call")
+    parser.add_argument("--table", default="run_table.py", help="run table the hub program was uploaded with")
+    parser.add_argument("--dry-run", action="store_true", help="only print the lines")
+    args = parser.parse_args()
+
+    _, stats = compile_file(args.source, args.program)
+    edited = {name: rows for name, (_, rows) in stats.items()}
+    try:
+        lines = changes(load_table(args.table), edited)
+    except PushError as error:
+        raise SystemExit(str(error)) from error
+    for line in lines:
+        print(line)
+    if not lines:
+        print("nothing changed")
+        return
+    if args.dry_run:
+        return
+
+    sys.path.insert(0, os.getcwd())
+    import pybrickslaunch  # pylint: disable=import-outside-toplevel
+
+    print(pybrickslaunch.push(lines), end="")
+
+
+if __name__ == "__main__":
+    main()
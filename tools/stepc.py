@@ -0,0 +1,355 @@
+import argparse
+import ast
+import math
+import os
+import pprint
+
+from sim import install
+
+install()
+import steps  # noqa: E402  pylint: disable=wrong-import-position
+
+SETTINGS = ("straight_speed", "straight_acceleration", "turn_rate", "turn_acceleration")
+
+# argument counts of the ops that are not helpers in common.py
+ARITY = {
+    "straight": (1, 1),
+    "turn": (1, 1),
+    "curve": (2, 2),
+    "run_time": (3, 3),
+    "run_angle": (3, 3),
+    "run_until_stalled": (2, 3),
+    "wait": (1, 1),
+    "join": (0, 0),
+    "reset_heading": (1, 1),
+    "use_gyro": (1, 1),
+    "settle": (2, 2),
+    "home": (1, 2),
+    "move_to": (2, 4),
+    "push": (3, 3),
+}
+
+# ops that move the drive base, so pending settings must be applied first
+DRIVE_OPS = tuple(
+    op
+    for op in steps.OPS
+    if op not in ("wait", "join", "reset_heading", "use_gyro", "settle") + steps.MOTOR_OPS + steps.ATTACHMENT_OPS
+)
+
+# helpers that start by driving at the speed given as their first argument
+DRIVE_HELPERS = ("straight_time", "till_black", "till_blue", "going_down")
+
+HEADER = """\
+# Generated by tools/stepc.py from {source}, do not edit.
+# Rows are (op, args, settings, then, after), see steps.py.
+"""
+
+
+class StepError(ValueError):
+    pass
+
+
+def _travel(op, args):
+    """Direction a row starts driving in: 1, -1, or 0 when it turns in
+    place, does not drive, or drives by keyword arguments."""
+    if op not in ("straight", "curve") + DRIVE_HELPERS or not args or isinstance(args[-1], dict):
+        return 0
+    travel = args[1] if op == "curve" else args[0]
+    return (travel > 0) - (travel < 0)
+
+
+def _length(op, args):
+    """Millimeters a straight or curve row drives."""
+    if op == "curve":
+        return abs(args[0] * args[1]) * math.pi / 180
+    return abs(args[0])
+
+
+def _share(op, args, share):
+    """Args driving `share` of a straight or curve row."""
+    if op == "curve":
+        return (args[0], round(args[1] * share, 1))
+    return (round(args[0] * share),)
+
+
+def _deceleration(settings):
+    value = settings.get("straight_acceleration")
+    if isinstance(value, (tuple, list)):
+        return value[1]
+    return value
+
+
+def blend(rows, in_effect):
+    """Let straights and curves that keep driving the same way flow on.
+
+    A straight or curve that would stop at its end gets `Stop.NONE` when
+    the next row is a straight, curve or driving helper in the same
+    direction, so the robot carries its speed across. When the next row is
+    slower, the end of the move where the robot slows down to its speed is
+    split off into a row of its own at that speed, so the robot arrives
+    already slowed down. How long that tail is depends on the deceleration,
+    so hand-overs to slower rows are only made, and hand-written ones only
+    split, where the run set `straight_acceleration`.
+
+    Args:
+        rows (list): Rows as built by `compile_run`, changed in place.
+        in_effect (list): Drive base settings dict in effect for each row,
+            kept in step with `rows`.
+    Returns:
+        int: Number of rows changed or added.
+    """
+
+    def speed(index):
+        op = steps.OPS[rows[index][0]]
+        if op in DRIVE_HELPERS:
+            return abs(rows[index][1][0])
+        settings = in_effect[index]
+        top = settings.get("straight_speed")
+        if top is None or op == "straight":
+            return top
+        if settings.get("turn_rate") is None:
+            return None
+        return min(top, settings["turn_rate"] * abs(rows[index][1][0]) * math.pi / 180)
+
+    def hand_over(index):
+        """Speed the row ends at to flow into the next one, or None."""
+        row, following = rows[index], rows[index + 1]
+        direction = _travel(steps.OPS[row[0]], row[1])
+        if not direction or steps.OPS[row[0]] in DRIVE_HELPERS or following[3] == steps.BG:
+            return None
+        if row[3] not in (0, none) or _travel(steps.OPS[following[0]], following[1]) != direction:
+            return None
+        here, there = speed(index), speed(index + 1)
+        if here is None or there is None:
+            return None
+        if there < here and not _deceleration(in_effect[index]) and row[3] != none:
+            return None
+        return min(here, there)
+
+    changed = 0
+    none = steps.THEN.index("NONE")
+    joints = [None] * len(rows)
+    for index in range(len(rows) - 1):
+        joints[index] = hand_over(index)
+        if joints[index] is not None and rows[index][3] != none:
+            rows[index] = rows[index][:3] + (none,) + rows[index][4:]
+            changed += 1
+
+    # split off the slowing down ahead of slower rows
+    new_rows, new_in_effect, last_piece = [], [], []
+    restore = None
+    for index, row in enumerate(rows):
+        op, args, folded = steps.OPS[row[0]], row[1], row[2]
+        if restore is not None:
+            # the tail before changed the speed this row was compiled with
+            folded = list(folded or (None,) * len(SETTINGS))
+            if folded[0] is None:
+                folded[0] = restore
+            folded = tuple(folded)
+            restore = None
+        pieces = [(args, folded, in_effect[index])]
+        exit_speed, deceleration = joints[index], _deceleration(in_effect[index])
+        top = speed(index)
+        if exit_speed is not None and deceleration and exit_speed < top:
+            length = _length(op, args)
+            entry = joints[index - 1] if index and joints[index - 1] is not None else 0
+            peak = min(top, math.sqrt((2 * deceleration * length + entry**2 + exit_speed**2) / 2))
+            tail = min(length, (peak**2 - exit_speed**2) / (2 * deceleration))
+            if tail >= 1:
+                slow = dict(in_effect[index], straight_speed=round(exit_speed))
+                if length - tail < 1:
+                    folded = list(folded or (None,) * len(SETTINGS))
+                    folded[0] = round(exit_speed)
+                    pieces = [(args, tuple(folded), slow)]
+                else:
+                    head = _share(op, args, 1 - tail / length)
+                    if op == "straight":
+                        rest = (args[0] - head[0],)
+                    else:
+                        rest = (args[0], round(args[1] - head[1], 1))
+                    settings = (round(exit_speed),) + (None,) * (len(SETTINGS) - 1)
+                    pieces = [(head, folded, in_effect[index]), (rest, settings, slow)]
+                restore = in_effect[index + 1].get("straight_speed")
+                if restore == round(exit_speed):
+                    restore = None
+                changed += 1
+        # "after" names earlier rows, which now end with their last piece
+        after = tuple(last_piece[name] for name in row[4])
+        for args, folded, settings in pieces:
+            new_rows.append((row[0], args, folded, row[3], after))
+            new_in_effect.append(settings)
+            after = (len(new_rows) - 1,)
+        last_piece.append(len(new_rows) - 1)
+
+    rows[:] = new_rows
+    in_effect[:] = new_in_effect
+    return changed
+
+
+def helper_signatures(path):
+    """Return {name: (parameters, required count)} for functions in a hub program.
+
+    Functions of local modules the program imports everything from, like
+    common.py, count as the program's own.
+    """
+    with open(path, encoding="utf-8") as source:
+        module = ast.parse(source.read(), path)
+    signatures = {}
+    for node in module.body:
+        if isinstance(node, ast.ImportFrom) and node.module and [alias.name for alias in node.names] == ["*"]:
+            imported = os.path.join(os.path.dirname(path), node.module.replace(".", os.sep) + ".py")
+            if os.path.exists(imported):
+                signatures.update(helper_signatures(imported))
+        elif isinstance(node, ast.FunctionDef):
+            params = [arg.arg for arg in node.args.args]
+            signatures[node.name] = (params, len(params) - len(node.args.defaults))
+    return signatures
+
+
+def _check_args(where, op, args, kwargs, then, signatures):
+    if op in ARITY:
+        low, high = ARITY[op]
+        if kwargs or not low <= len(args) <= high:
+            raise StepError(f"{where}: {op} takes {low}..{high} positional arguments")
+        if op in steps.MOTOR_OPS and args[0] not in steps.MOTORS:
+            raise StepError(f"{where}: unknown motor {args[0]!r}, expected one of {steps.MOTORS}")
+        if op in steps.ATTACHMENT_OPS and args[0] not in steps.ATTACHMENTS:
+            raise StepError(f"{where}: unknown attachment {args[0]!r}, expected one of {steps.ATTACHMENTS}")
+        if op == "settle" and args[0] not in steps.DEVICES:
+            raise StepError(f"{where}: cannot settle {args[0]!r}, expected one of {steps.DEVICES}")
+        return
+    if op not in signatures:
+        raise StepError(f"{where}: {op} is not defined in the hub program")
+    params, required = signatures[op]
+    given = params[: len(args)] + list(kwargs) + (["then"] if then else [])
+    unknown = [name for name in given if name not in params]
+    if len(args) > len(params) or unknown or len(set(given)) != len(given):
+        raise StepError(f"{where}: bad arguments for {op}{tuple(params)}")
+    if any(name not in given for name in params[:required]):
+        raise StepError(f"{where}: {op} needs {params[:required]}")
+
+
+def compile_run(name, source_steps, signatures, blending=True):
+    """Validate one run and turn it into table rows.
+
+    `settings` steps and settings entries that repeat the value already in
+    effect are folded into the next step that moves the drive base. With
+    `blending`, moves that can flow into the next one do, see `blend`.
+
+    Returns:
+        list: rows as (op, args, settings, then, after).
+    """
+    rows = []
+    in_effect = []
+    current = {}
+    pending = {}
+    last = None
+    background = []
+    for number, step in enumerate(source_steps):
+        where = f"{name} step {number}"
+        if not 2 <= len(step) <= 4:
+            raise StepError(f"{where}: expected (op, args, settings, then)")
+        op, args, settings, then = (tuple(step) + (None, None))[:4]
+        settings = settings or {}
+        unknown = set(settings) - set(SETTINGS)
+        if unknown:
+            raise StepError(f"{where}: unknown settings {sorted(unknown)}")
+        pending.update(settings)
+
+        if op == "settings":
+            if args or then:
+                raise StepError(f"{where}: settings takes keywords only")
+            continue
+        if op not in steps.OPS:
+            raise StepError(f"{where}: unknown op {op!r}")
+        if then not in steps.THEN:
+            raise StepError(f"{where}: unknown then-mode {then!r}")
+        if then == "BG" and op not in steps.BG_OPS:
+            raise StepError(f"{where}: {op} cannot run in the background")
+        if then and then != "BG" and op not in steps.THEN_OPS:
+            raise StepError(f"{where}: {op} takes no then-mode")
+
+        args = tuple(args)
+        kwargs = args[-1] if args and isinstance(args[-1], dict) else {}
+        positional = args[:-1] if kwargs else args
+        _check_args(where, op, positional, kwargs, then, signatures)
+        if op in steps.MOTOR_OPS:
+            args = (steps.MOTORS.index(args[0]),) + args[1:]
+        elif op in steps.ATTACHMENT_OPS:
+            args = (steps.ATTACHMENTS.index(args[0]),) + args[1:]
+        elif op == "settle":
+            args = (steps.DEVICES.index(args[0]),) + args[1:]
+
+        folded = None
+        if op in DRIVE_OPS and then != "BG":
+            changes = {key: value for key, value in pending.items() if current.get(key) != value}
+            if changes:
+                folded = tuple(changes.get(key) for key in SETTINGS)
+                current.update(changes)
+            pending = {}
+
+        index = len(rows)
+        after = () if last is None else (last,)
+        if then == "BG":
+            background.append(index)
+        else:
+            if op == "join":
+                after += tuple(background)
+                background = []
+            last = index
+        rows.append((steps.OPS.index(op), args, folded, steps.THEN.index(then), after))
+        in_effect.append(dict(current))
+    if blending:
+        blend(rows, in_effect)
+    return rows
+
+
+def compile_file(source, program, blending=True):
+    """Compile every RUN* list in `source` against the helpers in `program`.
+
+    Returns:
+        tuple: (text of the generated module, {run: (source steps, rows)}).
+    """
+    namespace = {}
+    with open(source, encoding="utf-8") as file:
+        exec(compile(file.read(), source, "exec"), namespace)  # pylint: disable=exec-used
+    signatures = helper_signatures(program)
+
+    text = HEADER.format(source=os.path.basename(source))
+    stats = {}
+    for name in sorted(key for key in namespace if key.startswith("RUN") and isinstance(namespace[key], list)):
+        rows = compile_run(name, namespace[name], signatures, blending)
+        stats[name] = (len(namespace[name]), rows)
+        text += f"\n{name} = {pprint.pformat(tuple(rows), width=100, compact=True)}\n"
+    return text, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m tools.stepc",
+        description="Compile missions.py into the run table the hub executes.",
+    )
+    parser.add_argument("--source", default="missions.py")
+    parser.add_argument("--program", default="robot.py", help="hub program whose helpers the steps call")
+    parser.add_argument("--out", default="run_table.py")
+    parser.add_argument("--check", action="store_true", help="fail if --out is not up to date")
+    parser.add_argument("--no-blend", action="store_true", help="keep every move stopping as written")
+    args = parser.parse_args()
+
+    text, stats = compile_file(args.source, args.program, not args.no_blend)
+    for name, (count, rows) in stats.items():
+        settings = sum(1 for row in rows if row[2])
+        print(f"{name}: {count} steps -> {len(rows)} rows, {settings} settings calls")
+    print(f"{args.out}: {len(text.encode())} bytes")
+
+    if args.check:
+        with open(args.out, encoding="utf-8") as current:
+            if current.read() != text:
+                raise SystemExit(f"{args.out} is out of date, run python -m tools.stepc")
+        return
+    with open(args.out, "w", encoding="utf-8") as out:
+        out.write(text)
+
+
+if __name__ == "__main__":
+    main()
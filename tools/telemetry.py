@@ -0,0 +1,96 @@
+import argparse
+import os
+import sys
+
+import numpy as np
+
+
+def parse(lines):
+    """Find the telemetry dumps in captured hub output.
+
+    Other output between the dump lines, such as prints from the run, is
+    skipped.
+
+    Returns:
+        list: (label, header dict, record hex strings) per dump.
+    """
+    dumps = []
+    current = None
+    for line in lines:
+        line = line.strip()
+        if not line.startswith("TLM "):
+            continue
+        words = line.split()
+        if words[1] == "BEGIN":
+            header = dict(word.split("=", 1) for word in words[3:])
+            current = (words[2], header, [])
+        elif words[1] == "END":
+            if current:
+                dumps.append(current)
+            current = None
+        elif current:
+            current[2].append(words[1])
+    return dumps
+
+
+def decode(header, records):
+    """Turn the hex records of one dump into named float arrays.
+
+    Wrapped 16-bit columns are unwrapped and scaled columns divided back,
+    following the field list in the dump header (see telemetry.py).
+
+    Returns:
+        dict: {field name: numpy array}, in column order.
+    """
+    fields = header["fields"].split(",")
+    raw = np.frombuffer(bytes.fromhex("".join(records)), dtype=">i2").reshape(-1, len(fields))
+    columns = {}
+    for i, field in enumerate(fields):
+        values = raw[:, i].astype(np.int64)
+        name, _, scale = field.partition("/")
+        if name.endswith("~"):
+            name = name[:-1]
+            steps = (np.diff(values) + 32768) % 65536 - 32768
+            values = values[0] + np.concatenate(([0], np.cumsum(steps)))
+        columns[name] = values / float(scale) if scale else values.astype(float)
+    return columns
+
+
+def write_csv(path, columns):
+    np.savetxt(path, np.column_stack(list(columns.values())), fmt="%g", delimiter=",", header=",".join(columns), comments="")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m tools.telemetry",
+        description="Decode telemetry dumped by the hub (telemetry.py) into CSV or NumPy files.",
+    )
+    parser.add_argument("log", nargs="?", default="-", help="captured hub output (default stdin)")
+    parser.add_argument("--out", default=".", help="folder for <label>.csv files")
+    parser.add_argument("--npz", action="store_true", help="write <label>.npz instead of CSV")
+    args = parser.parse_args()
+
+    if args.log == "-":
+        dumps = parse(sys.stdin)
+    else:
+        with open(args.log, encoding="utf-8", errors="replace") as log:
+            dumps = parse(log)
+    if not dumps:
+        raise SystemExit("no telemetry found, set TELEMETRY = True in robot.py")
+
+    os.makedirs(args.out, exist_ok=True)
+    for label, header, records in dumps:
+        columns = decode(header, records)
+        path = os.path.join(args.out, label + (".npz" if args.npz else ".csv"))
+        if args.npz:
+            np.savez(path, **columns)
+        else:
+            write_csv(path, columns)
+        time = columns["time"]
+        lost = int(header.get("lost", 0))
+        note = f", {lost} older samples lost" if lost else ""
+        print(f"{label}: {len(time)} samples over {(time[-1] - time[0]) / 1000:.1f} s{note} -> {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+import argparse
+import csv
+import itertools
+
+import numpy as np
+
+# control period of gyro_turn and gyro_abs, ms
+PERIOD = 10
+
+
+class TurnModel:
+    """Turning dynamics of the robot on the table.
+
+    A commanded turn rate reaches the wheels `latency` ms later, loses
+    `deadzone` deg/s to friction and is followed with a first-order lag of
+    time constant `tau` ms. Every attribute may be an array, which
+    simulates one robot per element.
+    """
+
+    def __init__(self, deadzone, tau, latency):
+        self.deadzone = deadzone
+        self.tau = tau
+        self.latency = latency
+
+    def effective(self, command):
+        return np.sign(command) * np.maximum(np.abs(command) - self.deadzone, 0)
+
+    def replay(self, commands, dt=PERIOD):
+        """Heading change for a logged command sequence, one row per model."""
+        steps = len(commands)
+        delay = np.round(np.asarray(self.latency) / dt).astype(int)
+        rate = np.zeros(np.broadcast(self.deadzone, self.tau, self.latency).shape)
+        heading = np.zeros((steps,) + rate.shape)
+        alpha = np.minimum(dt / np.asarray(self.tau, dtype=float), 1)
+        for step in range(1, steps):
+            command = commands[np.maximum(step - 1 - delay, 0)]
+            rate = rate + alpha * (self.effective(command) - rate)
+            heading[step] = heading[step - 1] + rate * dt / 1000
+        return heading
+
+    def __repr__(self):
+        return f"TurnModel(deadzone={self.deadzone:.1f}, tau={self.tau:.0f}, latency={self.latency:.0f})"
+
+
+def load_trace(path):
+    """Read a logged turn: CSV rows of time_ms, heading, command."""
+    with open(path, encoding="utf-8") as file:
+        rows = [row for row in csv.reader(file) if row and not row[0].startswith("#")]
+    if rows and not rows[0][0].replace(".", "").lstrip("-").isdigit():
+        rows = rows[1:]
+    data = np.array(rows, dtype=float)
+    return data[:, 0], data[:, 1], data[:, 2]
+
+
+def fit(traces, deadzones, taus, latencies):
+    """Grid-fit a TurnModel to logged traces, all candidates at once.
+
+    Args:
+        traces (list): (time_ms, heading, command) arrays per logged turn.
+    Returns:
+        tuple: (best TurnModel, its RMS heading error in degrees).
+    """
+    grid = np.array(list(itertools.product(deadzones, taus, latencies)), dtype=float)
+    model = TurnModel(grid[:, 0], grid[:, 1], grid[:, 2])
+    error = np.zeros(len(grid))
+    samples = 0
+    for time, heading, command in traces:
+        # resample onto the control period so replay steps line up
+        steps = np.arange(time[0], time[-1] + 1, PERIOD)
+        measured = np.interp(steps, time, heading) - heading[0]
+        commands = np.interp(steps, time, command)
+        predicted = model.replay(commands)
+        error += ((predicted - measured[:, None]) ** 2).sum(axis=0)
+        samples += len(steps)
+    best = int(np.argmin(error))
+    return TurnModel(*grid[best]), float(np.sqrt(error[best] / samples))
+
+
+def simulate_gyro_turn(model, target, kp, kd, ke, angle_tol, speed_tol, max_rate=150, max_time=2670, settle=200):
+    """Run the gyro_turn loop from common.py on many gain sets at once.
+
+    Returns:
+        dict: arrays of settle time (ms, including the final settle wait),
+        overshoot (deg) and heading error after settling (deg).
+    """
+    n = np.broadcast(kp, kd, ke, angle_tol, speed_tol).shape
+    heading = np.zeros(n)
+    rate = np.zeros(n)
+    last_error = np.zeros(n)
+    running = np.ones(n, dtype=bool)
+    finished = np.full(n, float(max_time))
+    delay = int(round(model.latency / PERIOD))
+    queue = [np.zeros(n)] * (delay + 1)
+    alpha = min(PERIOD / model.tau, 1)
+    overshoot = np.zeros(n)
+    direction = np.sign(target) or 1
+
+    for step in range(int((max_time + settle) / PERIOD)):
+        now = step * PERIOD
+        error = ((target - heading + 180) % 360) - 180
+        # the first pass in common.py sees dt == 0 and divides by 1 ms instead
+        d_error = (error - last_error) / (0.001 if step == 0 else PERIOD / 1000)
+        turn_rate = kp * error + kd * d_error
+        turn_rate = turn_rate + np.where(turn_rate > 0, ke, -ke)
+        turn_rate = np.clip(turn_rate, -max_rate, max_rate)
+        done = running & (np.abs(error) < angle_tol) & (np.abs(turn_rate) < speed_tol)
+        finished = np.where(done, now, finished)
+        running &= ~done & (now < max_time)
+        last_error = error
+        # stopped robots coast, which the lag model treats as a zero command
+        queue.append(np.where(running, turn_rate, 0.0))
+        command = queue.pop(0)
+        rate = rate + alpha * (model.effective(command) - rate)
+        heading = heading + rate * PERIOD / 1000
+        overshoot = np.maximum(overshoot, (heading - target) * direction)
+
+    return {
+        "time": finished + settle,
+        "overshoot": overshoot,
+        "error": np.abs(((target - heading + 180) % 360) - 180),
+    }
+
+
+def simulate_gyro_abs(model, target, kp, ke, tolerance=0.3, max_time=4000, settle=200):
+    """Run the gyro_abs loop from common.py on many gain sets at once.
+
+    gyro_abs has no time limit on the hub; `max_time` only bounds the
+    simulation of gain sets that never settle.
+    """
+    zeros = np.zeros(np.broadcast(kp, ke).shape)
+    return simulate_gyro_turn(
+        model, target, kp, zeros, ke, tolerance, np.inf, max_rate=np.inf, max_time=max_time, settle=settle
+    )
+
+
+def sweep(model, targets, grid, controller="gyro_turn", tolerance=0.5):
+    """Score every gain set on every target turn.
+
+    Gain sets that miss the target by more than `tolerance` degrees or run
+    into the time limit are ranked last.
+
+    Returns:
+        list: (score, mean ms, worst overshoot, worst error, gains) best first.
+    """
+    names = list(grid)
+    combos = np.array(list(itertools.product(*grid.values())), dtype=float)
+    gains = {name: combos[:, i] for i, name in enumerate(names)}
+    simulate = simulate_gyro_turn if controller == "gyro_turn" else simulate_gyro_abs
+
+    time = np.zeros(len(combos))
+    overshoot = np.zeros(len(combos))
+    error = np.zeros(len(combos))
+    for target in targets:
+        result = simulate(model, target, **gains)
+        time += result["time"] / len(targets)
+        overshoot = np.maximum(overshoot, result["overshoot"])
+        error = np.maximum(error, result["error"])
+
+    # a degree of overshoot costs about as much as the time to take it back
+    score = time + 100 * np.maximum(overshoot, 0) + np.where(error > tolerance, 1e6, 0)
+    order = np.argsort(score)
+    return [
+        (score[i], time[i], overshoot[i], error[i], {name: combos[i, j] for j, name in enumerate(names)})
+        for i in order
+    ]
+
+
+def _floats(text):
+    return [float(value) for value in text.split(",")]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m tools.tune_turn",
+        description="Fit a turning model to logged heading traces and rank gyro_turn gains in simulation.",
+    )
+    parser.add_argument("traces", nargs="*", help="CSV logs of time_ms, heading, command")
+    parser.add_argument("--model", type=_floats, help="skip fitting: deadzone,tau,latency")
+    parser.add_argument("--controller", choices=("gyro_turn", "gyro_abs"), default="gyro_turn")
+    parser.add_argument("--targets", type=_floats, default=[45, 90, 180, -90])
+    parser.add_argument("--kp", type=_floats, default=list(np.arange(0.8, 4.01, 0.2)))
+    parser.add_argument("--kd", type=_floats, default=list(np.arange(0, 1.21, 0.1)))
+    parser.add_argument("--ke", type=_floats, default=list(range(0, 31, 2)))
+    parser.add_argument("--angle-tol", type=_floats, default=[0.3, 0.5, 1.0])
+    parser.add_argument("--speed-tol", type=_floats, default=[20, 30, 45])
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    if args.model:
+        model = TurnModel(*args.model)
+    elif args.traces:
+        traces = [load_trace(path) for path in args.traces]
+        model, rms = fit(traces, np.arange(0, 41, 2), np.arange(20, 301, 10), np.arange(0, 101, 10))
+        print(f"fitted {model}, RMS heading error {rms:.2f} deg")
+    else:
+        parser.error("give heading traces to fit or --model")
+
+    if args.controller == "gyro_turn":
+        grid = {"kp": args.kp, "kd": args.kd, "ke": args.ke, "angle_tol": args.angle_tol, "speed_tol": args.speed_tol}
+        current = {"kp": [2.1], "kd": [0.6], "ke": [16], "angle_tol": [0.3], "speed_tol": [30]}
+    else:
+        grid = {"kp": args.kp, "ke": args.ke}
+        current = {"kp": [1.5], "ke": [20]}
+
+    ranked = sweep(model, args.targets, grid, args.controller)
+    print(f"{len(ranked)} gain sets on turns of {args.targets} deg")
+    _, time, overshoot, error, _ = sweep(model, args.targets, current, args.controller)[0]
+    print(f"current defaults: {time:6.0f} ms  overshoot {overshoot:5.2f}  error {error:4.2f}")
+    for _, time, overshoot, error, gains in ranked[: args.top]:
+        text = ", ".join(f"{name}={value:g}" for name, value in gains.items())
+        print(f"{time:6.0f} ms  overshoot {overshoot:5.2f}  error {error:4.2f}  {args.controller}(target, {text})")
+
+
+if __name__ == "__main__":
+    main()
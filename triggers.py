@@ -0,0 +1,108 @@
+from pybricks.tools import StopWatch
+
+import looptime
+from telemetry import wait
+
+
+class _Sensor:
+    def __init__(self, read, every):
+        self.read = read
+        self.every = every
+        self.due = 0
+        self.value = None
+        self.fresh = False
+
+
+class _Trigger:
+    def __init__(self, sensor, test, action, stop):
+        self.sensor = sensor
+        self.test = test
+        self.action = action
+        self.stop = stop
+
+
+class Triggers:
+    """One polling loop for sensor conditions, instead of a loop per helper.
+
+    Each registered sensor is read once per tick when its poll period is
+    due, and every trigger on it is checked against that one reading. A
+    trigger's action runs right when its test passes, so the time from
+    detection to e.g. `cutie.stop()` is the same everywhere.
+
+    Example:
+        triggers = Triggers()
+        triggers.sensor("reflection", sensor2.reflection)
+        triggers.when("reflection", lambda value: value < 7, cutie.stop)
+        triggers.run()
+
+    Args:
+        period (int): Milliseconds per tick of the loop.
+        name (str): Name of the loop in `looptime` reports.
+    """
+
+    def __init__(self, period=10, name="triggers"):
+        self.period = period
+        self.name = name
+        self.sensors = {}
+        self.triggers = []
+
+    def sensor(self, name, read, every=None):
+        """Register a reading under `name`.
+
+        Args:
+            name (str): Name triggers refer to.
+            read (callable): Returns the reading, e.g. `sensor2.reflection`.
+            every (int): Milliseconds between reads (default one tick).
+        """
+        self.sensors[name] = _Sensor(read, every or self.period)
+
+    def when(self, name, test, action=None, stop=True):
+        """Run `action` once `test(reading)` of sensor `name` is true.
+
+        Args:
+            name (str): Registered sensor to test.
+            test (callable): Gets the reading, returns True to fire.
+            action (callable): Called without arguments when fired.
+            stop (bool): End `run` when fired; otherwise the trigger stays
+                armed and fires on every matching reading.
+        """
+        if name not in self.sensors:
+            raise ValueError("unknown sensor {}".format(name))
+        self.triggers.append(_Trigger(self.sensors[name], test, action, stop))
+
+    def run(self, timeout=None):
+        """Poll until a stopping trigger fires.
+
+        Args:
+            timeout (int): Give up after this many milliseconds.
+        Returns:
+            The reading that fired the stopping trigger, or None on timeout.
+        """
+        timer = StopWatch()
+        sensors = list(self.sensors.values())
+        probe = looptime.probe(self.name)
+        while True:
+            now = timer.time()
+            if probe:
+                probe.tick()
+            for sensor in sensors:
+                sensor.fresh = now >= sensor.due
+                if sensor.fresh:
+                    if probe:
+                        probe.read()
+                    sensor.value = sensor.read()
+                    if probe:
+                        probe.done()
+                    sensor.due = now + sensor.every
+
+            for trigger in self.triggers:
+                sensor = trigger.sensor
+                if sensor.fresh and trigger.test(sensor.value):
+                    if trigger.action:
+                        trigger.action()
+                    if trigger.stop:
+                        return sensor.value
+
+            if timeout is not None and now >= timeout:
+                return None
+            wait(self.period)
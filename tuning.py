@@ -0,0 +1,69 @@
+from pybricks.tools import read_input_byte
+
+# fields of a run table row that can be patched
+ARGS = 1
+SETTINGS = 2
+
+
+def _number(text):
+    if text == "None":
+        return None
+    if "." in text or "e" in text:
+        return float(text)
+    return int(text)
+
+
+class Tuner:
+    """Patches run table values sent to the hub's stdin, between uploads.
+
+    Each line sets one value: "RUN2 12 1 0 580" puts 580 in table RUN2,
+    row 12, field 1 (args, or 2 for settings), position 0. The host side
+    is `python -m tools.push`. Tables are replaced in `module`, so look
+    them up there when a run starts rather than importing them by name.
+
+    Args:
+        module: Module holding the run tables, e.g. `run_table`.
+    """
+
+    def __init__(self, module):
+        self.module = module
+        self.line = []
+
+    def poll(self):
+        """Apply every complete line that arrived, without waiting for more.
+
+        Returns:
+            int: Number of values patched.
+        """
+        patched = 0
+        while True:
+            byte = read_input_byte()
+            if byte is None:
+                return patched
+            if byte != 10:
+                self.line.append(chr(byte))
+                continue
+            line = "".join(self.line).strip()
+            self.line = []
+            if line:
+                patched += self.apply(line)
+
+    def apply(self, line):
+        """Apply one line, printing whether it worked; returns 1 or 0."""
+        try:
+            name, row, field, position, value = line.split()
+            row, field, position = int(row), int(field), int(position)
+            if field not in (ARGS, SETTINGS):
+                raise ValueError("field")
+            rows = list(getattr(self.module, name))
+            entry = list(rows[row])
+            values = list(entry[field] or (None, None, None, None))
+            values[position] = _number(value)
+            entry[field] = tuple(values)
+            rows[row] = tuple(entry)
+            setattr(self.module, name, tuple(rows))
+        except (AttributeError, IndexError, ValueError):
+            print("TUNE ERROR", line)
+            return 0
+        print("TUNE", line)
+        return 1
@@ -0,0 +1,46 @@
+from pybricks.tools import StopWatch
+
+from common import *  # noqa: F403  pylint: disable=wildcard-import,unused-wildcard-import
+
+try:
+    from gc import collect, disable, enable, mem_alloc
+except ImportError:  # the simulator runs on CPython, which has no heap counter
+    mem_alloc = None
+
+# Times gyro_turn and gyro_abs with the float and the fixed-point loops on
+# the hub. Put the robot on the table, launch this file and read the lines
+# it prints: settle time, loop period and bytes allocated per turn.
+
+TURNS = (90, -90, 45, 180)
+# (label, fixed, period)
+MODES = (("float", False, 10), ("fixed", True, 10), ("fixed", True, 5), ("fixed", True, 2))
+
+
+def measure(helper, target, fixed, period):
+    """Turn once and return (settle ms, loop ms per iteration, bytes, error)."""
+    hub.imu.reset_heading(0)
+    wait(300)
+    if mem_alloc:
+        collect()
+        disable()
+        before = mem_alloc()
+    timer = StopWatch()
+    loops, loop_time = helper(target, fixed=fixed, period=period)
+    elapsed = timer.time()
+    allocated = 0
+    if mem_alloc:
+        allocated = mem_alloc() - before
+        enable()
+    error = (target - hub.imu.heading() + 180) % 360 - 180
+    return elapsed, loop_time / loops, allocated, error
+
+
+for name, helper in (("gyro_turn", gyro_turn), ("gyro_abs", gyro_abs)):
+    for label, fixed, period in MODES:
+        for target in TURNS:
+            elapsed, loop_ms, allocated, error = measure(helper, target, fixed, period)
+            print(
+                "TURNBENCH {} {} {} {}: settle {} ms, loop {:.2f} ms, {} bytes, error {:.2f}".format(
+                    name, label, period, target, elapsed, loop_ms, allocated, error
+                )
+            )